@@ -1,22 +1,123 @@
 import heapq
+from array import array
 from grafo import Grafo
 from dados import calcular_distancia_manhattan, HEURISTICA_PARA_CASCAVEL
+import instrumentacao
+
+# Tipos de evento do RegistroBusca
+INSERIR = 0  # Vértice inserido na fila com prioridade f
+EXPANDIR = 1  # Vértice retirado da fila e expandido
+DESCARTAR = 2  # Entrada obsoleta retirada da fila (vértice já expandido)
+RELAXAR = 3  # Aresta origem → vértice melhorou g do vértice
+
+
+class RegistroBusca:
+    """
+    Eventos de uma busca A*, em arrays (módulo array) pré-alocados.
+    
+    O evento i é (tipos[i], indices[i], origens[i], valores[i]): os vértices
+    são índices em self.vertices, origens[i] é o vértice expandido nos
+    eventos RELAXAR (-1 nos outros) e valores[i] é f em INSERIR, EXPANDIR e
+    DESCARTAR e o novo g em RELAXAR. São 25 bytes por evento, sem um
+    objeto Python por evento; a capacidade dobra quando acaba.
+    """
+    
+    CAPACIDADE_INICIAL = 1 << 16
+    
+    def __init__(self, vertices: list, capacidade: int = CAPACIDADE_INICIAL):
+        self.vertices = vertices
+        self.indice = {v: i for i, v in enumerate(vertices)}
+        self.tipos = array('b', bytes(capacidade))
+        self.indices = array('q', bytes(8 * capacidade))
+        self.origens = array('q', bytes(8 * capacidade))
+        self.valores = array('d', bytes(8 * capacidade))
+        self.total = 0
+    
+    def __len__(self):
+        return self.total
+    
+    def anotar(self, tipo, vertice, valor):
+        i = self.total
+        if i == len(self.tipos):
+            self.crescer()
+        self.tipos[i] = tipo
+        self.indices[i] = self.indice[vertice]
+        self.origens[i] = -1
+        self.valores[i] = valor
+        self.total = i + 1
+    
+    def anotar_relaxacao(self, origem, vertice, g, f):
+        """RELAXAR seguido do INSERIR do mesmo vértice (sempre aos pares no A*)"""
+        i = self.total
+        if i + 1 >= len(self.tipos):
+            self.crescer()
+        indice = self.indice[vertice]
+        self.tipos[i] = RELAXAR
+        self.indices[i] = indice
+        self.origens[i] = self.indice[origem]
+        self.valores[i] = g
+        self.tipos[i + 1] = INSERIR
+        self.indices[i + 1] = indice
+        self.origens[i + 1] = -1
+        self.valores[i + 1] = f
+        self.total = i + 2
+    
+    def crescer(self):
+        """Dobra a capacidade dos arrays"""
+        for dados in (self.tipos, self.indices, self.origens, self.valores):
+            dados.frombytes(bytes(len(dados) * dados.itemsize))
+    
+    def finalizar(self):
+        """Descarta a capacidade não usada (chamado ao fim da busca)"""
+        for dados in (self.tipos, self.indices, self.origens, self.valores):
+            del dados[self.total:]
+    
+    def contar(self, tipo) -> int:
+        return self.tipos.count(tipo)
+
 
 class AEstrela:
     """Implementação do algoritmo A* para busca de caminho mínimo"""
     
-    def __init__(self, grafo):
+    # Expansões entre chamadas da função de progresso
+    INTERVALO_PROGRESSO = 4096
+    
+    def __init__(self, grafo, depurar=True, registrar=False, progresso=None):
         self.grafo = grafo
+        self.depurar = depurar  # Imprimir a fila de prioridade a cada expansão
+        self.registrar = registrar  # Gravar os eventos da busca em self.registro
+        # Chamada com o número de nós expandidos a cada INTERVALO_PROGRESSO
+        # expansões; uma exceção nela interrompe a busca (cancelamento)
+        self.progresso = progresso
+        self.registro = None
         self.caminho = []
         self.custo_total = 0
+        self.destino_heuristica = None
+        self.valores_heuristica = {}  # {vertice: h} já calculados para destino_heuristica
         
+    @instrumentacao.medir_fase('a_estrela.encontrar_caminho')
     def encontrar_caminho(self, inicio, destino):
         """
         Encontra o caminho mínimo entre inicio e destino usando A*
         """
+        self.preparar_heuristica(destino)
+        
+        # Com a instrumentação ativa, as inserções no heap são contadas
+        empurrar = heapq.heappush
+        if instrumentacao.ativa:
+            empurrar = instrumentacao.ContadorChamadas(heapq.heappush)
+        
+        # Eventos para reprodução (ver RegistroBusca); None = sem registro
+        anotar = anotar_relaxacao = None
+        if self.registrar:
+            self.registro = RegistroBusca(list(self.grafo.obter_todos_vertices()))
+            anotar, anotar_relaxacao = self.registro.anotar, self.registro.anotar_relaxacao
+        
         # Inicialização
         conjunto_aberto = []  # Fila de prioridade: (f_score, vertice)
-        heapq.heappush(conjunto_aberto, (0, inicio))
+        empurrar(conjunto_aberto, (0, inicio))
+        if anotar is not None:
+            anotar(INSERIR, inicio, 0)
         
         veio_de = {}  # Para reconstruir o caminho
         g_score = {vertice: float('inf') for vertice in self.grafo.obter_todos_vertices()}
@@ -32,15 +133,24 @@ class AEstrela:
             
             # Se já foi completamente explorado, pular
             if atual in conjunto_fechado:
+                if anotar is not None:
+                    anotar(DESCARTAR, atual, f_atual)
                 continue
             
             # Marca como explorado
             conjunto_fechado.add(atual)
+            if self.progresso is not None and len(conjunto_fechado) % self.INTERVALO_PROGRESSO == 0:
+                self.progresso(len(conjunto_fechado))
+            if anotar is not None:
+                anotar(EXPANDIR, atual, f_atual)
             
             # Se chegou ao destino
             if atual == destino:
                 self.caminho = self.reconstruir_caminho(veio_de, atual)
                 self.custo_total = g_score[atual]
+                self.registrar_instrumentacao(conjunto_fechado, empurrar)
+                if anotar is not None:
+                    self.registro.finalizar()
                 return self.caminho, self.custo_total
             
             # Explora vizinhos
@@ -58,9 +168,14 @@ class AEstrela:
                     f_score[vizinho] = g_score[vizinho] + self.heuristica(vizinho, destino)
 
                     # Adiciona à fila (será visitado depois se for promissor)
-                    heapq.heappush(conjunto_aberto, (f_score[vizinho], vizinho))
+                    empurrar(conjunto_aberto, (f_score[vizinho], vizinho))
+                    if anotar is not None:
+                        anotar_relaxacao(atual, vizinho, g_score_tentativo, f_score[vizinho])
             
             # DEBUG: Mostra estado atual da fila de prioridade
+            if not self.depurar:
+                continue
+            
             if conjunto_aberto:
                 print(f"\n  📋 Fila de prioridade após explorar {self.grafo.obter_nome_vertice(atual)}:")
                 # Criar uma cópia ordenada para visualização (sem alterar a heap original)
@@ -75,7 +190,40 @@ class AEstrela:
                 print(f"  📋 Fila vazia após explorar {self.grafo.obter_nome_vertice(atual)}")
             print()
         
+        self.registrar_instrumentacao(conjunto_fechado, empurrar)
+        if anotar is not None:
+            self.registro.finalizar()
+    
+    def registrar_instrumentacao(self, conjunto_fechado, empurrar):
+        """Soma os contadores da busca (só com a instrumentação ativa)"""
+        if not instrumentacao.ativa:
+            return
+        instrumentacao.contar('a_estrela.buscas')
+        instrumentacao.contar('a_estrela.nos_expandidos', len(conjunto_fechado))
+        if isinstance(empurrar, instrumentacao.ContadorChamadas):
+            instrumentacao.contar('a_estrela.insercoes_heap', empurrar.total)
+        
+    def preparar_heuristica(self, destino):
+        """
+        Descarta os valores h(n) memorizados e passa a usar o destino dado
+        (chamado no início de cada busca).
+        """
+        self.destino_heuristica = destino
+        self.valores_heuristica = {}
+    
     def heuristica(self, vertice1, vertice2):
+        """
+        Retorna a heurística h(n), calculada só quando o vértice é alcançado
+        pela busca e memorizada até a próxima busca.
+        """
+        if vertice2 != self.destino_heuristica:
+            self.preparar_heuristica(vertice2)
+        valor = self.valores_heuristica.get(vertice1)
+        if valor is None:
+            valor = self.valores_heuristica[vertice1] = self.calcular_heuristica(vertice1, vertice2)
+        return valor
+    
+    def calcular_heuristica(self, vertice1, vertice2):
         """
         Calcula a heurística h(n) usando distância de Manhattan
         entre as coordenadas geográficas dos vértices.
@@ -0,0 +1,233 @@
+"""
+Agendador de tarefas em segundo plano para a interface
+Cada análise (planaridade, coloração, A*, ...) é submetida como uma
+tarefa a um pool de threads de trabalho, e várias podem rodar ao mesmo
+tempo. Como em execucao_ag, as threads só publicam mensagens em uma
+fila; a interface a consome periodicamente (com after() no Tkinter) e
+é nessa consulta, na thread da interface, que os callbacks de progresso,
+conclusão e erro são chamados.
+
+O cancelamento é cooperativo: a tarefa chama tarefa.verificar() entre
+etapas (ou dentro da função de progresso dos algoritmos) e é
+interrompida com TarefaCancelada. Tarefas ainda na fila são canceladas
+sem executar.
+"""
+
+import itertools
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Threads de trabalho: tarefas simultâneas antes de as próximas esperarem na fila
+TRABALHADORES_PADRAO = 4
+
+# Intervalo mínimo entre mensagens de progresso de uma tarefa
+INTERVALO_PROGRESSO_S = 0.05
+
+
+class TarefaCancelada(Exception):
+    """Levantada por Tarefa.verificar() quando a tarefa foi cancelada"""
+
+
+class Tarefa:
+    """
+    Tarefa submetida ao Agendador.
+
+    estado: 'pendente', 'executando', 'concluida', 'cancelada' ou 'erro'
+    (atualizado na thread da interface, em Agendador.processar_mensagens).
+    """
+
+    def __init__(self, id_tarefa: int, nome: str, fila, ao_concluir=None, ao_erro=None, ao_progresso=None):
+        self.id = id_tarefa
+        self.nome = nome
+        self.fila = fila
+        self.ao_concluir = ao_concluir
+        self.ao_erro = ao_erro
+        self.ao_progresso = ao_progresso
+
+        self.estado = 'pendente'
+        self.progresso = None  # Fração concluída (0..1) ou None se indeterminada
+        self.mensagem = ''
+        self.resultado = None
+        self.erro = None
+        self.inicio = None
+        self.duracao = None
+
+        self._cancelada = threading.Event()
+        self._ultimo_progresso = 0.0
+
+    @property
+    def ativa(self) -> bool:
+        return self.estado in ('pendente', 'executando')
+
+    @property
+    def cancelada(self) -> bool:
+        return self._cancelada.is_set()
+
+    def cancelar(self):
+        """Pede a interrupção (efetiva no próximo verificar() da tarefa)"""
+        self._cancelada.set()
+
+    # Chamados pela função da tarefa, na thread de trabalho
+
+    def verificar(self):
+        """Levanta TarefaCancelada se a tarefa foi cancelada"""
+        if self._cancelada.is_set():
+            raise TarefaCancelada()
+
+    def informar_progresso(self, fracao: float = None, mensagem: str = ''):
+        """
+        Publica o progresso (no máximo uma mensagem a cada INTERVALO_PROGRESSO_S)
+        e verifica o cancelamento.
+        """
+        self.verificar()
+        agora = time.perf_counter()
+        if agora - self._ultimo_progresso >= INTERVALO_PROGRESSO_S or fracao == 1.0:
+            self._ultimo_progresso = agora
+            self.fila.put((self, 'progresso', (fracao, mensagem)))
+
+    def descrever(self) -> str:
+        """Linha de estado para listas de tarefas"""
+        partes = [self.nome]
+        if self.estado == 'pendente':
+            partes.append('na fila')
+        elif self.cancelada:
+            partes.append('cancelando...')
+        elif self.progresso is not None:
+            partes.append(f"{self.progresso:.0%}")
+        if self.mensagem:
+            partes.append(self.mensagem)
+        return ' — '.join(partes)
+
+
+class Agendador:
+    """
+    Pool de threads compartilhado pelas análises da interface.
+
+    Mensagens publicadas na fila (tarefa, tipo, dados):
+        ('inicio', None)
+        ('progresso', (fração, mensagem))
+        ('fim', resultado)
+        ('cancelada', None)
+        ('erro', mensagem)
+    """
+
+    def __init__(self, max_trabalhadores: int = TRABALHADORES_PADRAO):
+        self.fila = queue.Queue()
+        self.tarefas = {}  # {id: Tarefa} ainda não finalizadas (na interface)
+        self._ids = itertools.count(1)
+        self._executor = ThreadPoolExecutor(max_workers=max_trabalhadores, thread_name_prefix='tarefa')
+
+    def submeter(self, nome: str, funcao, *args, ao_concluir=None, ao_erro=None, ao_progresso=None,
+                 **kwargs) -> Tarefa:
+        """
+        Agenda funcao(tarefa, *args, **kwargs) em uma thread de trabalho.
+
+        A função recebe a Tarefa para informar progresso e verificar o
+        cancelamento; não deve tocar na interface. Os callbacks rodam na
+        thread da interface (em processar_mensagens):
+            ao_concluir(resultado), ao_erro(mensagem), ao_progresso(tarefa)
+
+        Returns:
+            A Tarefa (para cancelar ou consultar o estado)
+        """
+        tarefa = Tarefa(next(self._ids), nome, self.fila, ao_concluir, ao_erro, ao_progresso)
+        self.tarefas[tarefa.id] = tarefa
+        self._executor.submit(self._executar, tarefa, funcao, args, kwargs)
+        return tarefa
+
+    def _executar(self, tarefa, funcao, args, kwargs):
+        if tarefa.cancelada:
+            self.fila.put((tarefa, 'cancelada', None))
+            return
+        self.fila.put((tarefa, 'inicio', time.perf_counter()))
+        try:
+            resultado = funcao(tarefa, *args, **kwargs)
+        except TarefaCancelada:
+            self.fila.put((tarefa, 'cancelada', None))
+        except Exception as erro:
+            self.fila.put((tarefa, 'erro', f"{type(erro).__name__}: {erro}"))
+        else:
+            self.fila.put((tarefa, 'fim', resultado))
+
+    def processar_mensagens(self) -> bool:
+        """
+        Retira da fila, sem bloquear, as mensagens pendentes e chama os
+        callbacks das tarefas. Deve ser chamada na thread da interface.
+
+        Returns:
+            True se alguma tarefa mudou de estado ou de progresso
+        """
+        mudou = False
+        progresso_pendente = {}  # Só o último progresso de cada tarefa é repassado
+        while True:
+            try:
+                tarefa, tipo, dados = self.fila.get_nowait()
+            except queue.Empty:
+                break
+            mudou = True
+
+            if tipo == 'inicio':
+                tarefa.estado = 'executando'
+                tarefa.inicio = dados
+            elif tipo == 'progresso':
+                tarefa.progresso, tarefa.mensagem = dados
+                progresso_pendente[tarefa.id] = tarefa
+            else:
+                self._finalizar(tarefa, tipo, dados)
+                progresso_pendente.pop(tarefa.id, None)
+
+        for tarefa in progresso_pendente.values():
+            if tarefa.ao_progresso is not None:
+                tarefa.ao_progresso(tarefa)
+        return mudou
+
+    def _finalizar(self, tarefa, tipo, dados):
+        self.tarefas.pop(tarefa.id, None)
+        if tarefa.inicio is not None:
+            tarefa.duracao = time.perf_counter() - tarefa.inicio
+
+        # Cancelada depois de terminar: o resultado é descartado
+        if tipo == 'cancelada' or tarefa.cancelada:
+            tarefa.estado = 'cancelada'
+        elif tipo == 'erro':
+            tarefa.estado = 'erro'
+            tarefa.erro = dados
+            if tarefa.ao_erro is not None:
+                tarefa.ao_erro(dados)
+        else:
+            tarefa.estado = 'concluida'
+            tarefa.resultado = dados
+            tarefa.progresso = 1.0
+            if tarefa.ao_concluir is not None:
+                tarefa.ao_concluir(dados)
+
+    def ativas(self) -> list:
+        """Tarefas não finalizadas, na ordem de submissão"""
+        return list(self.tarefas.values())
+
+    def cancelar_todas(self):
+        for tarefa in self.tarefas.values():
+            tarefa.cancelar()
+
+    def aguardar(self, tempo_limite: float = None) -> bool:
+        """
+        Processa mensagens até não haver tarefas ativas (uso fora da interface).
+
+        Returns:
+            True se todas terminaram dentro do tempo limite
+        """
+        limite = None if tempo_limite is None else time.perf_counter() + tempo_limite
+        while self.tarefas:
+            if limite is not None and time.perf_counter() >= limite:
+                return False
+            time.sleep(0.01)
+            self.processar_mensagens()
+        return True
+
+    def encerrar(self):
+        """Cancela as tarefas e libera o pool (sem esperar as que estão rodando)"""
+        self.cancelar_todas()
+        self._executor.shutdown(wait=False, cancel_futures=True)
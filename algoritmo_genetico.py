@@ -6,18 +6,29 @@ Implementação usando Partially Mapped Crossover (PMX) e seleção elitista
 import random
 import math
 from grafo import Grafo
+from artefatos import cache_ativo, obter_ou_calcular
+import instrumentacao
 from typing import List, Tuple, Dict
 
 
+# Custo de uma aresta inexistente (valor tendendo ao infinito)
+PENALIDADE_ARESTA_INEXISTENTE = 999999
+
+# Acima deste número de vértices a matriz de custos não é montada
+LIMITE_MATRIZ_CUSTOS = 2000
+
+
 class IndividuoPCV:
     """Representa um indivíduo (rota) no Algoritmo Genético"""
     
-    def __init__(self, rota: List[int], grafo: Grafo, cidade_inicial: int):
+    def __init__(self, rota: List[int], grafo: Grafo, cidade_inicial: int, custos: Tuple = None):
         """
         Args:
             rota: Lista de IDs de vértices representando a rota (sem repetir cidade inicial)
             grafo: Grafo com as cidades
             cidade_inicial: ID da cidade de partida/chegada
+            custos: (indice, matriz) com a matriz de custos do AG, ou None
+                    para consultar os pesos no grafo
         """
         # Validar que a rota não tem duplicatas
         if len(rota) != len(set(rota)):
@@ -30,6 +41,7 @@ class IndividuoPCV:
         self.rota = rota
         self.grafo = grafo
         self.cidade_inicial = cidade_inicial
+        self.custos = custos
         self.custo = None
         self.calcular_custo()
     
@@ -43,6 +55,12 @@ class IndividuoPCV:
         custo_total = 0
         rota_completa = [self.cidade_inicial] + self.rota + [self.cidade_inicial]
         
+        if self.custos is not None:
+            indice, matriz = self.custos
+            posicoes = [indice[c] for c in rota_completa]
+            self.custo = sum(matriz[a][b] for a, b in zip(posicoes, posicoes[1:]))
+            return self.custo
+        
         # Calcular custo de cada segmento
         for i in range(len(rota_completa) - 1):
             cidade_atual = rota_completa[i]
@@ -52,7 +70,7 @@ class IndividuoPCV:
             
             if peso is None:
                 # Aresta inexistente - penalizar com custo muito alto
-                custo_total += 999999  # Valor tendendo ao infinito
+                custo_total += PENALIDADE_ARESTA_INEXISTENTE
             else:
                 custo_total += peso
         
@@ -81,7 +99,8 @@ class AlgoritmoGeneticoPCV:
                  taxa_mutacao: float = 0.01,
                  ponto1_cruzamento: int = 2,
                  ponto2_cruzamento: int = 5,
-                 intervalo_geracao: float = 0.5):
+                 intervalo_geracao: float = 0.5,
+                 usar_cache: bool = True):
         """
         Args:
             grafo: Grafo com as cidades
@@ -92,6 +111,7 @@ class AlgoritmoGeneticoPCV:
             ponto1_cruzamento: Primeiro ponto de corte para PMX
             ponto2_cruzamento: Segundo ponto de corte para PMX
             intervalo_geracao: Porcentagem da população substituída por geração
+            usar_cache: Ler/gravar a matriz de custos no cache de artefatos
         """
         self.grafo = grafo
         self.cidade_inicial = cidade_inicial
@@ -107,6 +127,10 @@ class AlgoritmoGeneticoPCV:
         self.cidades_visitaveis = [c for c in todas_cidades if c != cidade_inicial]
         self.num_cidades = len(self.cidades_visitaveis)
         
+        # Matriz de custos (pré-processamento reaproveitado entre execuções)
+        self.usar_cache = usar_cache
+        self.custos = self.obter_matriz_custos() if len(todas_cidades) <= LIMITE_MATRIZ_CUSTOS else None
+        
         # População
         self.populacao: List[IndividuoPCV] = []
         self.melhor_individuo: IndividuoPCV = None
@@ -114,6 +138,48 @@ class AlgoritmoGeneticoPCV:
         self.historico_custo_medio = []
         self.geracao_atual = 0
         
+    @instrumentacao.medir_fase('algoritmo_genetico.matriz_custos')
+    def obter_matriz_custos(self) -> Tuple:
+        """
+        Monta a matriz de custos entre todas as cidades (penalidade para
+        arestas inexistentes), lida do cache de artefatos quando disponível.
+        
+        Returns:
+            (indice, matriz): {cidade: posição} e lista de listas de custos
+        """
+        vertices = self.grafo.obter_todos_vertices()
+        indice = {v: i for i, v in enumerate(vertices)}
+        
+        def calcular():
+            n = len(vertices)
+            matriz = [[PENALIDADE_ARESTA_INEXISTENTE] * n for _ in range(n)]
+            for v1, v2, peso in self.grafo.obter_todas_arestas():
+                matriz[indice[v1]][indice[v2]] = peso
+                matriz[indice[v2]][indice[v1]] = peso
+            return matriz
+        
+        def calcular_para_cache():
+            matriz = calcular()
+            try:
+                import numpy as np  # Importado só aqui: mantém o módulo leve
+            except ImportError:
+                return matriz
+            # Array compacto no disco (int64 se todos os pesos forem inteiros)
+            return np.array(matriz)
+        
+        if self.usar_cache and cache_ativo():
+            matriz = obter_ou_calcular(self.grafo, 'algoritmo_genetico.custos',
+                                       {'penalidade': PENALIDADE_ARESTA_INEXISTENTE},
+                                       calcular_para_cache)
+        else:
+            matriz = calcular()
+        
+        # Listas Python: acesso elemento a elemento mais rápido que no array
+        if not isinstance(matriz, list):
+            matriz = matriz.tolist()
+        return indice, matriz
+    
+    @instrumentacao.medir_fase('algoritmo_genetico.inicializacao')
     def inicializar_populacao(self):
         """Gera população inicial de forma aleatória"""
         self.populacao = []
@@ -123,13 +189,16 @@ class AlgoritmoGeneticoPCV:
             rota = self.cidades_visitaveis.copy()
             random.shuffle(rota)
             
-            individuo = IndividuoPCV(rota, self.grafo, self.cidade_inicial)
+            individuo = IndividuoPCV(rota, self.grafo, self.cidade_inicial, self.custos)
             self.populacao.append(individuo)
         
         # Ordenar população por custo
         self.populacao.sort()
         self.melhor_individuo = self.populacao[0]
         
+        if instrumentacao.ativa:
+            instrumentacao.contar('algoritmo_genetico.avaliacoes', len(self.populacao))
+        
         # Registrar estatísticas
         self.registrar_estatisticas()
     
@@ -232,9 +301,11 @@ class AlgoritmoGeneticoPCV:
         
         return nova_rota
     
+    @instrumentacao.medir_fase('algoritmo_genetico.geracao')
     def evoluir_geracao(self):
         """Evolui uma geração completa"""
         self.geracao_atual += 1
+        cruzamentos = mutacoes = avaliacoes = 0  # Totais para a instrumentação
         
         # Calcular quantos indivíduos serão substituídos
         num_substituicoes = int(self.tamanho_populacao * self.intervalo_geracao)
@@ -252,6 +323,7 @@ class AlgoritmoGeneticoPCV:
             # Cruzamento
             if random.random() < self.taxa_cruzamento:
                 rota_filho1, rota_filho2 = self.cruzamento_pmx(pai1, pai2)
+                cruzamentos += 1
             else:
                 rota_filho1, rota_filho2 = pai1.rota.copy(), pai2.rota.copy()
             
@@ -262,16 +334,19 @@ class AlgoritmoGeneticoPCV:
                     rota_filho1 = self.mutacao_swap(rota_filho1)
                 else:
                     rota_filho1 = self.mutacao_inversao(rota_filho1)
+                mutacoes += 1
             
             if random.random() < self.taxa_mutacao:
                 if random.random() < 0.5:
                     rota_filho2 = self.mutacao_swap(rota_filho2)
                 else:
                     rota_filho2 = self.mutacao_inversao(rota_filho2)
+                mutacoes += 1
             
             # Criar indivíduos
-            filho1 = IndividuoPCV(rota_filho1, self.grafo, self.cidade_inicial)
-            filho2 = IndividuoPCV(rota_filho2, self.grafo, self.cidade_inicial)
+            filho1 = IndividuoPCV(rota_filho1, self.grafo, self.cidade_inicial, self.custos)
+            filho2 = IndividuoPCV(rota_filho2, self.grafo, self.cidade_inicial, self.custos)
+            avaliacoes += 2
             
             nova_populacao.append(filho1)
             if len(nova_populacao) < self.tamanho_populacao:
@@ -289,6 +364,12 @@ class AlgoritmoGeneticoPCV:
         
         # Registrar estatísticas
         self.registrar_estatisticas()
+        
+        if instrumentacao.ativa:
+            instrumentacao.contar('algoritmo_genetico.geracoes')
+            instrumentacao.contar('algoritmo_genetico.avaliacoes', avaliacoes)
+            instrumentacao.contar('algoritmo_genetico.cruzamentos', cruzamentos)
+            instrumentacao.contar('algoritmo_genetico.mutacoes', mutacoes)
     
     def executar(self, max_geracoes: int = 20, callback_geracao=None) -> IndividuoPCV:
         """
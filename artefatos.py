@@ -0,0 +1,245 @@
+"""
+Cache de artefatos pré-calculados em disco
+Armazenamento endereçado por conteúdo: a chave de cada artefato é o hash
+do grafo combinado com o nome do algoritmo e seus parâmetros. Arrays
+NumPy são gravados em .npy (relidos com mmap e sem pickle); os demais
+valores, que devem ser literais Python (dicts, listas, números, strings),
+são gravados com repr e relidos com ast.literal_eval, que não executa
+código: o diretório pode ser compartilhado sem que um arquivo plantado
+nele rode ao ser carregado.
+
+O cache é opcional e limitado: quando o tamanho total passa do limite, os
+artefatos usados há mais tempo são removidos.
+
+Variáveis de ambiente:
+    GRAFOS_CACHE         '1' ativa o cache (desativado por padrão)
+    GRAFOS_CACHE_DIR     diretório do cache (padrão: ~/.cache/grafos)
+    GRAFOS_CACHE_MAX_MB  tamanho máximo do cache em MB (padrão: 256)
+"""
+
+import ast
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import weakref
+
+
+# Cache dos hashes: {grafo: (versao, hash)}
+_cache_hashes = weakref.WeakKeyDictionary()
+
+# Contadores de uso do cache no processo atual
+estatisticas_cache = {'acertos': 0, 'falhas': 0, 'gravacoes': 0, 'remocoes': 0}
+
+# Limite padrão do tamanho total do cache
+TAMANHO_MAXIMO_PADRAO_MB = 256
+
+# Extensões dos artefatos: arrays NumPy e literais Python
+EXTENSOES = ('.npy', '.txt')
+
+
+def cache_ativo() -> bool:
+    """Verifica se o cache está habilitado (GRAFOS_CACHE == '1')"""
+    return os.environ.get('GRAFOS_CACHE', '0') == '1'
+
+
+def tamanho_maximo() -> int:
+    """Tamanho máximo do cache em bytes (GRAFOS_CACHE_MAX_MB)"""
+    try:
+        megabytes = float(os.environ.get('GRAFOS_CACHE_MAX_MB', TAMANHO_MAXIMO_PADRAO_MB))
+    except ValueError:
+        megabytes = TAMANHO_MAXIMO_PADRAO_MB
+    return int(megabytes * 1024 * 1024)
+
+
+def diretorio_cache() -> str:
+    """Diretório onde os artefatos são gravados"""
+    return os.environ.get('GRAFOS_CACHE_DIR') or os.path.join(
+        os.path.expanduser('~'), '.cache', 'grafos'
+    )
+
+
+def hash_grafo(grafo) -> str:
+    """
+    Hash SHA-256 do conteúdo do grafo (vértices, nomes, coordenadas e
+    arestas com pesos, na ordem de inserção).
+
+    O resultado fica em cache enquanto a versão do grafo não mudar.
+    """
+    versao = getattr(grafo, 'versao', None)
+    em_cache = _cache_hashes.get(grafo)
+    if em_cache is not None and versao is not None and em_cache[0] == versao:
+        return em_cache[1]
+
+    h = hashlib.sha256()
+    for v in grafo.obter_todos_vertices():
+        h.update(repr((v, grafo.obter_nome_vertice(v), grafo.obter_posicao_vertice(v))).encode())
+        h.update(b'\n')
+    h.update(b'--\n')
+    for aresta in grafo.obter_todas_arestas():
+        h.update(repr(aresta).encode())
+        h.update(b'\n')
+
+    resultado = h.hexdigest()
+    _cache_hashes[grafo] = (versao, resultado)
+    return resultado
+
+
+def chave_artefato(grafo, algoritmo: str, parametros: dict = None) -> str:
+    """Chave do artefato: hash do grafo + algoritmo + parâmetros"""
+    descricao = json.dumps(
+        {'grafo': hash_grafo(grafo), 'algoritmo': algoritmo, 'parametros': parametros or {}},
+        sort_keys=True, default=repr
+    )
+    return hashlib.sha256(descricao.encode()).hexdigest()
+
+
+def _caminho_base(chave: str) -> str:
+    return os.path.join(diretorio_cache(), chave[:2], chave)
+
+
+def carregar_artefato(chave: str):
+    """
+    Lê um artefato do cache.
+
+    Returns:
+        O valor gravado, ou None se não existir (ou o cache estiver desativado)
+    """
+    if not cache_ativo():
+        return None
+
+    base = _caminho_base(chave)
+    try:
+        if os.path.exists(base + '.npy'):
+            import numpy as np  # Só é importado quando há um array gravado
+            caminho = base + '.npy'
+            valor = np.load(caminho, mmap_mode='r', allow_pickle=False)
+        else:
+            caminho = base + '.txt'
+            with open(caminho, encoding='utf-8') as arquivo:
+                valor = ast.literal_eval(arquivo.read())
+        # Marca o uso: a remoção começa pelos artefatos menos recentes
+        os.utime(caminho)
+    except (OSError, ValueError, SyntaxError, MemoryError, RecursionError):
+        # Ausente ou corrompido: tratado como falha
+        estatisticas_cache['falhas'] += 1
+        return None
+
+    estatisticas_cache['acertos'] += 1
+    return valor
+
+
+def salvar_artefato(chave: str, valor) -> bool:
+    """
+    Grava um artefato no cache (escrita atômica via arquivo temporário) e
+    remove os menos usados se o limite de tamanho for ultrapassado.
+
+    Returns:
+        True se o artefato foi gravado
+    """
+    if not cache_ativo():
+        return False
+
+    base = _caminho_base(chave)
+    diretorio = os.path.dirname(base)
+    # Se o NumPy não foi importado, o valor não pode ser um array
+    np = sys.modules.get('numpy')
+    eh_array = np is not None and isinstance(valor, np.ndarray)
+
+    if eh_array:
+        if valor.dtype.hasobject:
+            return False
+    else:
+        conteudo = repr(valor)
+        try:
+            # Só literais podem ser relidos com segurança
+            ast.literal_eval(conteudo)
+        except (ValueError, SyntaxError, MemoryError, RecursionError):
+            return False
+
+    try:
+        os.makedirs(diretorio, exist_ok=True)
+        descritor, temporario = tempfile.mkstemp(dir=diretorio, suffix='.tmp')
+        try:
+            if eh_array:
+                with os.fdopen(descritor, 'wb') as arquivo:
+                    np.save(arquivo, valor, allow_pickle=False)
+            else:
+                with os.fdopen(descritor, 'w', encoding='utf-8') as arquivo:
+                    arquivo.write(conteudo)
+            os.replace(temporario, base + ('.npy' if eh_array else '.txt'))
+        except BaseException:
+            os.unlink(temporario)
+            raise
+    except OSError:
+        # Cache é só uma otimização: sem permissão/espaço, segue sem gravar
+        return False
+
+    estatisticas_cache['gravacoes'] += 1
+    limitar_tamanho()
+    return True
+
+
+def limitar_tamanho(limite: int = None) -> int:
+    """
+    Remove os artefatos usados há mais tempo até o cache caber no limite.
+
+    Args:
+        limite: Tamanho máximo em bytes (padrão: tamanho_maximo())
+
+    Returns:
+        Número de artefatos removidos
+    """
+    if limite is None:
+        limite = tamanho_maximo()
+
+    arquivos = []
+    total = 0
+    for raiz, _, nomes in os.walk(diretorio_cache()):
+        for nome in nomes:
+            if not nome.endswith(EXTENSOES):
+                continue
+            caminho = os.path.join(raiz, nome)
+            try:
+                info = os.stat(caminho)
+            except OSError:
+                continue
+            arquivos.append((info.st_mtime, info.st_size, caminho))
+            total += info.st_size
+
+    removidos = 0
+    arquivos.sort()
+    for _, tamanho, caminho in arquivos:
+        if total <= limite:
+            break
+        try:
+            os.remove(caminho)
+        except OSError:
+            continue
+        total -= tamanho
+        removidos += 1
+
+    estatisticas_cache['remocoes'] += removidos
+    return removidos
+
+
+def obter_ou_calcular(grafo, algoritmo: str, parametros: dict, calcular):
+    """
+    Retorna o artefato do cache ou o calcula (e grava) com calcular().
+
+    Args:
+        grafo: Grafo ao qual o artefato se refere
+        algoritmo: Nome do artefato (ex.: 'algoritmo_genetico.custos')
+        parametros: Parâmetros que influenciam o resultado
+        calcular: Função sem argumentos que produz o artefato
+    """
+    if not cache_ativo():
+        return calcular()
+
+    chave = chave_artefato(grafo, algoritmo, parametros)
+    valor = carregar_artefato(chave)
+    if valor is None:
+        valor = calcular()
+        salvar_artefato(chave, valor)
+    return valor
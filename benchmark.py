@@ -0,0 +1,252 @@
+"""
+Benchmark dos algoritmos em grafos sintéticos
+Gera grafos de 10 a 10⁶ vértices (ver geradores.py), mede
+AEstrela.encontrar_caminho, WelshPowell.color_graph,
+VerificadorPlanaridade.verificar_planaridade e as gerações do AlgoritmoGeneticoPCV
+e grava os resultados em JSON para comparação entre execuções.
+
+Algoritmos superlineares só rodam até um tamanho máximo
+(LIMITES_VERTICES) para que a suíte termine em tempo razoável.
+
+Uso:
+    python benchmark.py --saida resultados.json
+    python benchmark.py --tamanhos 100 1000 --algoritmos a_estrela planaridade
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+from geradores import GERADORES
+from a_estrela import AEstrela
+from welsh_powell import WelshPowell
+from planaridade import VerificadorPlanaridade
+from algoritmo_genetico import AlgoritmoGeneticoPCV
+from metricas import invalidar_analise
+
+
+TAMANHOS_PADRAO = [10, 100, 1000, 10_000, 100_000, 1_000_000]
+
+# Maior número de vértices medido por algoritmo
+LIMITES_VERTICES = {
+    'a_estrela': 1_000_000,
+    'planaridade': 1_000_000,
+    'welsh_powell': 10_000,  # O(V²) no pior caso
+    'ag': 1_000  # Matriz de custos O(V²) e avaliação O(V) por indivíduo
+}
+
+GERACOES_AG = 10
+
+
+# ============================================================================
+# MEDIÇÕES (cada uma retorna segundos e métricas extras)
+# ============================================================================
+
+def medir_a_estrela(grafo) -> tuple:
+    """Caminho do primeiro ao último vértice (cantos opostos na grade)"""
+    a_estrela = AEstrela(grafo, depurar=False)
+    destino = grafo.contar_vertices() - 1
+
+    inicio = time.perf_counter()
+    resultado = a_estrela.encontrar_caminho(0, destino)
+    segundos = time.perf_counter() - inicio
+
+    return segundos, {
+        'encontrado': resultado is not None,
+        'custo': resultado[1] if resultado else None,
+        'tamanho_caminho': len(resultado[0]) if resultado else 0
+    }
+
+
+def medir_welsh_powell(grafo) -> tuple:
+    welsh_powell = WelshPowell(grafo, usar_cache=False)
+
+    inicio = time.perf_counter()
+    welsh_powell.color_graph()
+    segundos = time.perf_counter() - inicio
+
+    return segundos, {'num_cores': welsh_powell.get_chromatic_number()}
+
+
+def medir_planaridade(grafo) -> tuple:
+    # Sem reaproveitar a análise estrutural da repetição anterior
+    invalidar_analise(grafo)
+    verificador = VerificadorPlanaridade(grafo)
+
+    inicio = time.perf_counter()
+    eh_planar, _ = verificador.verificar_planaridade()
+    segundos = time.perf_counter() - inicio
+
+    return segundos, {'planar': eh_planar}
+
+
+def medir_ag(grafo) -> tuple:
+    """Só o laço de gerações (matriz de custos e população inicial fora do tempo)"""
+    ag = AlgoritmoGeneticoPCV(grafo, 0, usar_cache=False)
+    ag.inicializar_populacao()
+
+    inicio = time.perf_counter()
+    for _ in range(GERACOES_AG):
+        ag.evoluir_geracao()
+    segundos = time.perf_counter() - inicio
+    melhor = ag.melhor_individuo
+
+    return segundos, {
+        'geracoes': GERACOES_AG,
+        'geracoes_por_segundo': GERACOES_AG / segundos if segundos > 0 else None,
+        'melhor_custo': melhor.custo
+    }
+
+
+MEDICOES = {
+    'a_estrela': medir_a_estrela,
+    'welsh_powell': medir_welsh_powell,
+    'planaridade': medir_planaridade,
+    'ag': medir_ag
+}
+
+
+# ============================================================================
+# SUÍTE
+# ============================================================================
+
+def executar_caso(grafo, algoritmo: str, repeticoes: int) -> dict:
+    """
+    Mede o algoritmo várias vezes no mesmo grafo.
+
+    Returns:
+        {'tempos_s', 'mediana_s', 'minimo_s', 'extra'} (extra da última repetição)
+    """
+    tempos = []
+    extra = {}
+    for _ in range(repeticoes):
+        gc.collect()
+        segundos, extra = MEDICOES[algoritmo](grafo)
+        tempos.append(segundos)
+
+    return {
+        'tempos_s': tempos,
+        'mediana_s': statistics.median(tempos),
+        'minimo_s': min(tempos),
+        'extra': extra
+    }
+
+
+def executar_suite(geradores=None, tamanhos=None, algoritmos=None, repeticoes: int = 3,
+                   semente: int = 0, max_vertices: int = None, progresso=None) -> list:
+    """
+    Executa todas as combinações gerador × tamanho × algoritmo.
+
+    Cada grafo é gerado uma vez (com a mesma semente) e usado por todos os
+    algoritmos cujo limite de vértices comporta o tamanho.
+
+    Args:
+        progresso: Função chamada com uma linha de texto a cada caso medido
+
+    Returns:
+        Lista de resultados (um dicionário por caso)
+    """
+    geradores = geradores or list(GERADORES)
+    tamanhos = tamanhos or TAMANHOS_PADRAO
+    algoritmos = algoritmos or list(MEDICOES)
+    resultados = []
+
+    for nome_gerador in geradores:
+        for n in tamanhos:
+            if max_vertices is not None and n > max_vertices:
+                continue
+            pendentes = [a for a in algoritmos if n <= LIMITES_VERTICES[a]]
+            if not pendentes:
+                continue
+
+            inicio = time.perf_counter()
+            grafo = GERADORES[nome_gerador](n, semente=semente)
+            tempo_geracao = time.perf_counter() - inicio
+
+            for algoritmo in pendentes:
+                caso = executar_caso(grafo, algoritmo, repeticoes)
+                caso.update({
+                    'gerador': nome_gerador,
+                    'n': n,
+                    'vertices': grafo.contar_vertices(),
+                    'arestas': grafo.contar_arestas(),
+                    'algoritmo': algoritmo,
+                    'geracao_grafo_s': tempo_geracao
+                })
+                resultados.append(caso)
+
+                if progresso:
+                    progresso(f"{nome_gerador:<14}{n:>10}  {algoritmo:<14}"
+                              f"{caso['mediana_s'] * 1000:>12.2f} ms")
+
+            del grafo
+
+    return resultados
+
+
+def obter_metadados() -> dict:
+    """Ambiente da execução (para comparar resultados ao longo do tempo)"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                                text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+
+    return {
+        'data': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'implementacao': platform.python_implementation(),
+        'plataforma': platform.platform(),
+        'processador': platform.processor() or platform.machine(),
+        'commit': commit
+    }
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark dos algoritmos em grafos sintéticos")
+    parser.add_argument('--geradores', nargs='+', choices=list(GERADORES))
+    parser.add_argument('--tamanhos', nargs='+', type=int, help="Números de vértices")
+    parser.add_argument('--algoritmos', nargs='+', choices=list(MEDICOES))
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--semente', type=int, default=0)
+    parser.add_argument('--max-vertices', type=int, help="Ignorar tamanhos acima deste")
+    parser.add_argument('--saida', help="Arquivo JSON de resultados (padrão: saída padrão)")
+    return parser
+
+
+def main(argv=None) -> int:
+    args = criar_parser().parse_args(argv)
+
+    def progresso(linha):
+        print(linha, file=sys.stderr, flush=True)
+
+    resultados = executar_suite(args.geradores, args.tamanhos, args.algoritmos,
+                                args.repeticoes, args.semente, args.max_vertices, progresso)
+    documento = {
+        'metadados': obter_metadados(),
+        'configuracao': {
+            'repeticoes': args.repeticoes,
+            'semente': args.semente,
+            'geracoes_ag': GERACOES_AG,
+            'limites_vertices': LIMITES_VERTICES
+        },
+        'resultados': resultados
+    }
+
+    texto = json.dumps(documento, ensure_ascii=False, indent=2)
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            arquivo.write(texto + '\n')
+    else:
+        print(texto)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
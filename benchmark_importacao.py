@@ -0,0 +1,89 @@
+"""
+Benchmark do tempo de importação dos módulos de algoritmos
+Importa cada módulo em um interpretador novo (com -X importtime), mede o
+tempo cumulativo e verifica que nenhum backend gráfico ou o NumPy foi
+carregado. Sai com código 1 se algum módulo estourar o orçamento.
+
+Uso:
+    python benchmark_importacao.py [--orcamento-ms 50] [--repeticoes 5]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+
+MODULOS_ALGORITMOS = ['grafo', 'dados', 'a_estrela', 'welsh_powell', 'planaridade',
+                      'algoritmo_genetico', 'metricas', 'carregador', 'instrumentacao', 'cli']
+
+# Módulos que não podem ser carregados pelo simples import dos algoritmos
+MODULOS_PROIBIDOS = ['matplotlib', 'tkinter', 'numpy']
+
+
+def medir_importacao(modulo: str) -> tuple:
+    """
+    Importa o módulo em um processo novo.
+
+    Returns:
+        (tempo cumulativo em ms, módulos proibidos carregados)
+    """
+    codigo = (
+        f"import sys, {modulo}\n"
+        f"print(','.join(m for m in {MODULOS_PROIBIDOS!r} if m in sys.modules))"
+    )
+    processo = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', codigo],
+        capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__))
+    )
+    if processo.returncode != 0:
+        raise RuntimeError(f"Falha ao importar {modulo}:\n{processo.stderr}")
+
+    # Linhas "import time: self | cumulative | nome"; a do módulo vem por último
+    tempo_us = None
+    for linha in processo.stderr.splitlines():
+        partes = linha.split('|')
+        if len(partes) == 3 and partes[2].strip() == modulo:
+            tempo_us = int(partes[1])
+
+    proibidos = [m for m in processo.stdout.strip().split(',') if m]
+    return tempo_us / 1000.0, proibidos
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Tempo de importação dos módulos de algoritmos")
+    parser.add_argument('--orcamento-ms', type=float, default=50.0,
+                        help="Tempo máximo (mediana) por módulo, em ms")
+    parser.add_argument('--repeticoes', type=int, default=5)
+    parser.add_argument('modulos', nargs='*', default=MODULOS_ALGORITMOS)
+    args = parser.parse_args(argv)
+
+    falhas = 0
+    print(f"{'Módulo':<22}{'Mediana (ms)':>14}{'Mínimo (ms)':>14}  Situação")
+    print("-" * 64)
+
+    for modulo in args.modulos:
+        tempos = []
+        proibidos = set()
+        for _ in range(args.repeticoes):
+            tempo, carregados = medir_importacao(modulo)
+            tempos.append(tempo)
+            proibidos.update(carregados)
+
+        mediana = statistics.median(tempos)
+        situacao = "OK"
+        if proibidos:
+            situacao = f"CARREGOU {', '.join(sorted(proibidos))}"
+        elif mediana > args.orcamento_ms:
+            situacao = f"ACIMA DO ORÇAMENTO ({args.orcamento_ms:.0f} ms)"
+        if situacao != "OK":
+            falhas += 1
+
+        print(f"{modulo:<22}{mediana:>14.1f}{min(tempos):>14.1f}  {situacao}")
+
+    return 1 if falhas else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,593 @@
+"""
+Carregamento de grafos a partir de arquivos
+Leitura em blocos (sem manter o texto inteiro em memória) de:
+- listas de arestas CSV/texto (v1,v2[,peso])
+- DIMACS (.gr com arcos "a u v w" e .co com coordenadas "v id x y")
+- TSPLIB (.tsp com NODE_COORD_SECTION ou EDGE_WEIGHT_SECTION)
+- snapshots binários (.snap), abertos por mmap sem interpretação de texto
+Também monta os grafos embutidos de dados.py ('trabalho' e 'parana').
+As arestas são enviadas diretamente ao caminho em lote do Grafo.
+"""
+
+import gzip
+import math
+import os
+import time
+from itertools import islice
+
+from grafo import Grafo
+from snapshot import abrir_snapshot
+from dados import COORDENADAS_CIDADES, ARESTAS, COORDENADAS_CIDADES_PARANA, ARESTAS_PARANA
+
+
+TAMANHO_BLOCO_PADRAO = 1 << 20  # 1 MiB por leitura
+
+# Acima deste número de vértices, instâncias TSPLIB com coordenadas não geram
+# o grafo completo por padrão (seriam n(n-1)/2 arestas)
+LIMITE_VERTICES_TSPLIB_COMPLETO = 2000
+
+# Extensão -> formato
+FORMATOS = {
+    '.csv': 'csv',
+    '.txt': 'csv',
+    '.edges': 'csv',
+    '.el': 'csv',
+    '.gr': 'dimacs',
+    '.tsp': 'tsplib',
+    '.snap': 'snapshot'
+}
+
+
+def criar_grafo_cidades(coordenadas: dict, arestas: list) -> Grafo:
+    """
+    Cria um grafo de cidades a partir das tabelas de dados.py.
+
+    Args:
+        coordenadas: {cidade: (x, y)}; os IDs são as posições 0..n-1
+        arestas: [(cidade1, cidade2, distancia)]
+    """
+    grafo = Grafo()
+    cidade_para_id = {cidade: i for i, cidade in enumerate(coordenadas)}
+
+    grafo.adicionar_vertices_em_lote(
+        (cidade_para_id[cidade], cidade, x, y) for cidade, (x, y) in coordenadas.items()
+    )
+    grafo.adicionar_arestas_em_lote(
+        (cidade_para_id[c1], cidade_para_id[c2], distancia) for c1, c2, distancia in arestas
+    )
+    return grafo
+
+
+def criar_grafo_trabalho() -> Grafo:
+    """Cria o grafo do Trabalho 3 (PCV com AG)"""
+    return criar_grafo_cidades(COORDENADAS_CIDADES, ARESTAS)
+
+
+def criar_grafo_parana() -> Grafo:
+    """Cria o grafo das cidades do Paraná"""
+    return criar_grafo_cidades(COORDENADAS_CIDADES_PARANA, ARESTAS_PARANA)
+
+
+# Nome -> construtor dos grafos embutidos
+GRAFOS_EMBUTIDOS = {
+    'trabalho': criar_grafo_trabalho,
+    'parana': criar_grafo_parana
+}
+
+
+def carregar_grafo(fonte: str, **opcoes) -> tuple:
+    """
+    Carrega um grafo embutido (pelo nome) ou de arquivo (pelo caminho).
+
+    Returns:
+        (grafo, estatisticas)
+    """
+    if fonte in GRAFOS_EMBUTIDOS:
+        estatisticas = iniciar_estatisticas('embutido', fonte)
+        grafo = GRAFOS_EMBUTIDOS[fonte]()
+        return grafo, finalizar_estatisticas(estatisticas, grafo)
+    return carregar_arquivo(fonte, **opcoes)
+
+
+def carregar_arquivo(caminho: str, formato: str = None, grafo: Grafo = None, **opcoes) -> tuple:
+    """
+    Carrega um grafo de arquivo, escolhendo o leitor pela extensão.
+
+    Args:
+        caminho: Caminho do arquivo (aceita compressão .gz)
+        formato: 'csv', 'dimacs', 'tsplib' ou 'snapshot' (None = detectar pela extensão)
+        grafo: Grafo a preencher (None = cria um novo)
+        **opcoes: Repassadas ao leitor do formato
+
+    Returns:
+        (grafo, estatisticas)
+    """
+    if formato is None:
+        formato = detectar_formato(caminho)
+
+    leitores = {
+        'csv': carregar_lista_arestas,
+        'dimacs': carregar_dimacs,
+        'tsplib': carregar_tsplib,
+        'snapshot': carregar_snapshot
+    }
+    if formato not in leitores:
+        raise ValueError(f"Formato desconhecido: {formato}")
+
+    return leitores[formato](caminho, grafo=grafo, **opcoes)
+
+
+def detectar_formato(caminho: str) -> str:
+    """Detecta o formato do arquivo pela extensão (ignorando .gz)"""
+    nome = caminho[:-3] if caminho.endswith('.gz') else caminho
+    extensao = os.path.splitext(nome)[1].lower()
+    if extensao not in FORMATOS:
+        raise ValueError(f"Extensão não reconhecida: '{extensao}'")
+    return FORMATOS[extensao]
+
+
+def ler_linhas(caminho: str, estatisticas: dict, tamanho_bloco: int = TAMANHO_BLOCO_PADRAO):
+    """
+    Gera as linhas do arquivo lendo blocos de tamanho fixo.
+
+    Cada bloco é cortado na última quebra de linha; o restante é levado
+    para o próximo bloco, de modo que só um bloco fica em memória.
+    """
+    abrir = gzip.open if caminho.endswith('.gz') else open
+    resto = b''
+
+    with abrir(caminho, 'rb') as arquivo:
+        while True:
+            bloco = arquivo.read(tamanho_bloco)
+            if not bloco:
+                break
+            estatisticas['bytes'] += len(bloco)
+
+            corte = bloco.rfind(b'\n')
+            if corte < 0:
+                resto += bloco
+                continue
+
+            texto = (resto + bloco[:corte + 1]).decode('utf-8', errors='replace')
+            resto = bloco[corte + 1:]
+            for linha in texto.splitlines():
+                estatisticas['linhas'] += 1
+                yield linha
+
+    if resto:
+        estatisticas['linhas'] += 1
+        yield resto.decode('utf-8', errors='replace')
+
+
+def iniciar_estatisticas(formato: str, caminho: str) -> dict:
+    """Cria o dicionário de estatísticas de uma carga"""
+    return {
+        'formato': formato,
+        'caminho': caminho,
+        'bytes': 0,
+        'linhas': 0,
+        'vertices': 0,
+        'arestas': 0,
+        'segundos': 0.0,
+        'inicio': time.perf_counter()
+    }
+
+
+def finalizar_estatisticas(estatisticas: dict, grafo: Grafo) -> dict:
+    """Completa as estatísticas com tamanho do grafo e vazão da leitura"""
+    segundos = time.perf_counter() - estatisticas.pop('inicio')
+    estatisticas['segundos'] = segundos
+    estatisticas['vertices'] = grafo.contar_vertices()
+    estatisticas['arestas'] = grafo.contar_arestas()
+
+    segundos = max(segundos, 1e-9)
+    estatisticas['mb_por_segundo'] = estatisticas['bytes'] / (1024 * 1024) / segundos
+    estatisticas['linhas_por_segundo'] = estatisticas['linhas'] / segundos
+    estatisticas['arestas_por_segundo'] = estatisticas['arestas'] / segundos
+    return estatisticas
+
+
+def formatar_estatisticas(estatisticas: dict) -> str:
+    """Texto resumido das estatísticas de carga"""
+    texto = (
+        f"Arquivo: {estatisticas['caminho']} ({estatisticas['formato']})\n"
+        f"Vértices: {estatisticas['vertices']}  Arestas: {estatisticas['arestas']}\n"
+        f"Lidos {estatisticas['bytes'] / (1024 * 1024):.2f} MB em {estatisticas['segundos']:.3f} s\n"
+        f"Vazão: {estatisticas['mb_por_segundo']:.2f} MB/s, "
+        f"{estatisticas['linhas_por_segundo']:.0f} linhas/s, "
+        f"{estatisticas['arestas_por_segundo']:.0f} arestas/s\n"
+    )
+    if estatisticas.get('aviso'):
+        texto += f"Aviso: {estatisticas['aviso']}\n"
+    return texto
+
+
+def erro_linha(caminho: str, numero: int, linha: str, detalhe: str) -> ValueError:
+    """ValueError que aponta o arquivo e a linha malformada"""
+    return ValueError(f"{caminho}, linha {numero}: {detalhe}: '{linha.strip()}'")
+
+
+def converter_numero(texto: str):
+    """Converte para int quando possível, senão para float"""
+    try:
+        return int(texto)
+    except ValueError:
+        return float(texto)
+
+
+def converter_id(texto: str):
+    """IDs numéricos viram int; os demais ficam como texto"""
+    try:
+        return int(texto)
+    except ValueError:
+        return texto
+
+
+def eh_numero(texto: str) -> bool:
+    """Verifica se o texto representa um número"""
+    try:
+        float(texto)
+        return True
+    except ValueError:
+        return False
+
+
+# ============================================================================
+# LISTA DE ARESTAS (CSV / TEXTO)
+# ============================================================================
+
+def carregar_lista_arestas(caminho: str, grafo: Grafo = None, separador: str = None,
+                           cabecalho: bool = None, peso_padrao=1,
+                           tamanho_bloco: int = TAMANHO_BLOCO_PADRAO) -> tuple:
+    """
+    Carrega uma lista de arestas "v1,v2[,peso]".
+
+    Linhas vazias e iniciadas por '#' ou '%' são ignoradas. Os vértices
+    são criados conforme aparecem.
+
+    Args:
+        separador: ',', ';', '\\t'... (None = vírgula, ponto e vírgula ou espaços)
+        cabecalho: Se a primeira linha é cabeçalho (None = detectar: terceira
+                   coluna não numérica)
+        peso_padrao: Peso das arestas sem terceira coluna
+
+    Returns:
+        (grafo, estatisticas)
+    """
+    grafo = grafo if grafo is not None else Grafo()
+    estatisticas = iniciar_estatisticas('csv', caminho)
+    linhas = ler_linhas(caminho, estatisticas, tamanho_bloco)
+
+    def detectar_separador(linha):
+        if separador is not None:
+            return separador
+        for candidato in (',', ';', '\t'):
+            if candidato in linha:
+                return candidato
+        return None  # Espaços em branco
+
+    def gerar_arestas():
+        vertices = grafo.vertices
+        sep = None
+        primeira = True
+
+        for numero, linha in enumerate(linhas, 1):
+            linha = linha.strip()
+            if not linha or linha[0] in '#%':
+                continue
+
+            if primeira:
+                # Separador e cabeçalho decididos uma única vez
+                primeira = False
+                sep = detectar_separador(linha)
+                campos = linha.split(sep)
+                eh_cabecalho = cabecalho
+                if eh_cabecalho is None:
+                    eh_cabecalho = len(campos) >= 3 and not eh_numero(campos[2])
+                if eh_cabecalho:
+                    continue
+            else:
+                campos = linha.split(sep)
+
+            if len(campos) < 2:
+                raise erro_linha(caminho, numero, linha, "esperado v1,v2[,peso]")
+
+            v1 = converter_id(campos[0].strip())
+            v2 = converter_id(campos[1].strip())
+            try:
+                peso = converter_numero(campos[2]) if len(campos) >= 3 and campos[2].strip() else peso_padrao
+            except ValueError:
+                raise erro_linha(caminho, numero, linha, "peso não numérico") from None
+
+            if v1 not in vertices:
+                grafo.adicionar_vertice(v1)
+            if v2 not in vertices:
+                grafo.adicionar_vertice(v2)
+            yield v1, v2, peso
+
+    grafo.adicionar_arestas_em_lote(gerar_arestas())
+    return grafo, finalizar_estatisticas(estatisticas, grafo)
+
+
+# ============================================================================
+# DIMACS (.gr / .co)
+# ============================================================================
+
+def carregar_dimacs(caminho: str, grafo: Grafo = None, caminho_coordenadas: str = None,
+                    tamanho_bloco: int = TAMANHO_BLOCO_PADRAO) -> tuple:
+    """
+    Carrega um grafo no formato do 9º desafio DIMACS.
+
+    O arquivo .gr tem a linha "p sp n m" e arcos "a u v w"; os arcos nos
+    dois sentidos viram uma única aresta. Se existir um .co com o mesmo
+    nome (ou caminho_coordenadas for informado), as coordenadas
+    "v id x y" (longitude e latitude × 10^6) são carregadas antes.
+
+    Returns:
+        (grafo, estatisticas)
+    """
+    grafo = grafo if grafo is not None else Grafo()
+    estatisticas = iniciar_estatisticas('dimacs', caminho)
+
+    if caminho_coordenadas is None:
+        base = caminho[:-3] if caminho.endswith('.gz') else caminho
+        candidato = os.path.splitext(base)[0] + '.co'
+        for opcao in (candidato, candidato + '.gz'):
+            if os.path.exists(opcao):
+                caminho_coordenadas = opcao
+                break
+
+    if caminho_coordenadas is not None:
+        grafo.adicionar_vertices_em_lote(
+            gerar_coordenadas_dimacs(ler_linhas(caminho_coordenadas, estatisticas, tamanho_bloco),
+                                     caminho_coordenadas)
+        )
+
+    def gerar_arestas():
+        for numero, linha in enumerate(ler_linhas(caminho, estatisticas, tamanho_bloco), 1):
+            if not linha or linha[0] == 'c':
+                continue
+
+            campos = linha.split()
+            if not campos:
+                continue
+            try:
+                if campos[0] == 'a':
+                    aresta = int(campos[1]), int(campos[2]), converter_numero(campos[3])
+                elif campos[0] == 'p':
+                    n = int(campos[2])
+                else:
+                    continue
+            except (ValueError, IndexError):
+                esperado = "esperado 'a u v w'" if campos[0] == 'a' else "esperado 'p sp n m'"
+                raise erro_linha(caminho, numero, linha, esperado) from None
+
+            if campos[0] == 'a':
+                yield aresta
+            else:
+                # Vértices 1..n (os que ainda não vieram do .co)
+                vertices = grafo.vertices
+                grafo.adicionar_vertices_em_lote(
+                    (v, None, None, None) for v in range(1, n + 1) if v not in vertices
+                )
+
+    grafo.adicionar_arestas_em_lote(gerar_arestas())
+    return grafo, finalizar_estatisticas(estatisticas, grafo)
+
+
+def gerar_coordenadas_dimacs(linhas, caminho: str = '.co'):
+    """
+    Gera (id, nome, x, y) a partir das linhas "v id lon lat" de um .co.
+
+    Segue a convenção do Grafo: x = latitude, y = longitude (em graus).
+    """
+    for numero, linha in enumerate(linhas, 1):
+        if not linha or linha[0] != 'v':
+            continue
+        try:
+            _, id_vertice, longitude, latitude = linha.split()
+            coordenada = int(id_vertice), None, int(latitude) / 1e6, int(longitude) / 1e6
+        except ValueError:
+            raise erro_linha(caminho, numero, linha, "esperado 'v id lon lat'") from None
+        yield coordenada
+
+
+# ============================================================================
+# TSPLIB (.tsp)
+# ============================================================================
+
+def distancia_euc_2d(a, b) -> int:
+    return int(math.hypot(a[0] - b[0], a[1] - b[1]) + 0.5)
+
+
+def distancia_ceil_2d(a, b) -> int:
+    return math.ceil(math.hypot(a[0] - b[0], a[1] - b[1]))
+
+
+def distancia_att(a, b) -> int:
+    """Distância pseudo-euclidiana (instâncias att48, att532)"""
+    r = math.sqrt(((a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2) / 10.0)
+    t = int(r + 0.5)
+    return t + 1 if t < r else t
+
+
+def _radianos_geo(valor: float) -> float:
+    """Converte GRAUS.MINUTOS do TSPLIB para radianos"""
+    graus = int(valor)
+    minutos = valor - graus
+    return 3.141592 * (graus + 5.0 * minutos / 3.0) / 180.0
+
+
+def distancia_geo(a, b) -> int:
+    """Distância geográfica do TSPLIB (raio da Terra idealizado)"""
+    lat_a, lon_a = _radianos_geo(a[0]), _radianos_geo(a[1])
+    lat_b, lon_b = _radianos_geo(b[0]), _radianos_geo(b[1])
+    q1 = math.cos(lon_a - lon_b)
+    q2 = math.cos(lat_a - lat_b)
+    q3 = math.cos(lat_a + lat_b)
+    return int(6378.388 * math.acos(0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3)) + 1.0)
+
+
+DISTANCIAS_TSPLIB = {
+    'EUC_2D': distancia_euc_2d,
+    'CEIL_2D': distancia_ceil_2d,
+    'ATT': distancia_att,
+    'GEO': distancia_geo
+}
+
+
+def pares_matriz_pesos(formato: str, n: int):
+    """Gera os pares (i, j) na ordem em que aparecem em EDGE_WEIGHT_SECTION"""
+    if formato == 'FULL_MATRIX':
+        return ((i, j) for i in range(n) for j in range(n))
+    if formato == 'UPPER_ROW':
+        return ((i, j) for i in range(n) for j in range(i + 1, n))
+    if formato == 'LOWER_ROW':
+        return ((i, j) for i in range(n) for j in range(i))
+    if formato == 'UPPER_DIAG_ROW':
+        return ((i, j) for i in range(n) for j in range(i, n))
+    if formato == 'LOWER_DIAG_ROW':
+        return ((i, j) for i in range(n) for j in range(i + 1))
+    raise ValueError(f"EDGE_WEIGHT_FORMAT não suportado: {formato}")
+
+
+def carregar_tsplib(caminho: str, grafo: Grafo = None, completo: bool = None,
+                    tamanho_bloco: int = TAMANHO_BLOCO_PADRAO) -> tuple:
+    """
+    Carrega uma instância TSPLIB (TSP simétrico).
+
+    Com NODE_COORD_SECTION, as distâncias são calculadas pela função do
+    EDGE_WEIGHT_TYPE (EUC_2D, CEIL_2D, ATT, GEO) e o grafo completo é
+    gerado em fluxo. Com EDGE_WEIGHT_SECTION, os pesos são lidos da
+    matriz explícita.
+
+    Args:
+        completo: Gerar as n(n-1)/2 arestas (False carrega só os vértices;
+                  None = só até LIMITE_VERTICES_TSPLIB_COMPLETO vértices,
+                  com um aviso nas estatísticas acima disso)
+
+    Returns:
+        (grafo, estatisticas)
+    """
+    grafo = grafo if grafo is not None else Grafo()
+    estatisticas = iniciar_estatisticas('tsplib', caminho)
+    linhas = enumerate(ler_linhas(caminho, estatisticas, tamanho_bloco), 1)
+
+    especificacao = {}
+    coordenadas = {}  # {id: (x, y)} como no arquivo
+    pesos_explicitos = False
+    dimensao = 0
+
+    for numero, linha in linhas:
+        linha = linha.strip()
+        if not linha:
+            continue
+        if linha == 'EOF':
+            break
+
+        chave, _, valor = linha.partition(':')
+        chave = chave.strip()
+        valor = valor.strip()
+
+        if chave == 'NODE_COORD_SECTION':
+            for numero_no, linha_no in islice(linhas, dimensao):
+                try:
+                    id_vertice, x, y = linha_no.split()[:3]
+                    coordenadas[int(id_vertice)] = (float(x), float(y))
+                except ValueError:
+                    raise erro_linha(caminho, numero_no, linha_no, "esperado 'id x y'") from None
+            # Convenção do Grafo: x vertical, y horizontal
+            grafo.adicionar_vertices_em_lote(
+                (v, None, y, x) for v, (x, y) in coordenadas.items()
+            )
+        elif chave == 'EDGE_WEIGHT_SECTION':
+            pesos_explicitos = True
+            vertices = grafo.vertices
+            grafo.adicionar_vertices_em_lote(
+                (v, None, None, None) for v in range(1, dimensao + 1) if v not in vertices
+            )
+
+            def gerar_pesos():
+                for numero_pesos, linha_pesos in linhas:
+                    for token in linha_pesos.split():
+                        try:
+                            peso = converter_numero(token)
+                        except ValueError:
+                            raise erro_linha(caminho, numero_pesos, linha_pesos,
+                                             f"peso não numérico '{token}'") from None
+                        yield peso
+
+            pares = pares_matriz_pesos(especificacao.get('EDGE_WEIGHT_FORMAT', 'FULL_MATRIX'), dimensao)
+            # Com a matriz explícita os pesos já estão no arquivo: o padrão é carregá-los
+            if completo is None or completo:
+                grafo.adicionar_arestas_em_lote(
+                    (i + 1, j + 1, peso) for (i, j), peso in zip(pares, gerar_pesos()) if i != j
+                )
+            else:
+                for _ in zip(pares, gerar_pesos()):
+                    pass
+        elif chave == 'DISPLAY_DATA_SECTION':
+            for _ in islice(linhas, dimensao):
+                pass
+        elif chave.endswith('_SECTION'):
+            # FIXED_EDGES_SECTION / TOUR_SECTION terminam com -1
+            for _, linha_secao in linhas:
+                if linha_secao.strip() == '-1':
+                    break
+        elif valor:
+            especificacao[chave] = valor
+            if chave == 'DIMENSION':
+                try:
+                    dimensao = int(valor)
+                except ValueError:
+                    raise erro_linha(caminho, numero, linha, "DIMENSION não inteira") from None
+
+    if completo is None and not pesos_explicitos and coordenadas:
+        completo = len(coordenadas) <= LIMITE_VERTICES_TSPLIB_COMPLETO
+        if not completo:
+            estatisticas['aviso'] = (
+                f"{len(coordenadas)} vértices: grafo completo não gerado "
+                f"(seriam {len(coordenadas) * (len(coordenadas) - 1) // 2} arestas; use completo=True)"
+            )
+
+    if completo and not pesos_explicitos and coordenadas:
+        tipo = especificacao.get('EDGE_WEIGHT_TYPE', 'EUC_2D')
+        if tipo not in DISTANCIAS_TSPLIB:
+            raise ValueError(f"EDGE_WEIGHT_TYPE não suportado: {tipo}")
+        distancia = DISTANCIAS_TSPLIB[tipo]
+        ids = list(coordenadas)
+        grafo.adicionar_arestas_em_lote(
+            (ids[i], ids[j], distancia(coordenadas[ids[i]], coordenadas[ids[j]]))
+            for i in range(len(ids)) for j in range(i + 1, len(ids))
+        )
+
+    estatisticas['especificacao'] = especificacao
+    return grafo, finalizar_estatisticas(estatisticas, grafo)
+
+
+# ============================================================================
+# SNAPSHOT BINÁRIO (.snap)
+# ============================================================================
+
+def carregar_snapshot(caminho: str, grafo: Grafo = None, mutavel: bool = False) -> tuple:
+    """
+    Abre um snapshot binário (ver snapshot.py).
+
+    Args:
+        grafo: Grafo a preencher (implica mutavel=True)
+        mutavel: Converter para Grafo; por padrão retorna o GrafoSnapshot
+                 somente leitura, mapeado em memória
+
+    Returns:
+        (grafo, estatisticas)
+    """
+    estatisticas = iniciar_estatisticas('snapshot', caminho)
+    resultado = abrir_snapshot(caminho)
+    estatisticas['bytes'] = os.path.getsize(caminho)
+
+    if grafo is not None or mutavel:
+        snapshot = resultado
+        resultado = snapshot.para_grafo(grafo)
+        snapshot.fechar()
+
+    return resultado, finalizar_estatisticas(estatisticas, resultado)
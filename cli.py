@@ -0,0 +1,323 @@
+"""
+Execução dos algoritmos pela linha de comando (sem interface gráfica)
+Carrega um grafo (arquivo ou grafo embutido), executa planaridade,
+Welsh-Powell, A* ou o AG e imprime o resultado em JSON com os tempos.
+Lotes de tarefas podem ser lidos (uma tarefa JSON por linha) de um
+arquivo ou da entrada padrão.
+
+Exemplos:
+    python cli.py planaridade parana
+    python cli.py a-estrela parana --origem Curitiba --destino Cascavel
+    python cli.py ag trabalho --inicio F --geracoes 50 --semente 1
+    python cli.py lote tarefas.jsonl
+    python cli.py lote tarefas.jsonl --porta-metricas 9464
+    echo '{"algoritmo": "welsh-powell", "grafo": "rede.gr"}' | python cli.py lote -
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+
+from carregador import carregar_grafo
+from planaridade import VerificadorPlanaridade
+from welsh_powell import WelshPowell
+from a_estrela import AEstrela
+from algoritmo_genetico import AlgoritmoGeneticoPCV
+import instrumentacao
+
+
+def resolver_vertice(grafo, referencia):
+    """
+    Encontra o vértice pelo nome ou pelo ID.
+
+    Raises:
+        ValueError: se nenhum vértice corresponder
+    """
+    for v in grafo.obter_todos_vertices():
+        if grafo.obter_nome_vertice(v) == str(referencia):
+            return v
+
+    candidatos = [referencia]
+    try:
+        candidatos.append(int(referencia))
+    except (TypeError, ValueError):
+        pass
+    for candidato in candidatos:
+        if grafo.obter_posicao_vertice(candidato) is not None:
+            return candidato
+
+    raise ValueError(f"Vértice não encontrado: {referencia}")
+
+
+# ============================================================================
+# ALGORITMOS
+# ============================================================================
+
+def executar_planaridade(grafo, tarefa: dict) -> dict:
+    """Verificação de planaridade com certificado (embedding ou Kuratowski)"""
+    verificador = VerificadorPlanaridade(grafo)
+    eh_planar, razao = verificador.verificar_planaridade(tarefa.get('processos'))
+    euler = verificador.obter_caracteristica_euler()
+    blocos = verificador.verificar_planaridade_por_blocos()['blocos']
+
+    resultado = {
+        'planar': eh_planar,
+        'razao': razao,
+        'vertices': euler['vertices'],
+        'arestas': euler['arestas'],
+        'faces': euler['faces'],
+        'caracteristica_euler': euler['caracteristica_euler'],
+        'blocos': len(blocos),
+        'blocos_nao_planares': sum(1 for bloco in blocos if not bloco['planar'])
+    }
+
+    nome = grafo.obter_nome_vertice
+    if eh_planar:
+        if tarefa.get('embedding'):
+            resultado['embedding'] = {
+                nome(v): [nome(w) for w in vizinhos]
+                for v, vizinhos in verificador.obter_embedding().items()
+            }
+    else:
+        kuratowski = verificador.obter_subgrafo_kuratowski()
+        resultado['kuratowski'] = {
+            'tipo': kuratowski['tipo'],
+            'vertices_ramificacao': [nome(v) for v in kuratowski['vertices_ramificacao']],
+            'arestas': [[nome(v1), nome(v2)] for v1, v2 in kuratowski['arestas']]
+        }
+
+    return resultado
+
+
+def executar_welsh_powell(grafo, tarefa: dict) -> dict:
+    """Coloração de Welsh-Powell"""
+    welsh_powell = WelshPowell(grafo, usar_cache=tarefa.get('cache', True))
+    cores = welsh_powell.color_graph()
+    eh_valida, mensagem = welsh_powell.verify_coloring()
+
+    return {
+        'num_cores': welsh_powell.get_chromatic_number(),
+        'valida': eh_valida,
+        'mensagem': mensagem,
+        'cores': {grafo.obter_nome_vertice(v): cor for v, cor in cores.items()}
+    }
+
+
+def executar_a_estrela(grafo, tarefa: dict) -> dict:
+    """Caminho mínimo com A*"""
+    origem = resolver_vertice(grafo, tarefa['origem'])
+    destino = resolver_vertice(grafo, tarefa['destino'])
+
+    a_estrela = AEstrela(grafo, depurar=False)
+    if a_estrela.encontrar_caminho(origem, destino) is None:
+        return {'encontrado': False}
+
+    detalhes = a_estrela.obter_detalhes_caminho()
+    return {
+        'encontrado': True,
+        'caminho': detalhes['caminho'],
+        'custo_total': detalhes['custo_total'],
+        'num_vertices': detalhes['num_vertices']
+    }
+
+
+def executar_algoritmo_genetico(grafo, tarefa: dict) -> dict:
+    """PCV com o Algoritmo Genético"""
+    if tarefa.get('semente') is not None:
+        random.seed(tarefa['semente'])
+
+    inicio = resolver_vertice(grafo, tarefa['inicio']) if 'inicio' in tarefa else \
+        grafo.obter_todos_vertices()[0]
+
+    ag = AlgoritmoGeneticoPCV(
+        grafo, inicio,
+        tamanho_populacao=tarefa.get('populacao', 100),
+        taxa_cruzamento=tarefa.get('taxa_cruzamento', 0.7),
+        taxa_mutacao=tarefa.get('taxa_mutacao', 0.01),
+        intervalo_geracao=tarefa.get('intervalo_geracao', 0.5),
+        usar_cache=tarefa.get('cache', True)
+    )
+    melhor = ag.executar(max_geracoes=tarefa.get('geracoes', 20))
+
+    return {
+        'rota': [grafo.obter_nome_vertice(v) for v in melhor.obter_rota_completa()],
+        'custo': melhor.custo,
+        'geracoes': ag.geracao_atual,
+        'historico_melhor_custo': ag.historico_melhor_custo
+    }
+
+
+ALGORITMOS = {
+    'planaridade': executar_planaridade,
+    'welsh-powell': executar_welsh_powell,
+    'a-estrela': executar_a_estrela,
+    'ag': executar_algoritmo_genetico
+}
+
+
+# ============================================================================
+# EXECUÇÃO DE TAREFAS
+# ============================================================================
+
+def executar_tarefa(tarefa: dict, grafos: dict = None) -> dict:
+    """
+    Executa uma tarefa {'algoritmo', 'grafo', ...parâmetros}.
+
+    Args:
+        grafos: Cache {fonte: (grafo, estatisticas)} compartilhado no lote,
+                para que cada grafo seja carregado uma única vez
+
+    Returns:
+        {'algoritmo', 'grafo', 'ok', 'resultado' ou 'erro', 'tempos'}
+        e, se a tarefa pedir 'instrumentar', os contadores da execução.
+        Qualquer erro da tarefa é devolvido em 'erro', para que o lote continue.
+    """
+    if not isinstance(tarefa, dict):
+        return {'ok': False, 'erro': f"A tarefa deve ser um objeto JSON, não {type(tarefa).__name__}"}
+
+    grafos = grafos if grafos is not None else {}
+    saida = {'algoritmo': tarefa.get('algoritmo'), 'grafo': tarefa.get('grafo'), 'ok': False}
+    tempos = {}
+    instrumentar = bool(tarefa.get('instrumentar'))
+    estava_ativa = instrumentacao.ativa
+    antes = None
+
+    try:
+        if saida['algoritmo'] not in ALGORITMOS:
+            raise ValueError(f"Algoritmo desconhecido: {saida['algoritmo']} "
+                             f"(opções: {', '.join(ALGORITMOS)})")
+        if not saida['grafo']:
+            raise ValueError("Tarefa sem grafo")
+
+        inicio = time.perf_counter()
+        if saida['grafo'] not in grafos:
+            grafos[saida['grafo']] = carregar_grafo(saida['grafo'])
+        grafo, _ = grafos[saida['grafo']]
+        tempos['carga_s'] = time.perf_counter() - inicio
+
+        if instrumentar:
+            # Os totais globais não são zerados: a saída traz só o que a tarefa somou
+            instrumentacao.ativar()
+            antes = instrumentacao.instantaneo()
+
+        inicio = time.perf_counter()
+        saida['resultado'] = ALGORITMOS[saida['algoritmo']](grafo, tarefa)
+        tempos['execucao_s'] = time.perf_counter() - inicio
+        saida['ok'] = True
+    except Exception as erro:
+        saida['erro'] = f"{type(erro).__name__}: {erro}"
+    finally:
+        if antes is not None:
+            saida['instrumentacao'] = instrumentacao.diferenca(antes, instrumentacao.instantaneo())
+            if not estava_ativa:
+                instrumentacao.desativar()
+
+    saida['tempos'] = tempos
+    return saida
+
+
+def ler_tarefas(entrada):
+    """Gera as tarefas de um arquivo JSON Lines (linhas vazias e '#' ignoradas)"""
+    for numero, linha in enumerate(entrada, 1):
+        linha = linha.strip()
+        if not linha or linha.startswith('#'):
+            continue
+        try:
+            yield json.loads(linha)
+        except json.JSONDecodeError as erro:
+            yield {'algoritmo': None, 'grafo': None, 'linha': numero, 'invalida': str(erro)}
+
+
+def executar_lote(entrada, saida) -> bool:
+    """
+    Executa as tarefas do lote, escrevendo um resultado JSON por linha.
+
+    Returns:
+        True se todas as tarefas foram concluídas
+    """
+    grafos = {}
+    todas_ok = True
+
+    for tarefa in ler_tarefas(entrada):
+        if isinstance(tarefa, dict) and 'invalida' in tarefa:
+            resultado = {'ok': False, 'erro': f"JSON inválido na linha {tarefa['linha']}: {tarefa['invalida']}"}
+        else:
+            resultado = executar_tarefa(tarefa, grafos)
+        todas_ok = todas_ok and resultado['ok']
+        saida.write(json.dumps(resultado, ensure_ascii=False, default=str) + '\n')
+        saida.flush()
+
+    return todas_ok
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    """Argumentos da linha de comando"""
+    parser = argparse.ArgumentParser(
+        description="Executa os algoritmos de grafos sem interface gráfica (saída JSON)"
+    )
+    subparsers = parser.add_subparsers(dest='comando', required=True)
+
+    def adicionar_grafo(sub):
+        sub.add_argument('grafo', help="Arquivo (.csv, .gr, .tsp, .snap) ou grafo embutido (trabalho, parana)")
+        sub.add_argument('--sem-cache', dest='cache', action='store_false',
+                         help="Não usar o cache de artefatos (ativado com GRAFOS_CACHE=1)")
+        sub.add_argument('--instrumentar', action='store_true',
+                         help="Incluir contadores e tempos por fase na saída")
+
+    sub = subparsers.add_parser('planaridade', help="Verificar planaridade")
+    adicionar_grafo(sub)
+    sub.add_argument('--embedding', action='store_true', help="Incluir o embedding planar")
+    sub.add_argument('--processos', type=int, help="Processos para o teste por blocos")
+
+    sub = subparsers.add_parser('welsh-powell', help="Coloração de Welsh-Powell")
+    adicionar_grafo(sub)
+
+    sub = subparsers.add_parser('a-estrela', help="Caminho mínimo com A*")
+    adicionar_grafo(sub)
+    sub.add_argument('--origem', required=True, help="Nome ou ID do vértice de origem")
+    sub.add_argument('--destino', required=True, help="Nome ou ID do vértice de destino")
+
+    sub = subparsers.add_parser('ag', help="PCV com Algoritmo Genético")
+    adicionar_grafo(sub)
+    sub.add_argument('--inicio', help="Nome ou ID da cidade inicial")
+    sub.add_argument('--populacao', type=int, default=100)
+    sub.add_argument('--geracoes', type=int, default=20)
+    sub.add_argument('--taxa-cruzamento', type=float, default=0.7)
+    sub.add_argument('--taxa-mutacao', type=float, default=0.01)
+    sub.add_argument('--intervalo-geracao', type=float, default=0.5)
+    sub.add_argument('--semente', type=int, help="Semente aleatória (resultado reprodutível)")
+
+    sub = subparsers.add_parser('lote', help="Executar tarefas JSON Lines de um arquivo ou '-' (stdin)")
+    sub.add_argument('arquivo', help="Arquivo de tarefas ou '-' para a entrada padrão")
+    sub.add_argument('--porta-metricas', type=int,
+                     help="Ativar a instrumentação e servir /metrics (Prometheus) nesta porta")
+
+    return parser
+
+
+def main(argv=None) -> int:
+    args = criar_parser().parse_args(argv)
+
+    if args.comando == 'lote':
+        if args.porta_metricas is not None:
+            instrumentacao.ativar()
+            instrumentacao.iniciar_servidor(args.porta_metricas)
+        if args.arquivo == '-':
+            ok = executar_lote(sys.stdin, sys.stdout)
+        else:
+            with open(args.arquivo, encoding='utf-8') as entrada:
+                ok = executar_lote(entrada, sys.stdout)
+        return 0 if ok else 1
+
+    tarefa = {chave: valor for chave, valor in vars(args).items()
+              if chave != 'comando' and valor is not None}
+    tarefa['algoritmo'] = args.comando
+    resultado = executar_tarefa(tarefa)
+    print(json.dumps(resultado, ensure_ascii=False, indent=2, default=str))
+    return 0 if resultado['ok'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""
+Execução do Algoritmo Genético em segundo plano
+O AG roda em uma thread de trabalho e publica as estatísticas de cada
+geração em uma fila. A interface consulta a fila periodicamente (com
+after() no Tkinter) e nunca bloqueia: a evolução segue na velocidade
+máxima independentemente de quantas vezes a tela é redesenhada.
+
+Pausa, retomada e cancelamento são verificados entre gerações.
+"""
+
+import queue
+import threading
+
+
+class ExecucaoAG:
+    """
+    Executa gerações de um AlgoritmoGeneticoPCV em uma thread.
+
+    Mensagens publicadas na fila (tipo, dados):
+        ('geracao', estatísticas de obter_estatisticas_geracao())
+        ('pausa', número da geração)
+        ('fim', {'geracao', 'cancelado'})
+        ('erro', mensagem)
+    """
+
+    def __init__(self, ag, max_geracoes: int, continuar: bool = False, pausar_a_cada: int = None):
+        """
+        Args:
+            ag: AlgoritmoGeneticoPCV (só deve ser lido pela interface após o 'fim')
+            max_geracoes: Gerações a evoluir nesta execução
+            continuar: Evoluir a população atual em vez de criar uma nova
+            pausar_a_cada: Pausar automaticamente a cada N gerações (None = nunca)
+        """
+        self.ag = ag
+        self.max_geracoes = max_geracoes
+        self.continuar = continuar
+        self.pausar_a_cada = pausar_a_cada
+        self.fila = queue.Queue()
+
+        self._liberado = threading.Event()  # Limpo = pausado
+        self._liberado.set()
+        self._cancelado = threading.Event()
+        self._thread = threading.Thread(target=self._executar, name='ag', daemon=True)
+
+    def iniciar(self):
+        self._thread.start()
+
+    def pausar(self):
+        self._liberado.clear()
+
+    def retomar(self):
+        self._liberado.set()
+
+    def cancelar(self):
+        """Interrompe após a geração em andamento (também se estiver pausado)"""
+        self._cancelado.set()
+        self._liberado.set()
+
+    @property
+    def pausado(self) -> bool:
+        return not self._liberado.is_set()
+
+    @property
+    def ativo(self) -> bool:
+        return self._thread.is_alive()
+
+    def aguardar(self, tempo_limite: float = None):
+        self._thread.join(tempo_limite)
+
+    def obter_mensagens(self) -> list:
+        """Retira da fila, sem bloquear, todas as mensagens pendentes"""
+        mensagens = []
+        while True:
+            try:
+                mensagens.append(self.fila.get_nowait())
+            except queue.Empty:
+                return mensagens
+
+    def _publicar(self):
+        self.fila.put(('geracao', self.ag.obter_estatisticas_geracao()))
+
+    def _executar(self):
+        try:
+            if not self.continuar:
+                self.ag.inicializar_populacao()
+                self._publicar()
+
+            for i in range(1, self.max_geracoes + 1):
+                if not self._liberado.is_set():
+                    self.fila.put(('pausa', self.ag.geracao_atual))
+                    self._liberado.wait()
+                if self._cancelado.is_set():
+                    break
+
+                self.ag.evoluir_geracao()
+                self._publicar()
+
+                if self.pausar_a_cada and i % self.pausar_a_cada == 0 and i < self.max_geracoes:
+                    self.pausar()
+        except Exception as erro:
+            self.fila.put(('erro', f"{type(erro).__name__}: {erro}"))
+            return
+
+        self.fila.put(('fim', {'geracao': self.ag.geracao_atual,
+                               'cancelado': self._cancelado.is_set()}))
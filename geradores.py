@@ -0,0 +1,224 @@
+"""
+Geradores de grafos sintéticos escaláveis
+- geométrico aleatório (pontos uniformes no plano ligados por raio)
+- grade (malha viária com pesos perturbados)
+- Erdős–Rényi G(n, p), com amostragem geométrica O(n + m)
+- triangulação planar (rede apoloniana, planar maximal)
+- Petersen generalizado GP(n, k) (cúbico)
+Todos usam IDs 0..n-1, coordenadas (x, y) e o caminho em lote do Grafo.
+Os pesos nunca são menores que a distância de Manhattan × 100 entre os
+extremos, de modo que a heurística do A* continua admissível.
+"""
+
+import math
+import random
+
+from grafo import Grafo
+
+
+def _peso_manhattan(a, b, fator: float = 1.0) -> int:
+    """Distância de Manhattan × 100 (escala de dados.py), multiplicada pelo fator"""
+    return max(1, math.ceil((abs(a[0] - b[0]) + abs(a[1] - b[1])) * 100 * fator))
+
+
+def _criar_vertices(grafo: Grafo, posicoes: list):
+    grafo.adicionar_vertices_em_lote((i, str(i), x, y) for i, (x, y) in enumerate(posicoes))
+
+
+def gerar_geometrico_aleatorio(n: int, raio: float = None, semente: int = None) -> Grafo:
+    """
+    Grafo geométrico aleatório: n pontos uniformes no quadrado [0, 10]²,
+    ligados quando a distância euclidiana é no máximo o raio.
+
+    Os pontos são distribuídos em células de lado = raio, então só as 9
+    células vizinhas são comparadas (tempo esperado O(n + m)).
+
+    Args:
+        raio: Raio de conexão (padrão: ~1.5× o limiar de conectividade)
+    """
+    aleatorio = random.Random(semente)
+    lado = 10.0
+    if raio is None:
+        raio = lado * 1.5 * math.sqrt(math.log(max(n, 2)) / (math.pi * max(n, 1)))
+
+    posicoes = [(aleatorio.uniform(0, lado), aleatorio.uniform(0, lado)) for _ in range(n)]
+    grafo = Grafo()
+    _criar_vertices(grafo, posicoes)
+
+    celulas = {}
+    for i, (x, y) in enumerate(posicoes):
+        celulas.setdefault((int(x / raio), int(y / raio)), []).append(i)
+
+    def gerar_arestas():
+        raio2 = raio * raio
+        for (cx, cy), membros in celulas.items():
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    vizinhos = celulas.get((cx + dx, cy + dy))
+                    if not vizinhos:
+                        continue
+                    for i in membros:
+                        xi, yi = posicoes[i]
+                        for j in vizinhos:
+                            if j <= i:
+                                continue
+                            xj, yj = posicoes[j]
+                            if (xi - xj) ** 2 + (yi - yj) ** 2 <= raio2:
+                                yield i, j, _peso_manhattan(posicoes[i], posicoes[j])
+
+    grafo.adicionar_arestas_em_lote(gerar_arestas())
+    return grafo
+
+
+def gerar_grade(linhas: int, colunas: int = None, perturbacao: float = 0.5,
+                semente: int = None) -> Grafo:
+    """
+    Malha viária em grade linhas × colunas.
+
+    O vértice (i, j) tem ID i·colunas + j. Cada trecho tem peso igual ao
+    comprimento × 100 multiplicado por um fator aleatório em [1, 1 + perturbacao].
+    """
+    colunas = colunas if colunas is not None else linhas
+    aleatorio = random.Random(semente)
+    espacamento = 0.1
+
+    posicoes = [(i * espacamento, j * espacamento) for i in range(linhas) for j in range(colunas)]
+    grafo = Grafo()
+    _criar_vertices(grafo, posicoes)
+
+    def gerar_arestas():
+        for i in range(linhas):
+            for j in range(colunas):
+                v = i * colunas + j
+                if j + 1 < colunas:
+                    yield v, v + 1, _peso_manhattan(posicoes[v], posicoes[v + 1],
+                                                    1 + aleatorio.random() * perturbacao)
+                if i + 1 < linhas:
+                    yield v, v + colunas, _peso_manhattan(posicoes[v], posicoes[v + colunas],
+                                                          1 + aleatorio.random() * perturbacao)
+
+    grafo.adicionar_arestas_em_lote(gerar_arestas())
+    return grafo
+
+
+def gerar_erdos_renyi(n: int, p: float = None, grau_medio: float = 4.0,
+                      semente: int = None) -> Grafo:
+    """
+    Grafo aleatório G(n, p) com coordenadas aleatórias para visualização.
+
+    Usa a amostragem geométrica de Batagelj e Brandes: o salto até a próxima
+    aresta presente segue uma distribuição geométrica, então o tempo é
+    O(n + m) em vez de O(n²).
+
+    Args:
+        p: Probabilidade de cada aresta (padrão: grau_medio / (n - 1))
+    """
+    aleatorio = random.Random(semente)
+    if p is None:
+        p = min(1.0, grau_medio / max(n - 1, 1))
+
+    posicoes = [(aleatorio.uniform(0, 10), aleatorio.uniform(0, 10)) for _ in range(n)]
+    grafo = Grafo()
+    _criar_vertices(grafo, posicoes)
+
+    def gerar_arestas():
+        if p <= 0:
+            return
+        if p >= 1:
+            for v in range(n):
+                for w in range(v):
+                    yield v, w, _peso_manhattan(posicoes[v], posicoes[w])
+            return
+
+        log_q = math.log(1.0 - p)
+        v, w = 1, -1
+        while v < n:
+            w += 1 + int(math.log(1.0 - aleatorio.random()) / log_q)
+            while w >= v and v < n:
+                w -= v
+                v += 1
+            if v < n:
+                yield v, w, _peso_manhattan(posicoes[v], posicoes[w])
+
+    grafo.adicionar_arestas_em_lote(gerar_arestas())
+    return grafo
+
+
+def gerar_triangulacao_planar(n: int, semente: int = None) -> Grafo:
+    """
+    Triangulação planar maximal (rede apoloniana aleatória) com E = 3n - 6.
+
+    Começa por um triângulo e insere cada novo vértice dentro de uma face
+    triangular sorteada, ligando-o aos três cantos da face.
+    """
+    aleatorio = random.Random(semente)
+    n = max(n, 3)
+
+    posicoes = [(0.0, 0.0), (10.0, 0.0), (5.0, 10.0)]
+    arestas = [(0, 1), (1, 2), (0, 2)]
+    faces = [(0, 1, 2)]
+
+    for v in range(3, n):
+        indice_face = aleatorio.randrange(len(faces))
+        a, b, c = faces[indice_face]
+
+        # Ponto interior por pesos baricêntricos aleatórios
+        pesos = [aleatorio.random() + 0.1 for _ in range(3)]
+        total = sum(pesos)
+        posicoes.append(tuple(
+            sum(peso * posicoes[canto][eixo] for peso, canto in zip(pesos, (a, b, c))) / total
+            for eixo in (0, 1)
+        ))
+
+        arestas.extend([(v, a), (v, b), (v, c)])
+        faces[indice_face] = (a, b, v)
+        faces.append((b, c, v))
+        faces.append((a, c, v))
+
+    grafo = Grafo()
+    _criar_vertices(grafo, posicoes)
+    grafo.adicionar_arestas_em_lote(
+        (v1, v2, _peso_manhattan(posicoes[v1], posicoes[v2])) for v1, v2 in arestas
+    )
+    return grafo
+
+
+def gerar_petersen_generalizado(n: int, k: int = 2) -> Grafo:
+    """
+    Grafo de Petersen generalizado GP(n, k), cúbico, com 2n vértices.
+
+    Ciclo externo u_i - u_{i+1}, raios u_i - v_i e estrela interna
+    v_i - v_{i+k}. GP(5, 2) é o grafo de Petersen.
+    """
+    k = k % n if n else 0
+    if n < 3 or k == 0 or 2 * k == n:
+        raise ValueError("GP(n, k) requer n ≥ 3 e 0 < k < n/2")
+
+    posicoes = []
+    for raio in (10.0, 5.0):
+        for i in range(n):
+            angulo = 2 * math.pi * i / n
+            posicoes.append((5.0 + raio * math.sin(angulo), 5.0 + raio * math.cos(angulo)))
+
+    grafo = Grafo()
+    _criar_vertices(grafo, posicoes)
+
+    def gerar_arestas():
+        for i in range(n):
+            for v1, v2 in ((i, (i + 1) % n), (i, n + i), (n + i, n + (i + k) % n)):
+                yield v1, v2, _peso_manhattan(posicoes[v1], posicoes[v2])
+
+    grafo.adicionar_arestas_em_lote(gerar_arestas())
+    return grafo
+
+
+# Nome -> função que gera um grafo com aproximadamente n vértices
+GERADORES = {
+    'geometrico': lambda n, semente=None: gerar_geometrico_aleatorio(n, semente=semente),
+    'grade': lambda n, semente=None: gerar_grade(max(1, round(math.sqrt(n))), semente=semente),
+    'erdos_renyi': lambda n, semente=None: gerar_erdos_renyi(n, semente=semente),
+    'triangulacao': lambda n, semente=None: gerar_triangulacao_planar(n, semente=semente),
+    'petersen': lambda n, semente=None: gerar_petersen_generalizado(
+        max(3, n // 2), 1 if max(3, n // 2) == 4 else 2
+    )
+}
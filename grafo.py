@@ -1,3 +1,6 @@
+import gc
+
+
 class Grafo:
     """Classe para representação de um grafo não direcionado"""
     
@@ -5,6 +8,8 @@ class Grafo:
         self.vertices = {}  # {vertice: {'x': x, 'y': y, 'nome': nome}}
         self.arestas = []  # [(v1, v2, peso)]
         self.lista_adjacencia = {}  # {vertice: [(vizinho, peso)]}
+        self.pesos = {}  # {(v1, v2): peso} nos dois sentidos (busca O(1))
+        self.versao = 0  # Incrementada a cada modificação (invalida caches)
         
     def adicionar_vertice(self, id_vertice, nome=None, x=None, y=None):
         """Adiciona um vértice ao grafo"""
@@ -13,6 +18,7 @@ class Grafo:
             'x': x,
             'y': y
         }
+        self.versao += 1
         if id_vertice not in self.lista_adjacencia:
             self.lista_adjacencia[id_vertice] = []
             
@@ -22,10 +28,67 @@ class Grafo:
             raise ValueError("Vértices devem existir antes de adicionar aresta")
         
         # Evita arestas duplicadas
-        if not any((v1 == a[0] and v2 == a[1]) or (v1 == a[1] and v2 == a[0]) for a in self.arestas):
+        if (v1, v2) not in self.pesos:
             self.arestas.append((v1, v2, peso))
             self.lista_adjacencia[v1].append((v2, peso))
             self.lista_adjacencia[v2].append((v1, peso))
+            self.pesos[(v1, v2)] = peso
+            self.pesos[(v2, v1)] = peso
+            self.versao += 1
+    
+    def adicionar_vertices_em_lote(self, vertices):
+        """
+        Adiciona vários vértices de uma vez.
+        
+        Args:
+            vertices: Iterável de (id_vertice, nome, x, y)
+        """
+        for id_vertice, nome, x, y in vertices:
+            self.vertices[id_vertice] = {
+                'nome': nome if nome else str(id_vertice),
+                'x': x,
+                'y': y
+            }
+            if id_vertice not in self.lista_adjacencia:
+                self.lista_adjacencia[id_vertice] = []
+        self.versao += 1
+    
+    def adicionar_arestas_em_lote(self, arestas):
+        """
+        Adiciona várias arestas de uma vez (ignorando duplicadas).
+        
+        Args:
+            arestas: Iterável de (v1, v2, peso)
+        
+        Returns:
+            Número de arestas efetivamente adicionadas
+        """
+        vertices = self.vertices
+        pesos = self.pesos
+        adjacencia = self.lista_adjacencia
+        lista_arestas = self.arestas
+        tamanho_inicial = len(lista_arestas)
+        self.versao += 1
+        
+        # Só são criados objetos que sobrevivem: pausar a coleta de ciclos
+        gc_ativo = gc.isenabled()
+        gc.disable()
+        try:
+            for v1, v2, peso in arestas:
+                if (v1, v2) in pesos:
+                    continue
+                if v1 not in vertices or v2 not in vertices:
+                    raise ValueError("Vértices devem existir antes de adicionar aresta")
+                pesos[(v1, v2)] = peso
+                pesos[(v2, v1)] = peso
+                adjacencia[v1].append((v2, peso))
+                adjacencia[v2].append((v1, peso))
+                lista_arestas.append((v1, v2, peso))
+        finally:
+            if gc_ativo:
+                gc.enable()
+        
+        return len(lista_arestas) - tamanho_inicial
             
     def obter_posicao_vertice(self, id_vertice):
         """Retorna as coordenadas (x, y) de um vértice"""
@@ -47,10 +110,7 @@ class Grafo:
     
     def obter_peso_aresta(self, v1, v2):
         """Retorna o peso da aresta entre dois vértices"""
-        for aresta in self.arestas:
-            if (aresta[0] == v1 and aresta[1] == v2) or (aresta[0] == v2 and aresta[1] == v1):
-                return aresta[2]
-        return None
+        return self.pesos.get((v1, v2))
     
     def obter_grau(self, id_vertice):
         """Retorna o grau de um vértice"""
@@ -0,0 +1,222 @@
+"""
+Instrumentação opcional dos algoritmos
+Contadores dos laços críticos (nós expandidos do A*, avaliações do AG,
+verificações de adjacência do Welsh-Powell, visitas da DFS de
+planaridade) e cronômetros por fase. Desativada por padrão: os
+algoritmos só consultam a flag uma vez por chamada e acumulam os
+contadores em variáveis locais, então o custo desligado é desprezível.
+
+Os valores podem ser lidos como dicionário (instantaneo) ou no formato
+texto do Prometheus, servido por um endpoint HTTP local.
+
+Variáveis de ambiente:
+    GRAFOS_INSTRUMENTACAO  '1' ativa a instrumentação na importação
+
+Uso:
+    import instrumentacao
+    instrumentacao.ativar()
+    ...executa os algoritmos...
+    print(instrumentacao.instantaneo())
+    instrumentacao.iniciar_servidor(9464)  # GET /metrics
+"""
+
+import functools
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+
+ativa = os.environ.get('GRAFOS_INSTRUMENTACAO', '0') == '1'
+
+# {nome: total}
+contadores = {}
+
+# {nome: {'chamadas', 'total_s', 'maximo_s'}}
+fases = {}
+
+_trava = threading.Lock()
+
+
+def ativar():
+    global ativa
+    ativa = True
+
+
+def desativar():
+    global ativa
+    ativa = False
+
+
+def reiniciar():
+    """Zera contadores e cronômetros"""
+    with _trava:
+        contadores.clear()
+        fases.clear()
+
+
+def contar(nome: str, quantidade: int = 1):
+    """Soma quantidade ao contador (chamado fora dos laços, com totais locais)"""
+    with _trava:
+        contadores[nome] = contadores.get(nome, 0) + quantidade
+
+
+def registrar_fase(nome: str, segundos: float):
+    with _trava:
+        fase = fases.get(nome)
+        if fase is None:
+            fases[nome] = {'chamadas': 1, 'total_s': segundos, 'maximo_s': segundos}
+        else:
+            fase['chamadas'] += 1
+            fase['total_s'] += segundos
+            fase['maximo_s'] = max(fase['maximo_s'], segundos)
+
+
+@contextmanager
+def _cronometrar(nome: str):
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        registrar_fase(nome, time.perf_counter() - inicio)
+
+
+@contextmanager
+def _sem_cronometro():
+    yield
+
+
+def fase(nome: str):
+    """
+    Cronômetro de um trecho: with instrumentacao.fase('planaridade.teste'): ...
+
+    Desativada, retorna um contexto vazio.
+    """
+    return _cronometrar(nome) if ativa else _sem_cronometro()
+
+
+def medir_fase(nome: str):
+    """Decorador que cronometra cada chamada da função como uma fase"""
+    def decorador(funcao):
+        @functools.wraps(funcao)
+        def envoltorio(*args, **kwargs):
+            if not ativa:
+                return funcao(*args, **kwargs)
+            with _cronometrar(nome):
+                return funcao(*args, **kwargs)
+        return envoltorio
+    return decorador
+
+
+class ContadorChamadas:
+    """
+    Envolve uma função contando as chamadas (ex.: heapq.heappush).
+
+    Só é usado com a instrumentação ativa; desativada, o algoritmo chama
+    a função original diretamente.
+    """
+
+    def __init__(self, funcao):
+        self.funcao = funcao
+        self.total = 0
+
+    def __call__(self, *args):
+        self.total += 1
+        return self.funcao(*args)
+
+
+def instantaneo() -> dict:
+    """Cópia dos contadores e cronômetros atuais"""
+    with _trava:
+        return {
+            'ativa': ativa,
+            'contadores': dict(contadores),
+            'fases': {nome: dict(valores) for nome, valores in fases.items()}
+        }
+
+
+def diferenca(antes: dict, depois: dict) -> dict:
+    """
+    Contadores e cronômetros acumulados entre dois instantâneos, sem zerar
+    os totais globais (que podem estar sendo expostos em /metrics).
+    """
+    contadores_delta = {}
+    for nome, total in depois['contadores'].items():
+        delta = total - antes['contadores'].get(nome, 0)
+        if delta:
+            contadores_delta[nome] = delta
+
+    fases_delta = {}
+    for nome, valores in depois['fases'].items():
+        anteriores = antes['fases'].get(nome, {'chamadas': 0, 'total_s': 0.0})
+        chamadas = valores['chamadas'] - anteriores['chamadas']
+        if chamadas:
+            fases_delta[nome] = {'chamadas': chamadas,
+                                 'total_s': valores['total_s'] - anteriores['total_s']}
+
+    return {'ativa': depois['ativa'], 'contadores': contadores_delta, 'fases': fases_delta}
+
+
+def _nome_metrica(nome: str) -> str:
+    return 'grafos_' + ''.join(c if c.isascii() and (c.isalnum() or c == '_') else '_' for c in nome)
+
+
+def formatar_prometheus() -> str:
+    """Contadores e fases no formato de exposição texto do Prometheus"""
+    dados = instantaneo()
+    linhas = []
+
+    for nome, total in sorted(dados['contadores'].items()):
+        metrica = _nome_metrica(nome) + '_total'
+        linhas.append(f"# TYPE {metrica} counter")
+        linhas.append(f"{metrica} {total}")
+
+    if dados['fases']:
+        for sufixo, chave in (('segundos_total', 'total_s'), ('chamadas_total', 'chamadas'),
+                              ('maximo_segundos', 'maximo_s')):
+            metrica = f"grafos_fase_{sufixo}"
+            tipo = 'gauge' if chave == 'maximo_s' else 'counter'
+            linhas.append(f"# TYPE {metrica} {tipo}")
+            for nome, valores in sorted(dados['fases'].items()):
+                linhas.append(f'{metrica}{{fase="{nome}"}} {valores[chave]}')
+
+    return "\n".join(linhas) + "\n"
+
+
+def iniciar_servidor(porta: int = 9464, endereco: str = '127.0.0.1'):
+    """
+    Serve as métricas em uma thread de fundo.
+
+    GET /metrics devolve o texto do Prometheus e GET /instantaneo o JSON.
+
+    Returns:
+        O servidor (server.shutdown() encerra; server.server_address
+        informa a porta quando porta=0)
+    """
+    # Só carregados quando o endpoint é usado
+    import json
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Manipulador(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == '/metrics':
+                corpo = formatar_prometheus().encode()
+                tipo = 'text/plain; version=0.0.4; charset=utf-8'
+            elif self.path == '/instantaneo':
+                corpo = json.dumps(instantaneo(), ensure_ascii=False).encode()
+                tipo = 'application/json'
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', tipo)
+            self.send_header('Content-Length', str(len(corpo)))
+            self.end_headers()
+            self.wfile.write(corpo)
+
+        def log_message(self, formato, *args):
+            pass  # Sem log por requisição no stderr
+
+    servidor = ThreadingHTTPServer((endereco, porta), Manipulador)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    return servidor
@@ -0,0 +1,291 @@
+"""
+Layout automático por forças (Fruchterman-Reingold)
+Calcula posições para grafos sem coordenadas (ex.: criados à mão ou
+carregados de listas de arestas). Arestas atraem as extremidades com
+força d²/k e todos os pares de vértices se repelem com força k²/d; a
+temperatura (deslocamento máximo por iteração) cai linearmente até zero.
+
+A repulsão entre todos os pares, O(V²), é aproximada com Barnes-Hut:
+uma quadtree com a massa e o centro de massa de cada célula, em que uma
+célula distante (lado/distância < theta) age como um único vértice. A
+árvore é montada nível a nível e percorrida para todos os vértices ao
+mesmo tempo, com arrays NumPy de pares (vértice, célula), sem laço
+Python por vértice.
+
+As posições seguem a convenção de VisualizadorGrafo.posicoes ({vertice:
+[x, y]}, x = longitude), então podem ser salvas como posicoes_salvas.
+"""
+
+import math
+import weakref
+
+import numpy as np
+
+
+THETA_PADRAO = 1.0
+GRAVIDADE_PADRAO = 0.1  # Atração ao centro: mantém componentes desconexos por perto
+FRACAO_TEMPERATURA = 0.1  # Deslocamento máximo inicial, em fração do quadro inicial
+MASSA_MAXIMA_FOLHA = 8  # Acima disso a quadtree ganha níveis (pares exatos nas folhas)
+NIVEIS_MAXIMOS = 24  # Limite de profundidade (vértices sobrepostos nunca se separam)
+ORCAMENTO_ITERACOES = 200_000  # Vértices × iterações do layout padrão
+ITERACOES_MINIMAS = 10
+ITERACOES_MAXIMAS = 200
+
+# Cache de posicoes_do_grafo: {grafo: (versao, posicoes)}
+_cache_posicoes = weakref.WeakKeyDictionary()
+
+
+def iteracoes_padrao(n: int) -> int:
+    """
+    Iterações inversamente proporcionais a V (cada uma custa O(V log V + E)).
+
+    Em grafos grandes o deslocamento de quase todos os vértices fica preso
+    à temperatura até o fim, e iterações extras quase não melhoram o
+    desenho: o orçamento mantém o primeiro desenho na casa dos segundos.
+    """
+    return max(ITERACOES_MINIMAS, min(ITERACOES_MAXIMAS, ORCAMENTO_ITERACOES // max(n, 1)))
+
+
+def _intercalar_bits(valores):
+    """Espalha os 32 bits baixos nas posições pares (metade de um código de Morton)"""
+    v = valores.astype(np.uint64) & np.uint64(0xFFFFFFFF)
+    for deslocamento, mascara in ((16, 0x0000FFFF0000FFFF), (8, 0x00FF00FF00FF00FF),
+                                  (4, 0x0F0F0F0F0F0F0F0F), (2, 0x3333333333333333),
+                                  (1, 0x5555555555555555)):
+        v = (v | (v << np.uint64(deslocamento))) & np.uint64(mascara)
+    return v
+
+
+def _montar_quadtree(xs, ys, niveis: int) -> list:
+    """
+    Quadtree até niveis, representada só pelas células não vazias.
+
+    As células são identificadas pelo código de Morton (ordem Z), em que
+    a chave do pai é a do filho deslocada 2 bits: com os vértices ordenados
+    pela chave do nível mais fino, todos os níveis ficam ordenados e os
+    filhos de uma célula são consecutivos no nível seguinte.
+
+    Returns:
+        Lista por nível de (célula de cada vértice, massa, centro x, centro y,
+        lado da célula, primeiro filho, número de filhos)
+    """
+    x0, y0 = xs.min(), ys.min()
+    lado = max(xs.max() - x0, ys.max() - y0, 1e-9) * (1 + 1e-9)
+    m = 1 << niveis
+    ix = np.minimum(((xs - x0) * (m / lado)).astype(np.int64), m - 1)
+    iy = np.minimum(((ys - y0) * (m / lado)).astype(np.int64), m - 1)
+    chaves_finas = (_intercalar_bits(ix) << np.uint64(1)) | _intercalar_bits(iy)
+    ordem = np.argsort(chaves_finas)
+    ordenadas = chaves_finas[ordem]
+
+    arvore = []
+    for nivel in range(niveis + 1):
+        chaves = ordenadas >> np.uint64(2 * (niveis - nivel))
+        novas = np.empty(len(chaves), dtype=bool)
+        novas[0] = True
+        novas[1:] = chaves[1:] != chaves[:-1]
+        celula = np.empty(len(xs), dtype=np.int64)
+        celula[ordem] = np.cumsum(novas) - 1
+        num_celulas = int(celula.max()) + 1
+        massa = np.bincount(celula, minlength=num_celulas)
+        cx = np.bincount(celula, weights=xs, minlength=num_celulas) / massa
+        cy = np.bincount(celula, weights=ys, minlength=num_celulas) / massa
+        arvore.append([chaves[novas], celula, massa, cx, cy, lado / (1 << nivel)])
+
+    # Filhos de cada célula: faixa consecutiva de chaves no nível seguinte
+    for nivel in range(niveis):
+        chaves, chaves_filhos = arvore[nivel][0], arvore[nivel + 1][0]
+        primeiro = np.searchsorted(chaves_filhos, chaves << np.uint64(2))
+        ultimo = np.searchsorted(chaves_filhos, (chaves + np.uint64(1)) << np.uint64(2))
+        arvore[nivel] += [primeiro, ultimo - primeiro]
+    return [tuple(dados[1:]) for dados in arvore]
+
+
+def _expandir(vertices, celulas, primeiros, contagens):
+    """Troca cada par (vértice, célula) pelos pares (vértice, item) dos itens da célula"""
+    quantidade = contagens[celulas]
+    inicio_par = np.repeat(np.cumsum(quantidade) - quantidade, quantidade)
+    itens = np.repeat(primeiros[celulas], quantidade) + np.arange(quantidade.sum()) - inicio_par
+    return np.repeat(vertices, quantidade), itens
+
+
+def forcas_repulsao(xs, ys, k: float, theta: float = THETA_PADRAO) -> tuple:
+    """
+    Repulsão k²/d de cada vértice por todos os outros, aproximada por Barnes-Hut.
+
+    A fronteira de pares (vértice, célula) começa na raiz; em cada nível,
+    os pares bem separados contribuem com a massa da célula e os demais
+    são trocados pelos filhos. As células que sobram no último nível
+    (poucos vértices cada) são expandidas em pares exatos (vértice,
+    vértice da célula).
+
+    Returns:
+        (fx, fy)
+    """
+    n = len(xs)
+    fx = np.zeros(n)
+    fy = np.zeros(n)
+    if n < 2:
+        return fx, fy
+
+    k2 = k * k
+    niveis = max(1, math.ceil(math.log(n, 4)) + 1)
+    arvore = _montar_quadtree(xs, ys, niveis)
+    # Poucos vértices distantes esticam o quadro e concentram os demais em
+    # poucas folhas, cujos pares exatos crescem com o quadrado da massa
+    while arvore[-1][1].max() > MASSA_MAXIMA_FOLHA and niveis < NIVEIS_MAXIMOS:
+        niveis = min(niveis + 2, NIVEIS_MAXIMOS)
+        arvore = _montar_quadtree(xs, ys, niveis)
+
+    def somar(vertices, dx, dy, massas):
+        d2 = np.maximum(dx * dx + dy * dy, 1e-12 * k2)
+        coeficiente = k2 * massas / d2
+        fx[:] += np.bincount(vertices, weights=coeficiente * dx, minlength=n)
+        fy[:] += np.bincount(vertices, weights=coeficiente * dy, minlength=n)
+
+    vertices = np.arange(n)
+    celulas = np.zeros(n, dtype=np.int64)
+    for celula, massa, cx, cy, lado, primeiro_filho, num_filhos in arvore[:-1]:
+        dx = xs[vertices] - cx[celulas]
+        dy = ys[vertices] - cy[celulas]
+        aceitos = (celula[vertices] != celulas) & (lado * lado < theta * theta * (dx * dx + dy * dy))
+        somar(vertices[aceitos], dx[aceitos], dy[aceitos], massa[celulas[aceitos]])
+
+        abertos = ~aceitos
+        vertices, celulas = _expandir(vertices[abertos], celulas[abertos], primeiro_filho, num_filhos)
+
+    # Folhas: um par por vértice da célula (sem o próprio vértice)
+    celula, massa = arvore[-1][0], arvore[-1][1]
+    ordem = np.argsort(celula, kind='stable')
+    vertices, posicoes = _expandir(vertices, celulas, np.cumsum(massa) - massa, massa)
+    membros = ordem[posicoes]
+    outros = membros != vertices
+    vertices, membros = vertices[outros], membros[outros]
+    somar(vertices, xs[vertices] - xs[membros], ys[vertices] - ys[membros], 1.0)
+
+    return fx, fy
+
+
+def calcular_layout(grafo, iteracoes: int = None, posicoes: dict = None, fixar: bool = False,
+                    semente: int = 0, theta: float = THETA_PADRAO,
+                    gravidade: float = GRAVIDADE_PADRAO) -> dict:
+    """
+    Posições por Fruchterman-Reingold com repulsão Barnes-Hut.
+
+    Args:
+        iteracoes: None = iteracoes_padrao(V)
+        posicoes: Posições iniciais de parte dos vértices ({v: [x, y]}); os
+                  demais começam perto dos vizinhos posicionados ou ao acaso
+        fixar: Manter os vértices de posicoes no lugar (só os outros se movem,
+               dentro do retângulo dos fixos mais a margem k); a distância
+               ideal k passa a ser a mediana das arestas entre eles
+        theta: Precisão do Barnes-Hut (0 = exato, maior = mais rápido)
+        gravidade: Atração de cada vértice ao centro, proporcional à distância
+
+    Returns:
+        {vertice: [x, y]}
+    """
+    vertices = list(grafo.obter_todos_vertices())
+    n = len(vertices)
+    if n == 0:
+        return {}
+    indice = {v: i for i, v in enumerate(vertices)}
+    arestas = [(indice[v1], indice[v2]) for v1, v2, _ in grafo.obter_todas_arestas() if v1 != v2]
+    origens = np.array([a for a, _ in arestas], dtype=np.int64)
+    destinos = np.array([b for _, b in arestas], dtype=np.int64)
+    iteracoes = iteracoes_padrao(n) if iteracoes is None else iteracoes
+    aleatorio = np.random.default_rng(semente)
+
+    posicoes = posicoes or {}
+    conhecidos = np.array([v in posicoes for v in vertices], dtype=bool)
+    xs = np.zeros(n)
+    ys = np.zeros(n)
+    for v, (x, y) in posicoes.items():
+        if v in indice:
+            xs[indice[v]], ys[indice[v]] = x, y
+
+    k = 1.0
+    if fixar and conhecidos.any():
+        entre_conhecidos = conhecidos[origens] & conhecidos[destinos]
+        if entre_conhecidos.any():
+            comprimentos = np.hypot(xs[origens] - xs[destinos], ys[origens] - ys[destinos])[entre_conhecidos]
+            k = float(np.median(comprimentos)) or 1.0
+
+    # Vértices sem posição: média dos vizinhos posicionados (com ruído) ou
+    # ponto aleatório no quadro de lado k·√V em volta dos posicionados
+    livres = np.flatnonzero(~conhecidos)
+    lado_quadro = k * math.sqrt(n)
+    centro = (xs[conhecidos].mean(), ys[conhecidos].mean()) if conhecidos.any() else (0.0, 0.0)
+    xs[livres] = centro[0] + (aleatorio.random(len(livres)) - 0.5) * lado_quadro
+    ys[livres] = centro[1] + (aleatorio.random(len(livres)) - 0.5) * lado_quadro
+    if conhecidos.any() and len(livres):
+        soma_x = np.bincount(origens, weights=np.where(conhecidos[destinos], xs[destinos], 0), minlength=n) \
+            + np.bincount(destinos, weights=np.where(conhecidos[origens], xs[origens], 0), minlength=n)
+        soma_y = np.bincount(origens, weights=np.where(conhecidos[destinos], ys[destinos], 0), minlength=n) \
+            + np.bincount(destinos, weights=np.where(conhecidos[origens], ys[origens], 0), minlength=n)
+        vizinhos = np.bincount(origens, weights=conhecidos[destinos], minlength=n) \
+            + np.bincount(destinos, weights=conhecidos[origens], minlength=n)
+        perto = livres[vizinhos[livres] > 0]
+        xs[perto] = soma_x[perto] / vizinhos[perto] + (aleatorio.random(len(perto)) - 0.5) * k
+        ys[perto] = soma_y[perto] / vizinhos[perto] + (aleatorio.random(len(perto)) - 0.5) * k
+
+    moveis = ~conhecidos if fixar else np.ones(n, dtype=bool)
+    quadro = None
+    if fixar and conhecidos.any():
+        quadro = (xs[conhecidos].min() - k, xs[conhecidos].max() + k,
+                  ys[conhecidos].min() - k, ys[conhecidos].max() + k)
+    temperatura_inicial = lado_quadro * FRACAO_TEMPERATURA
+
+    for iteracao in range(iteracoes):
+        fx, fy = forcas_repulsao(xs, ys, k, theta)
+
+        # Atração d²/k ao longo das arestas: (dx, dy)·d/k em cada extremidade
+        dx = xs[origens] - xs[destinos]
+        dy = ys[origens] - ys[destinos]
+        d = np.hypot(dx, dy)
+        ax, ay = dx * d / k, dy * d / k
+        fx += np.bincount(destinos, weights=ax, minlength=n) - np.bincount(origens, weights=ax, minlength=n)
+        fy += np.bincount(destinos, weights=ay, minlength=n) - np.bincount(origens, weights=ay, minlength=n)
+
+        if gravidade:
+            fx -= gravidade * (xs - xs.mean())
+            fy -= gravidade * (ys - ys.mean())
+
+        # Deslocamento limitado pela temperatura
+        temperatura = temperatura_inicial * (1 - iteracao / iteracoes)
+        modulo = np.maximum(np.hypot(fx, fy), 1e-12)
+        fator = np.where(moveis, np.minimum(modulo, temperatura) / modulo, 0.0)
+        xs += fx * fator
+        ys += fy * fator
+        if quadro is not None:
+            np.clip(xs, quadro[0], quadro[1], out=xs)
+            np.clip(ys, quadro[2], quadro[3], out=ys)
+
+    return {v: [float(xs[i]), float(ys[i])] for i, v in enumerate(vertices)}
+
+
+def posicoes_do_grafo(grafo) -> dict:
+    """
+    Posições para desenhar o grafo: coordenadas geográficas de quem as tem
+    (como [longitude, latitude]) e layout por forças para os demais, com
+    os vértices geográficos fixos.
+
+    O resultado fica em cache até o grafo ser modificado (atributo versao).
+
+    Returns:
+        {vertice: [x, y]} compartilhado entre as chamadas: não deve ser
+        alterado (VisualizadorGrafo usa ChainMap para os arrastes)
+    """
+    versao = getattr(grafo, 'versao', None)
+    em_cache = _cache_posicoes.get(grafo)
+    if em_cache is None or versao is None or em_cache[0] != versao:
+        posicoes = {}
+        for id_vertice in grafo.obter_todos_vertices():
+            pos = grafo.obter_posicao_vertice(id_vertice)
+            if pos and pos[0] is not None and pos[1] is not None:
+                posicoes[id_vertice] = [pos[1], pos[0]]
+        if len(posicoes) < grafo.contar_vertices():
+            posicoes = calcular_layout(grafo, posicoes=posicoes, fixar=True)
+        em_cache = (versao, posicoes)
+        _cache_posicoes[grafo] = em_cache
+    return em_cache[1]
@@ -0,0 +1,138 @@
+"""
+Layouts salvos em disco
+Posições de vértices (do arraste ou do layout automático) gravadas por
+grafo: um arquivo .npy (V × 2, float64) por hash do conteúdo do grafo
+(artefatos.hash_grafo), na ordem de obter_todos_vertices. Reabrir o mesmo
+grafo encontra o layout sem recalcular nem arrastar de novo.
+
+O layout é exposto como um Mapping somente leitura (PosicoesSalvas), lido
+do disco só no primeiro acesso e compartilhado por referência entre os
+visualizadores; cada visualizador grava os seus arrastes em uma camada
+própria (collections.ChainMap), sem copiar as posições salvas.
+
+Ao contrário do cache de artefatos, os layouts são dados do usuário: não
+dependem de GRAFOS_CACHE e erros de gravação são propagados.
+
+Variáveis de ambiente:
+    GRAFOS_LAYOUTS_DIR  diretório dos layouts (padrão: ~/.local/share/grafos/layouts)
+"""
+
+import os
+import tempfile
+from collections.abc import Mapping
+
+from artefatos import hash_grafo
+
+
+def diretorio_layouts() -> str:
+    """Diretório onde os layouts são gravados"""
+    return os.environ.get('GRAFOS_LAYOUTS_DIR') or os.path.join(
+        os.path.expanduser('~'), '.local', 'share', 'grafos', 'layouts'
+    )
+
+
+def caminho_layout(grafo) -> str:
+    return os.path.join(diretorio_layouts(), hash_grafo(grafo) + '.npy')
+
+
+class PosicoesSalvas(Mapping):
+    """
+    {vertice: (x, y)} de um layout gravado, carregado no primeiro acesso.
+
+    Os valores são tuplas (imutáveis): quem precisa mover vértices deve
+    usar ChainMap({}, posicoes) e atribuir na primeira camada.
+    """
+
+    def __init__(self, caminho: str, vertices: list):
+        self.caminho = caminho
+        self.vertices = vertices
+        self._posicoes = None
+
+    def _carregar(self) -> dict:
+        if self._posicoes is None:
+            import numpy as np  # Só é importado quando um layout é usado
+            coordenadas = np.load(self.caminho, mmap_mode='r')
+            if len(coordenadas) != len(self.vertices):
+                raise ValueError(f"Layout com {len(coordenadas)} posições para "
+                                 f"{len(self.vertices)} vértices: {self.caminho}")
+            # NaN marca vértice sem posição (não entra no mapeamento)
+            self._posicoes = {v: (x, y) for v, (x, y) in zip(self.vertices, coordenadas.tolist())
+                              if x == x and y == y}
+        return self._posicoes
+
+    def __getitem__(self, id_vertice):
+        return self._carregar()[id_vertice]
+
+    def __iter__(self):
+        return iter(self._carregar())
+
+    def __len__(self):
+        return len(self._carregar())
+
+    def __contains__(self, id_vertice):
+        return id_vertice in self._carregar()
+
+    def __reduce__(self):
+        # Em processos trabalhadores o arquivo é lido de novo, sem enviar as posições
+        return (PosicoesSalvas, (self.caminho, self.vertices))
+
+
+def carregar_layout(grafo):
+    """
+    Layout salvo do grafo, sem ler o arquivo (a leitura é no primeiro acesso).
+
+    Returns:
+        PosicoesSalvas, ou None se o grafo não tem layout salvo
+    """
+    caminho = caminho_layout(grafo)
+    if not os.path.exists(caminho):
+        return None
+    return PosicoesSalvas(caminho, list(grafo.obter_todos_vertices()))
+
+
+def salvar_layout(grafo, posicoes) -> PosicoesSalvas:
+    """
+    Grava as posições (qualquer Mapping {vertice: (x, y)}) do grafo.
+
+    A escrita é atômica (arquivo temporário + os.replace).
+
+    Returns:
+        O layout gravado, para ser compartilhado no lugar de posicoes
+
+    Raises:
+        OSError: se o arquivo não puder ser gravado
+    """
+    import numpy as np
+
+    vertices = list(grafo.obter_todos_vertices())
+    coordenadas = np.full((len(vertices), 2), np.nan)
+    for i, v in enumerate(vertices):
+        pos = posicoes.get(v)
+        if pos is not None:
+            coordenadas[i] = pos
+
+    caminho = caminho_layout(grafo)
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    descritor, temporario = tempfile.mkstemp(dir=os.path.dirname(caminho), suffix='.tmp')
+    try:
+        with os.fdopen(descritor, 'wb') as arquivo:
+            np.save(arquivo, coordenadas, allow_pickle=False)
+        os.replace(temporario, caminho)
+    except BaseException:
+        os.unlink(temporario)
+        raise
+    return PosicoesSalvas(caminho, vertices)
+
+
+def remover_layout(grafo) -> bool:
+    """
+    Apaga o layout salvo do grafo.
+
+    Returns:
+        True se havia um layout salvo
+    """
+    try:
+        os.remove(caminho_layout(grafo))
+    except FileNotFoundError:
+        return False
+    return True
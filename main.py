@@ -3,24 +3,189 @@ Interface principal do sistema de análise de grafos
 Trabalho de Grafos - Paraná
 """
 
+import time
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from tkinter import ttk, messagebox, scrolledtext, filedialog, simpledialog
 
 from grafo import Grafo
-from dados import COORDENADAS_CIDADES, ARESTAS, COORDENADAS_CIDADES_PARANA, ARESTAS_PARANA
+from dados import COORDENADAS_CIDADES
 from planaridade import VerificadorPlanaridade
+from metricas import calcular_cintura
+from carregador import carregar_arquivo, formatar_estatisticas, criar_grafo_trabalho, criar_grafo_parana
 from welsh_powell import WelshPowell
-from a_estrela import AEstrela
-from visualizador import VisualizadorGrafo
+from a_estrela import AEstrela, EXPANDIR
+from execucao_ag import ExecucaoAG
+from agendador import Agendador
+from layouts_salvos import carregar_layout, salvar_layout, remover_layout
+from visualizador import VisualizadorGrafo, GraficoEvolucao, AnimacaoBusca, carregar_backend
+import visualizador
 from algoritmo_genetico import AlgoritmoGeneticoPCV
 
+# Intervalo entre consultas à fila do AG em segundo plano
+INTERVALO_SONDAGEM_AG_MS = 50
+
+# Intervalo entre quadros da reprodução da busca A*
+INTERVALO_QUADRO_BUSCA_MS = 33
+
+# Intervalo entre consultas às mensagens das tarefas em segundo plano
+INTERVALO_SONDAGEM_TAREFAS_MS = 100
+
+# matplotlib é carregado sob demanda, quando a aplicação é criada
+plt = None
+FigureCanvasTkAgg = None
+
+
+def carregar_backend_grafico():
+    """Carrega matplotlib (via visualizador) e publica os nomes usados aqui"""
+    global plt, FigureCanvasTkAgg
+    carregar_backend()
+    plt = visualizador.plt
+    FigureCanvasTkAgg = visualizador.FigureCanvasTkAgg
+
+
+# ============================================================================
+# TAREFAS EM SEGUNDO PLANO (executadas pelo Agendador em threads de trabalho)
+# Recebem a Tarefa e o grafo e só devolvem dados: nada de Tk/matplotlib aqui.
+# ============================================================================
+
+def tarefa_planaridade(tarefa, grafo) -> dict:
+    """
+    Planaridade, métricas e estrutura do grafo (o texto da área de resultados).
+    
+    Returns:
+        {'planar', 'razao', 'texto', 'kuratowski' (None se planar)}
+    """
+    etapas = 6
+    tarefa.informar_progresso(0 / etapas, "teste de planaridade")
+    verificador = VerificadorPlanaridade(grafo)
+    eh_planar, razao = verificador.verificar_planaridade()
+    
+    tarefa.informar_progresso(1 / etapas, "característica de Euler")
+    euler = verificador.obter_caracteristica_euler()
+    
+    resultado = "=" * 50 + "\n"
+    resultado += "VERIFICAÇÃO DE PLANARIDADE\n"
+    resultado += "=" * 50 + "\n\n"
+    
+    resultado += f"Vértices (V): {euler['vertices']}\n"
+    resultado += f"Arestas (E): {euler['arestas']}\n"
+    resultado += f"Faces (F): {euler['faces']}\n"
+    resultado += f"Característica de Euler (V-E+F): {euler['caracteristica_euler']}\n"
+    tarefa.informar_progresso(2 / etapas, "cintura")
+    cintura = calcular_cintura(grafo, verificar=tarefa.verificar)
+    resultado += f"Cintura (menor ciclo): {cintura or 'acíclico'}\n"
+    
+    # Estrutura (reaproveita a análise feita durante a verificação)
+    tarefa.informar_progresso(3 / etapas, "análise estrutural")
+    analise = verificador.obter_analise()
+    articulacoes = [grafo.obter_nome_vertice(v) for v in analise['articulacoes']]
+    resultado += f"Componentes conexas: {analise['num_componentes']}\n"
+    resultado += f"Bipartido: {'Sim' if analise['bipartido'] else 'Não'}\n"
+    resultado += f"Graus (mín/máx): {analise['grau_minimo']}/{analise['grau_maximo']}\n"
+    resultado += f"Componentes biconexas (blocos): {len(analise['blocos'])}\n"
+    resultado += f"Pontos de articulação: {', '.join(articulacoes) if articulacoes else 'nenhum'}\n\n"
+    
+    if eh_planar:
+        resultado += "O GRAFO É PLANAR\n"
+    else:
+        resultado += "O GRAFO NÃO É PLANAR\n"
+    
+    resultado += f"\nRazão: {razao}\n"
+    
+    # Diagnóstico por bloco (componentes biconexas)
+    tarefa.informar_progresso(4 / etapas, "diagnóstico por bloco")
+    blocos = verificador.verificar_planaridade_por_blocos()['blocos']
+    nao_planares = [b for b in blocos if not b['planar']]
+    resultado += f"Blocos não planares: {len(nao_planares)} de {len(blocos)}\n"
+    for bloco in nao_planares:
+        resultado += f"  Bloco {bloco['indice']} ({len(bloco['vertices'])} vértices, "
+        resultado += f"{bloco['num_arestas']} arestas): {bloco['razao']}\n"
+    
+    kuratowski = None
+    if eh_planar:
+        # Sistema de rotação (vizinhos em sentido horário)
+        tarefa.informar_progresso(5 / etapas, "embedding planar")
+        resultado += "\nEmbedding planar (vizinhos em sentido horário):\n"
+        for v, vizinhos in verificador.obter_embedding().items():
+            nomes = [grafo.obter_nome_vertice(w) for w in vizinhos]
+            resultado += f"  {grafo.obter_nome_vertice(v)}: {', '.join(nomes)}\n"
+    else:
+        tarefa.informar_progresso(5 / etapas, "subgrafo de Kuratowski")
+        kuratowski = verificador.obter_subgrafo_kuratowski(verificar=tarefa.verificar)
+        resultado += f"\nSubdivisão de {kuratowski['tipo']} encontrada "
+        resultado += f"({len(kuratowski['arestas'])} arestas, destacadas em vermelho).\n"
+        resultado += "Vértices de ramificação: "
+        resultado += ", ".join(grafo.obter_nome_vertice(v) for v in kuratowski['vertices_ramificacao']) + "\n"
+    
+    return {'planar': eh_planar, 'razao': razao, 'texto': resultado, 'kuratowski': kuratowski}
+
+
+def tarefa_welsh_powell(tarefa, grafo) -> WelshPowell:
+    """Coloração com registro de passos; devolve o WelshPowell já executado"""
+    def progresso(coloridos, total):
+        tarefa.informar_progresso(coloridos / total, f"{coloridos}/{total} vértices coloridos")
+    
+    welsh_powell = WelshPowell(grafo, progresso=progresso)
+    welsh_powell.color_graph(registrar_passos=True)
+    return welsh_powell
+
+
+def tarefa_a_estrela(tarefa, grafo, inicio, destino) -> dict:
+    """
+    Busca A* com registro de eventos (para a reprodução animada).
+    
+    Returns:
+        {'a_estrela', 'inicio', 'destino', 'encontrado', 'texto'}
+    """
+    total = grafo.contar_vertices()
+    
+    def progresso(expandidos):
+        tarefa.informar_progresso(expandidos / total, f"{expandidos} nós expandidos")
+    
+    a_estrela = AEstrela(grafo, depurar=False, registrar=True, progresso=progresso)
+    encontrado = a_estrela.encontrar_caminho(inicio, destino) is not None
+    resultado = {'a_estrela': a_estrela, 'inicio': inicio, 'destino': destino,
+                 'encontrado': encontrado, 'texto': ''}
+    if not encontrado:
+        return resultado
+    
+    detalhes = a_estrela.obter_detalhes_caminho()
+    
+    texto = "=" * 50 + "\n"
+    texto += "ALGORITMO A* - CAMINHO MÍNIMO\n"
+    texto += "=" * 50 + "\n\n"
+    
+    texto += f"Origem: {grafo.obter_nome_vertice(inicio)}\n"
+    texto += f"Destino: {grafo.obter_nome_vertice(destino)}\n"
+    texto += f"Distância Total: {a_estrela.custo_total} km\n"
+    texto += f"Número de cidades no caminho: {detalhes['num_vertices']}\n"
+    texto += f"Nós expandidos: {a_estrela.registro.contar(EXPANDIR)}\n\n"
+    
+    texto += "Caminho:\n"
+    texto += " → ".join(detalhes['caminho']) + "\n\n"
+    
+    texto += "Segmentos:\n"
+    for i, aresta in enumerate(detalhes['arestas'], 1):
+        texto += f"  {i}. {aresta['de']} → {aresta['para']}: {aresta['distancia']} km\n"
+    
+    texto += f"\n{'='*50}\n"
+    
+    # Tabela heurística
+    tarefa.informar_progresso(1.0, "tabela heurística")
+    texto += "\nTabela h(n) - Distância de Manhattan para o destino:\n"
+    tabela_heuristica = a_estrela.calcular_tabela_heuristica(destino)
+    for cidade, valor_h in sorted(tabela_heuristica.items(), key=lambda x: x[1]):
+        texto += f"  {cidade}: {valor_h}\n"
+    
+    resultado['texto'] = texto
+    return resultado
+
 
 class GraphApp:
     """Aplicação principal com interface Tkinter"""
     
     def __init__(self, root):
+        carregar_backend_grafico()
         self.root = root
         self.root.title("Sistema de Análise de Grafos - Trabalho T3 PCV")
         self.root.geometry("1200x800")
@@ -29,9 +194,12 @@ class GraphApp:
         self.grafo = self.criar_grafo_trabalho()
         
         # Variáveis
+        self.agendador = Agendador()  # Análises em segundo plano (ver submeter_tarefa)
+        self.tarefas_listadas = []  # Tarefas na ordem da lista do painel
         self.canvas_atual = None
         self.welsh_powell = None
-        self.posicoes_salvas = None  # Posições salvas do drag and drop
+        self.ultima_busca = None  # Última busca A* (com o registro de eventos)
+        self.posicoes_salvas = carregar_layout(self.grafo)  # Layout salvo em disco (lido sob demanda)
         self.visualizador_atual = None  # Visualizador atual para pegar posições
         self.fig_interativa = None  # Figura da janela interativa
         
@@ -44,6 +212,7 @@ class GraphApp:
         
         # Criar interface
         self.criar_interface()
+        self.root.after(INTERVALO_SONDAGEM_TAREFAS_MS, self.sondar_tarefas)
         # Garantir limpeza ao fechar a janela principal
         # Isso força fechamento de figuras matplotlib e widgets embutidos
         try:
@@ -55,47 +224,19 @@ class GraphApp:
     
     def criar_grafo_trabalho(self):
         """Cria o grafo do Trabalho 3 (PCV com AG)"""
-        grafo = Grafo()
-        
-        # Adicionar vértices (cidades)
-        for i, (cidade, coords) in enumerate(COORDENADAS_CIDADES.items()):
-            grafo.adicionar_vertice(i, nome=cidade, x=coords[0], y=coords[1])
-        
-        # Criar mapeamento de nomes para IDs
-        cidade_para_id = {cidade: i for i, cidade in enumerate(COORDENADAS_CIDADES.keys())}
-        
-        # Adicionar arestas
-        for cidade1, cidade2, distancia in ARESTAS:
-            id1 = cidade_para_id[cidade1]
-            id2 = cidade_para_id[cidade2]
-            grafo.adicionar_aresta(id1, id2, distancia)
-        
-        return grafo
+        return criar_grafo_trabalho()
     
     def criar_grafo_parana(self):
         """Cria o grafo das cidades do Paraná"""
-        grafo = Grafo()
-        
-        # Adicionar vértices (cidades)
-        for i, (cidade, coords) in enumerate(COORDENADAS_CIDADES_PARANA.items()):
-            grafo.adicionar_vertice(i, nome=cidade, x=coords[0], y=coords[1])
-        
-        # Criar mapeamento de nomes para IDs
-        cidade_para_id = {cidade: i for i, cidade in enumerate(COORDENADAS_CIDADES_PARANA.keys())}
-        
-        # Adicionar arestas
-        for cidade1, cidade2, distancia in ARESTAS_PARANA:
-            id1 = cidade_para_id[cidade1]
-            id2 = cidade_para_id[cidade2]
-            grafo.adicionar_aresta(id1, id2, distancia)
-        
-        return grafo
+        return criar_grafo_parana()
     
     def carregar_grafo_parana(self):
         """Recarrega o grafo do Paraná"""
         self.grafo = self.criar_grafo_parana()
-        self.posicoes_salvas = None
+        self.posicoes_salvas = carregar_layout(self.grafo)
         self.welsh_powell = None
+        self.ultima_busca = None
+        self.agendador.cancelar_todas()
         self.atualizar_info_grafo()
         self.atualizar_combos_cidades()
         self.mostrar_grafo_original()
@@ -104,19 +245,56 @@ class GraphApp:
     def carregar_grafo_trabalho(self):
         """Recarrega o grafo do Trabalho 3"""
         self.grafo = self.criar_grafo_trabalho()
-        self.posicoes_salvas = None
+        self.posicoes_salvas = carregar_layout(self.grafo)
         self.welsh_powell = None
+        self.ultima_busca = None
+        self.agendador.cancelar_todas()
         self.atualizar_info_grafo()
         self.atualizar_combos_cidades()
         self.mostrar_grafo_original()
         messagebox.showinfo("Grafo Carregado", "Grafo do Trabalho 3 (PCV com AG) carregado com sucesso!")
     
+    def carregar_grafo_arquivo(self):
+        """Carrega um grafo de arquivo (CSV, DIMACS .gr, TSPLIB .tsp ou snapshot .snap)"""
+        caminho = filedialog.askopenfilename(
+            title="Carregar Grafo",
+            filetypes=[
+                ("Grafos", "*.csv *.txt *.edges *.el *.gr *.tsp *.snap *.gz"),
+                ("Lista de arestas", "*.csv *.txt *.edges *.el"),
+                ("DIMACS", "*.gr"),
+                ("TSPLIB", "*.tsp"),
+                ("Snapshot binário", "*.snap"),
+                ("Todos os arquivos", "*.*")
+            ]
+        )
+        if not caminho:
+            return
+        
+        try:
+            grafo, estatisticas = carregar_arquivo(caminho)
+        except (OSError, ValueError) as erro:
+            messagebox.showerror("Erro", f"Erro ao carregar o arquivo:\n{erro}")
+            return
+        
+        self.grafo = grafo
+        self.posicoes_salvas = carregar_layout(self.grafo)
+        self.welsh_powell = None
+        self.ultima_busca = None
+        self.agendador.cancelar_todas()
+        self.atualizar_info_grafo()
+        self.atualizar_combos_cidades()
+        self.mostrar_grafo_original()
+        self.atualizar_resultados("GRAFO CARREGADO\n\n" + formatar_estatisticas(estatisticas))
+    
     def atualizar_combos_cidades(self):
         """Atualiza os comboboxes de cidades"""
         nomes_vertices = [self.grafo.obter_nome_vertice(v) for v in self.grafo.obter_todos_vertices()]
-        self.cidade_inicial_ag['values'] = nomes_vertices
+        for combo in (self.cidade_inicial_ag, self.cidade_inicial, self.cidade_destino):
+            combo['values'] = nomes_vertices
         if nomes_vertices:
             self.cidade_inicial_ag.current(0)
+            self.cidade_inicial.current(0)
+            self.cidade_destino.current(len(nomes_vertices) - 1)
     
     def criar_grafo_personalizado(self):
         """Abre janela para criar um grafo personalizado"""
@@ -136,10 +314,12 @@ Formato de entrada:
 
 VÉRTICES (um por linha):
 id, nome, latitude, longitude
+(ou só id, nome: posição automática)
 
 Exemplo:
 0, CidadeA, -25.5, -49.2
 1, CidadeB, -23.3, -51.1
+2, CidadeC
 
 ARESTAS (uma por linha):
 id_origem, id_destino, peso
@@ -187,6 +367,11 @@ Exemplo:
                             lon = float(partes[3])
                             novo_grafo.adicionar_vertice(vid, nome=nome, x=lat, y=lon)
                             mapa_vertices[vid] = nome
+                        elif len(partes) == 2:
+                            # Sem coordenadas: o visualizador calcula a posição
+                            vid = int(partes[0])
+                            novo_grafo.adicionar_vertice(vid, nome=partes[1])
+                            mapa_vertices[vid] = partes[1]
                 
                 # Processar arestas
                 dados_arestas = texto_arestas.get('1.0', tk.END).strip().split('\n')
@@ -207,17 +392,16 @@ Exemplo:
                 
                 # Substituir grafo atual
                 self.grafo = novo_grafo
-                self.posicoes_salvas = None
+                self.posicoes_salvas = carregar_layout(self.grafo)
                 self.welsh_powell = None
+                self.ultima_busca = None
+                self.agendador.cancelar_todas()
                 
                 # Atualizar informações do grafo
                 self.atualizar_info_grafo()
                 
                 # Atualizar combos
-                nomes_vertices = [self.grafo.obter_nome_vertice(v) for v in self.grafo.obter_todos_vertices()]
-                self.cidade_inicial_ag['values'] = nomes_vertices
-                if nomes_vertices:
-                    self.cidade_inicial_ag.current(0)
+                self.atualizar_combos_cidades()
                 
                 # Mostrar grafo
                 self.mostrar_grafo_original()
@@ -274,6 +458,34 @@ Exemplo:
         ttk.Button(frame_algoritmos, text="Verificar Planaridade", 
                   command=self.verificar_planaridade).pack(fill=tk.X, pady=2)
         
+        ttk.Button(frame_algoritmos, text="Coloração (Welsh-Powell)", 
+                  command=self.aplicar_welsh_powell).pack(fill=tk.X, pady=2)
+        
+        ttk.Separator(frame_algoritmos, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=5)
+        
+        # ========================================================================
+        # BUSCA A* - CAMINHO MÍNIMO
+        # ========================================================================
+        ttk.Label(frame_algoritmos, text="Caminho Mínimo (A*)", 
+                 font=('Arial', 10, 'bold')).pack(anchor=tk.W, pady=(5, 2))
+        
+        frame_origem = ttk.Frame(frame_algoritmos)
+        frame_origem.pack(fill=tk.X, pady=2)
+        ttk.Label(frame_origem, text="Origem:").pack(side=tk.LEFT)
+        self.cidade_inicial = ttk.Combobox(frame_origem, state='readonly', width=22)
+        self.cidade_inicial.pack(side=tk.RIGHT)
+        
+        frame_destino = ttk.Frame(frame_algoritmos)
+        frame_destino.pack(fill=tk.X, pady=2)
+        ttk.Label(frame_destino, text="Destino:").pack(side=tk.LEFT)
+        self.cidade_destino = ttk.Combobox(frame_destino, state='readonly', width=22)
+        self.cidade_destino.pack(side=tk.RIGHT)
+        
+        ttk.Button(frame_algoritmos, text="Executar A*", 
+                  command=self.aplicar_a_estrela).pack(fill=tk.X, pady=2)
+        ttk.Button(frame_algoritmos, text="Animar Busca A*", 
+                  command=self.animar_busca_a_estrela).pack(fill=tk.X, pady=2)
+        
         ttk.Separator(frame_algoritmos, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=5)
         
         # ========================================================================
@@ -348,6 +560,8 @@ Exemplo:
                   command=self.carregar_grafo_parana).pack(fill=tk.X, pady=2)
         ttk.Button(frame_algoritmos, text="Criar Novo Grafo Personalizado", 
                   command=self.criar_grafo_personalizado).pack(fill=tk.X, pady=2)
+        ttk.Button(frame_algoritmos, text="Carregar Grafo de Arquivo...", 
+                  command=self.carregar_grafo_arquivo).pack(fill=tk.X, pady=2)
         
         ttk.Separator(frame_algoritmos, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=5)
         
@@ -363,9 +577,25 @@ Exemplo:
         
         ttk.Button(frame_layout, text="Salvar Layout Atual", 
                   command=self.salvar_layout_personalizado).pack(fill=tk.X, pady=2)
+        ttk.Button(frame_layout, text="Layout Automático (Forças)", 
+                  command=self.aplicar_layout_automatico).pack(fill=tk.X, pady=2)
         ttk.Button(frame_layout, text="Resetar para Original", 
                   command=self.resetar_layout).pack(fill=tk.X, pady=2)
         
+        # Tarefas em segundo plano (planaridade, coloração, A*)
+        frame_tarefas = ttk.LabelFrame(frame_esquerdo, text="Tarefas em Segundo Plano", padding=5)
+        frame_tarefas.pack(fill=tk.X, pady=5)
+        
+        self.lista_tarefas = tk.Listbox(frame_tarefas, height=3, exportselection=False)
+        self.lista_tarefas.pack(fill=tk.X, pady=2)
+        
+        frame_botoes_tarefas = ttk.Frame(frame_tarefas)
+        frame_botoes_tarefas.pack(fill=tk.X)
+        ttk.Button(frame_botoes_tarefas, text="Cancelar Selecionada", 
+                  command=self.cancelar_tarefa_selecionada).pack(side=tk.LEFT, expand=True, fill=tk.X)
+        ttk.Button(frame_botoes_tarefas, text="Cancelar Todas", 
+                  command=self.agendador.cancelar_todas).pack(side=tk.LEFT, expand=True, fill=tk.X)
+        
         # Área de resultados (NO FINAL)
         frame_resultados = ttk.LabelFrame(frame_esquerdo, text="Resultados", padding=10)
         frame_resultados.pack(fill=tk.BOTH, expand=True, pady=5)
@@ -402,7 +632,7 @@ Exemplo:
         
         # Aplicar posições salvas se existirem
         if self.posicoes_salvas:
-            visualizador.posicoes_personalizadas = self.posicoes_salvas.copy()
+            visualizador.posicoes_personalizadas = self.posicoes_salvas
         
         fig = visualizador.desenhar_grafo(titulo="Grafo do Trabalho 3 - PCV com AG", tamanho_fig=(10, 8), arrastavel=False)
         
@@ -414,43 +644,60 @@ Exemplo:
         self.atualizar_resultados(f"Grafo original exibido{info_layout}.\n\nUse o botão 'Abrir Grafo Interativo' para arrastar vértices.\n\n" + str(self.grafo))
     
     def verificar_planaridade(self):
-        """Verifica planaridade do grafo"""
-        verificador = VerificadorPlanaridade(self.grafo)
-        eh_planar, razao = verificador.verificar_planaridade()
-        euler = verificador.obter_caracteristica_euler()
-        
-        resultado = "=" * 50 + "\n"
-        resultado += "VERIFICAÇÃO DE PLANARIDADE\n"
-        resultado += "=" * 50 + "\n\n"
-        
-        resultado += f"Vértices (V): {euler['vertices']}\n"
-        resultado += f"Arestas (E): {euler['arestas']}\n"
-        resultado += f"Faces estimadas (F): {euler['faces']}\n"
-        resultado += f"Característica de Euler (V-E+F): {euler['caracteristica_euler']}\n\n"
-        
-        if eh_planar:
-            resultado += "O GRAFO É PLANAR\n"
-        else:
-            resultado += "O GRAFO NÃO É PLANAR\n"
-        
-        resultado += f"\nRazão: {razao}\n"
+        """Verifica planaridade do grafo (em segundo plano)"""
+        self.submeter_tarefa("Planaridade", tarefa_planaridade, self.grafo,
+                             ao_concluir=self.mostrar_planaridade)
+    
+    def mostrar_planaridade(self, resultado):
+        """Mostra o resultado de tarefa_planaridade (na thread da interface)"""
+        kuratowski = resultado['kuratowski']
+        if kuratowski is not None:
+            # Destacar a obstrução no canvas principal
+            self.limpar_canvas()
+            titulo = f"Obstrução de Kuratowski ({kuratowski['tipo']})"
+            self.estado_atual = {
+                'titulo': titulo,
+                'destacar_arestas': kuratowski['arestas'],
+                'cores_vertices': None
+            }
+            
+            visualizador = VisualizadorGrafo(self.grafo)
+            
+            if self.posicoes_salvas:
+                visualizador.posicoes_personalizadas = self.posicoes_salvas
+            
+            fig = visualizador.desenhar_grafo(
+                titulo=titulo,
+                destacar_arestas=kuratowski['arestas'],
+                tamanho_fig=(10, 8),
+                arrastavel=False
+            )
+            
+            self.canvas_atual = FigureCanvasTkAgg(fig, master=self.frame_viz)
+            self.canvas_atual.draw()
+            self.canvas_atual.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
-        self.atualizar_resultados(resultado)
+        self.atualizar_resultados(resultado['texto'])
         
         # Mostrar mensagem
-        if eh_planar:
-            messagebox.showinfo("Planaridade", f"O grafo É PLANAR!\n\n{razao}")
+        if resultado['planar']:
+            messagebox.showinfo("Planaridade", f"O grafo É PLANAR!\n\n{resultado['razao']}")
         else:
-            messagebox.showwarning("Planaridade", f"O grafo NÃO É PLANAR!\n\n{razao}")
+            messagebox.showwarning("Planaridade", f"O grafo NÃO É PLANAR!\n\n{resultado['razao']}")
     
     def aplicar_welsh_powell(self):
-        """Aplica o algoritmo Welsh-Powell com visualização passo a passo"""
+        """Aplica o algoritmo Welsh-Powell (em segundo plano) e mostra o passo a passo"""
+        self.submeter_tarefa("Coloração (Welsh-Powell)", tarefa_welsh_powell, self.grafo,
+                             ao_concluir=self.mostrar_welsh_powell)
+    
+    def mostrar_welsh_powell(self, welsh_powell):
+        """Abre o passo a passo de uma coloração concluída (na thread da interface)"""
         self.limpar_canvas()
         
-        self.welsh_powell = WelshPowell(self.grafo)
-        cores = self.welsh_powell.color_graph(registrar_passos=True)
-        passos = self.welsh_powell.obter_passos()
-        estatisticas = self.welsh_powell.get_statistics()
+        self.welsh_powell = welsh_powell
+        cores = welsh_powell.cores
+        passos = welsh_powell.obter_passos()
+        estatisticas = welsh_powell.get_statistics()
         
         # Criar janela de visualização passo a passo
         self.mostrar_passos_welsh_powell(passos, cores, estatisticas)
@@ -527,11 +774,14 @@ Exemplo:
             
             # Aplicar posições salvas se existirem
             if self.posicoes_salvas:
-                visualizador.posicoes_personalizadas = self.posicoes_salvas.copy()
+                visualizador.posicoes_personalizadas = self.posicoes_salvas
+            
+            # Cores reconstruídas a partir do log de deltas do passo
+            cores_passo = self.welsh_powell.obter_cores_no_passo(idx)
             
             fig = visualizador.desenhar_grafo(
                 titulo=f"Passo {idx + 1}: {passo['descricao']}",
-                cores_vertices=passo['cores_atuais'] if passo['cores_atuais'] else None,
+                cores_vertices=cores_passo if cores_passo else None,
                 # Voltar ao tamanho de figura original (apenas janela aumentada)
                 tamanho_fig=(8, 6),
                 arrastavel=False
@@ -570,7 +820,7 @@ Exemplo:
             visualizador = VisualizadorGrafo(self.grafo)
             
             if self.posicoes_salvas:
-                visualizador.posicoes_personalizadas = self.posicoes_salvas.copy()
+                visualizador.posicoes_personalizadas = self.posicoes_salvas
             
             fig = visualizador.desenhar_grafo(
                 titulo="Coloração de Grafo - Welsh-Powell",
@@ -624,7 +874,7 @@ Exemplo:
 
     
     def aplicar_a_estrela(self):
-        """Aplica o algoritmo A*"""
+        """Aplica o algoritmo A* (em segundo plano)"""
         nome_cidade_inicial = self.cidade_inicial.get()
         nome_cidade_destino = self.cidade_destino.get()
         
@@ -639,11 +889,25 @@ Exemplo:
         id_inicial = cidade_para_id[nome_cidade_inicial]
         id_destino = cidade_para_id[nome_cidade_destino]
         
-        # Executar A*
-        a_estrela = AEstrela(self.grafo)
-        caminho, custo = a_estrela.encontrar_caminho(id_inicial, id_destino)
+        self.submeter_tarefa(f"A*: {nome_cidade_inicial} → {nome_cidade_destino}", tarefa_a_estrela,
+                             self.grafo, id_inicial, id_destino, ao_concluir=self.mostrar_a_estrela)
+    
+    def mostrar_a_estrela(self, resultado):
+        """Mostra o resultado de tarefa_a_estrela (na thread da interface)"""
+        a_estrela = resultado['a_estrela']
+        nome_cidade_inicial = self.grafo.obter_nome_vertice(resultado['inicio'])
+        nome_cidade_destino = self.grafo.obter_nome_vertice(resultado['destino'])
+        caminho, custo = a_estrela.caminho, a_estrela.custo_total
+        
+        # Os eventos ficam gravados para a reprodução animada
+        self.ultima_busca = {
+            'titulo': f"Busca A*: {nome_cidade_inicial} → {nome_cidade_destino}",
+            'registro': a_estrela.registro,
+            'arestas_caminho': a_estrela.obter_arestas_caminho() if resultado['encontrado'] else [],
+            'custo': custo
+        }
         
-        if caminho is None:
+        if not resultado['encontrado']:
             messagebox.showerror("A*", "Não foi possível encontrar um caminho!")
             return
         
@@ -663,7 +927,7 @@ Exemplo:
         
         # Aplicar posições salvas se existirem
         if self.posicoes_salvas:
-            visualizador.posicoes_personalizadas = self.posicoes_salvas.copy()
+            visualizador.posicoes_personalizadas = self.posicoes_salvas
         
         fig = visualizador.desenhar_grafo(
             titulo=f"Caminho Mínimo: {nome_cidade_inicial} → {nome_cidade_destino}",
@@ -676,37 +940,120 @@ Exemplo:
         self.canvas_atual.draw()
         self.canvas_atual.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
-        # Mostrar resultados
-        detalhes = a_estrela.obter_detalhes_caminho()
+        self.atualizar_resultados(resultado['texto'])
         
-        resultado = "=" * 50 + "\n"
-        resultado += "ALGORITMO A* - CAMINHO MÍNIMO\n"
-        resultado += "=" * 50 + "\n\n"
+        messagebox.showinfo("A*", 
+                          f"Caminho encontrado!\n\nDistância: {custo} km\nCidades: {len(caminho)}")
+    
+    def animar_busca_a_estrela(self):
+        """
+        Reproduz a última busca A* em uma janela, a partir do registro de
+        eventos (sem executar a busca de novo).
         
-        resultado += f"Origem: {nome_cidade_inicial}\n"
-        resultado += f"Destino: {nome_cidade_destino}\n"
-        resultado += f"Distância Total: {custo} km\n"
-        resultado += f"Número de cidades no caminho: {detalhes['num_vertices']}\n\n"
+        Cada quadro (agendado com after()) aplica 2^velocidade eventos; só as
+        linhas da busca são redesenhadas (AnimacaoBusca), não a figura toda.
+        """
+        busca = self.ultima_busca
+        if busca is None:
+            messagebox.showwarning("A*", "Execute o A* primeiro: a animação reproduz a última busca.")
+            return
+        registro = busca['registro']
         
-        resultado += "Caminho:\n"
-        resultado += " → ".join(detalhes['caminho']) + "\n\n"
+        janela = tk.Toplevel(self.root)
+        janela.title("Reprodução da Busca A*")
+        janela.geometry("1100x850")
         
-        resultado += "Segmentos:\n"
-        for i, aresta in enumerate(detalhes['arestas'], 1):
-            resultado += f"  {i}. {aresta['de']} → {aresta['para']}: {aresta['distancia']} km\n"
+        ttk.Label(janela, text=busca['titulo'], font=('Arial', 14, 'bold')).pack(pady=(10, 2))
+        ttk.Label(janela, text="Laranja: expandidos · Verde: fronteira · Roxo: arestas relaxadas · "
+                              "Círculo preto: vértice atual").pack()
+        label_progresso = ttk.Label(janela, text="", font=('Arial', 10))
+        label_progresso.pack(pady=5)
         
-        resultado += f"\n{'='*50}\n"
+        frame_grafico = ttk.Frame(janela)
+        frame_grafico.pack(fill=tk.BOTH, expand=True, padx=10)
         
-        # Tabela heurística
-        resultado += "\nTabela h(n) - Distância de Manhattan para o destino:\n"
-        tabela_heuristica = a_estrela.calcular_tabela_heuristica(id_destino)
-        for cidade, valor_h in sorted(tabela_heuristica.items(), key=lambda x: x[1]):
-            resultado += f"  {cidade}: {valor_h}\n"
+        visualizador = VisualizadorGrafo(self.grafo)
+        if self.posicoes_salvas:
+            visualizador.posicoes_personalizadas = self.posicoes_salvas
+        fig = visualizador.desenhar_grafo(titulo=busca['titulo'], tamanho_fig=(10, 7), arrastavel=False)
+        canvas = FigureCanvasTkAgg(fig, master=frame_grafico)
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        canvas.draw()
         
-        self.atualizar_resultados(resultado)
+        animacao = AnimacaoBusca(visualizador, registro)
+        estado = {'reproduzindo': False}
         
-        messagebox.showinfo("A*", 
-                          f"Caminho encontrado!\n\nDistância: {custo} km\nCidades: {detalhes['num_vertices']}")
+        # Velocidade em log2(eventos por quadro); o padrão reproduz a busca em ~10 s
+        velocidade_maxima = max(1, len(registro).bit_length())
+        velocidade = tk.IntVar(value=max(0, (len(registro) // 300).bit_length()))
+        
+        frame_controles = ttk.Frame(janela)
+        frame_controles.pack(fill=tk.X, padx=10, pady=10)
+        
+        def atualizar_progresso():
+            stats = animacao.estatisticas()
+            label_progresso.config(text=f"Evento {stats['evento']} / {stats['total']}   "
+                                        f"Expandidos: {stats['expandidos']}   "
+                                        f"Fronteira: {stats['fronteira']}   "
+                                        f"({2 ** velocidade.get()} eventos por quadro)")
+        
+        def mostrar_caminho(mostrar):
+            """Destaca o caminho encontrado (só ao fim da reprodução)"""
+            visualizador.aplicar_estado(destacar_arestas=busca['arestas_caminho'] if mostrar else None)
+            canvas.draw_idle()
+        
+        def quadro():
+            if not estado['reproduzindo'] or not janela.winfo_exists():
+                return
+            animacao.avancar(2 ** velocidade.get())
+            atualizar_progresso()
+            if animacao.concluida:
+                parar()
+                mostrar_caminho(True)
+            else:
+                janela.after(INTERVALO_QUADRO_BUSCA_MS, quadro)
+        
+        def reproduzir():
+            if animacao.concluida:
+                reiniciar()
+            estado['reproduzindo'] = True
+            btn_reproduzir.config(text="⏸ Pausar", command=parar)
+            janela.after(INTERVALO_QUADRO_BUSCA_MS, quadro)
+        
+        def parar():
+            estado['reproduzindo'] = False
+            btn_reproduzir.config(text="▶ Reproduzir", command=reproduzir)
+        
+        def reiniciar():
+            mostrar_caminho(False)
+            animacao.ir_para(0)
+            atualizar_progresso()
+        
+        def ir_para_fim():
+            parar()
+            animacao.ir_para(animacao.total)
+            atualizar_progresso()
+            mostrar_caminho(True)
+        
+        def fechar():
+            estado['reproduzindo'] = False
+            animacao.desconectar()
+            plt.close(fig)
+            janela.destroy()
+        
+        btn_reproduzir = ttk.Button(frame_controles, text="▶ Reproduzir", command=reproduzir)
+        btn_reproduzir.pack(side=tk.LEFT, padx=5)
+        ttk.Button(frame_controles, text="⏮ Reiniciar", command=reiniciar).pack(side=tk.LEFT, padx=5)
+        ttk.Button(frame_controles, text="⏭ Fim", command=ir_para_fim).pack(side=tk.LEFT, padx=5)
+        
+        ttk.Label(frame_controles, text="Velocidade:").pack(side=tk.LEFT, padx=(20, 5))
+        ttk.Scale(frame_controles, from_=0, to=velocidade_maxima, orient=tk.HORIZONTAL, length=200,
+                  variable=velocidade, command=lambda valor: atualizar_progresso()).pack(side=tk.LEFT)
+        
+        ttk.Button(frame_controles, text="Fechar", command=fechar).pack(side=tk.RIGHT, padx=5)
+        janela.protocol("WM_DELETE_WINDOW", fechar)
+        
+        atualizar_progresso()
     
     def executar_algoritmo_genetico(self):
         """Executa o Algoritmo Genético para resolver o PCV"""
@@ -787,15 +1134,18 @@ Exemplo:
             messagebox.showerror("Erro", f"Erro ao executar Algoritmo Genético:\n\n{str(e)}")
     
     def mostrar_evolucao_ag(self, ag: AlgoritmoGeneticoPCV, max_geracoes: int, cidade_inicial: str):
-        """Mostra a evolução do AG em uma janela interativa"""
+        """
+        Mostra a evolução do AG em uma janela interativa
+        
+        O AG roda em uma thread (ExecucaoAG); a janela consulta a fila de
+        estatísticas com after() e redesenha no máximo uma vez por consulta.
+        """
         janela_ag = tk.Toplevel(self.root)
         janela_ag.title("Algoritmo Genético - PCV")
         janela_ag.geometry("1300x900")
         
-        # Variável para controlar a geração atual
-        geracao_atual = tk.IntVar(value=0)
-        ag_executando = tk.BooleanVar(value=False)
-        pausado_para_visualizacao = tk.BooleanVar(value=False)
+        # Estado da execução em segundo plano
+        estado = {'execucao': None, 'meta_geracoes': max_geracoes, 'ultimas_estatisticas': None}
         
         # Frame superior com informações
         frame_info = ttk.Frame(janela_ag)
@@ -817,6 +1167,10 @@ Exemplo:
         frame_grafico = ttk.LabelFrame(janela_ag, text="Evolução do Custo", padding=5)
         frame_grafico.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
         
+        # Criado uma vez; cada geração só acrescenta um ponto
+        grafico = GraficoEvolucao(master=frame_grafico)
+        grafico.obter_widget().pack(fill=tk.BOTH, expand=True)
+        
         # Frame para detalhes
         frame_detalhes = ttk.LabelFrame(janela_ag, text="Melhores Rotas da Geração", padding=5)
         frame_detalhes.pack(fill=tk.X, padx=10, pady=5)
@@ -828,52 +1182,69 @@ Exemplo:
         frame_controles = ttk.Frame(janela_ag)
         frame_controles.pack(fill=tk.X, padx=10, pady=10)
         
-        # Variável para saber se usuário quer ver população
+        # Pausar a cada 5 gerações para ver a população
         mostrar_pop_var = tk.BooleanVar(value=False)
         
-        def callback_geracao(ger, ag_inst):
-            """Chamado após cada geração"""
-            # Atualizar labels
-            stats = ag_inst.obter_estatisticas_geracao()
-            label_geracao.config(text=f"Geração: {ger} / {max_geracoes}")
+        def atualizar_estatisticas(stats):
+            """Atualiza os labels com as estatísticas mais recentes"""
+            label_geracao.config(text=f"Geração: {stats['geracao']} / {estado['meta_geracoes']}")
             label_melhor.config(text=f"Melhor Custo: {stats['melhor_custo']}")
             label_medio.config(text=f"Custo Médio: {stats['custo_medio']:.2f}")
+        
+        def sondar_execucao():
+            """Consome a fila do AG; reagenda-se enquanto a thread estiver ativa"""
+            execucao = estado['execucao']
+            if execucao is None or not janela_ag.winfo_exists():
+                return
             
-            # Atualizar gráfico
-            atualizar_grafico_evolucao()
-            
-            # Perguntar se quer ver a população (a cada 5 gerações ou se for a última)
-            if ger > 0 and (ger % 5 == 0 or ger == max_geracoes):
-                resposta = messagebox.askyesno(
-                    "Visualizar População?",
-                    f"Geração {ger} concluída!\n\n"
-                    f"Melhor custo: {stats['melhor_custo']}\n"
-                    f"Custo médio: {stats['custo_medio']:.2f}\n"
-                    f"Rotas válidas: {stats['num_rotas_validas']}/{ag_inst.tamanho_populacao}\n\n"
-                    f"Deseja ver os 10 melhores indivíduos desta geração?",
-                    parent=janela_ag
-                )
-                
-                if resposta:
-                    mostrar_top_10(stats['top_10'])
-                    
-                    # Pausar execução até o usuário clicar em continuar
-                    pausado_para_visualizacao.set(True)
-                    btn_continuar_visualizacao.config(state=tk.NORMAL)
-                    
-                    # Aguardar usuário clicar em continuar
-                    janela_ag.wait_variable(pausado_para_visualizacao)
-                    btn_continuar_visualizacao.config(state=tk.DISABLED)
-            
-            # Atualizar janela
-            janela_ag.update()
-        
-        def mostrar_top_10(top_10):
+            stats = None
+            pausou = False
+            fim = None
+            for tipo, dados in execucao.obter_mensagens():
+                if tipo == 'geracao':
+                    stats = dados
+                    grafico.adicionar(dados['melhor_custo'], dados['custo_medio'])
+                elif tipo == 'pausa':
+                    pausou = True
+                else:  # 'fim' ou 'erro'
+                    fim = dados
+            
+            # Labels com o estado mais recente; o gráfico limita a taxa de quadros
+            if stats is not None:
+                estado['ultimas_estatisticas'] = stats
+                atualizar_estatisticas(stats)
+            grafico.atualizar(forcar=fim is not None)
+            
+            if pausou and estado['ultimas_estatisticas'] is not None:
+                mostrar_top_10(estado['ultimas_estatisticas'])
+                atualizar_botoes()
+            
+            if fim is None:
+                janela_ag.after(INTERVALO_SONDAGEM_AG_MS, sondar_execucao)
+                return
+            
+            estado['execucao'] = None
+            atualizar_botoes()
+            if isinstance(fim, str):
+                messagebox.showerror("Erro", f"Erro ao executar Algoritmo Genético:\n\n{fim}",
+                                     parent=janela_ag)
+            elif ag.melhor_individuo is not None:
+                mostrar_resultado_final(ag.melhor_individuo, cancelado=fim['cancelado'])
+        
+        def iniciar_execucao(geracoes, continuar=False):
+            execucao = ExecucaoAG(ag, geracoes, continuar=continuar,
+                                  pausar_a_cada=5 if mostrar_pop_var.get() else None)
+            estado['execucao'] = execucao
+            execucao.iniciar()
+            atualizar_botoes()
+            janela_ag.after(INTERVALO_SONDAGEM_AG_MS, sondar_execucao)
+        
+        def mostrar_top_10(stats):
             """Mostra os 10 melhores indivíduos"""
             texto_detalhes.delete('1.0', tk.END)
-            texto_detalhes.insert('1.0', f"Top 10 Melhores Rotas da Geração {ag.geracao_atual}:\n\n")
+            texto_detalhes.insert('1.0', f"Top 10 Melhores Rotas da Geração {stats['geracao']}:\n\n")
             
-            for i, ind in enumerate(top_10, 1):
+            for i, ind in enumerate(stats['top_10'], 1):
                 rota_completa = ind.obter_rota_completa()
                 nomes = [self.grafo.obter_nome_vertice(v) for v in rota_completa]
                 texto_detalhes.insert(tk.END, f"{i:2}. {' → '.join(nomes)}\n")
@@ -881,54 +1252,16 @@ Exemplo:
             
             # Adicionar instrução
             texto_detalhes.insert(tk.END, "\n" + "="*80 + "\n")
-            texto_detalhes.insert(tk.END, "Clique no botão 'Continuar Execução' abaixo quando terminar de visualizar.\n")
-            
-            # Forçar atualização da interface
-            janela_ag.update()
-        
-        def atualizar_grafico_evolucao():
-            """Atualiza o gráfico de evolução"""
-            for widget in frame_grafico.winfo_children():
-                widget.destroy()
-            
-            if len(ag.historico_melhor_custo) == 0:
-                return
-            
-            fig, ax = plt.subplots(figsize=(11, 4))
-            
-            geracoes = list(range(len(ag.historico_melhor_custo)))
-            ax.plot(geracoes, ag.historico_melhor_custo, 'b-', linewidth=2, label='Melhor Custo')
-            ax.plot(geracoes, ag.historico_custo_medio, 'r--', linewidth=1.5, label='Custo Médio')
-            
-            ax.set_xlabel('Geração', fontsize=10)
-            ax.set_ylabel('Custo', fontsize=10)
-            ax.set_title('Evolução do Algoritmo Genético', fontsize=12, fontweight='bold')
-            ax.legend()
-            ax.grid(True, alpha=0.3)
-            
-            canvas = FigureCanvasTkAgg(fig, master=frame_grafico)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            texto_detalhes.insert(tk.END, "Clique em 'Retomar' para continuar a execução.\n")
         
         def executar_ag():
-            """Executa o AG"""
-            ag_executando.set(True)
-            btn_executar.config(state=tk.DISABLED)
-            btn_continuar.config(state=tk.DISABLED)
-            
-            # Executar AG
-            melhor = ag.executar(max_geracoes=max_geracoes, callback_geracao=callback_geracao)
-            
-            # Mostrar resultado final
-            mostrar_resultado_final(melhor)
-            
-            ag_executando.set(False)
-            btn_executar.config(state=tk.DISABLED)
-            btn_continuar.config(state=tk.NORMAL)
+            """Executa o AG em segundo plano"""
+            estado['meta_geracoes'] = max_geracoes
+            iniciar_execucao(max_geracoes)
         
         def continuar_execucao():
             """Continua a execução por mais gerações"""
-            resposta = tk.simpledialog.askinteger(
+            resposta = simpledialog.askinteger(
                 "Continuar Execução",
                 "Quantas gerações adicionais?",
                 initialvalue=20,
@@ -938,21 +1271,33 @@ Exemplo:
             )
             
             if resposta:
-                ag_executando.set(True)
-                btn_continuar.config(state=tk.DISABLED)
-                
-                # Continuar por mais N gerações
-                for _ in range(resposta):
-                    ag.evoluir_geracao()
-                    callback_geracao(ag.geracao_atual, ag)
-                
-                # Mostrar novo resultado
-                mostrar_resultado_final(ag.melhor_individuo)
-                
-                ag_executando.set(False)
-                btn_continuar.config(state=tk.NORMAL)
+                estado['meta_geracoes'] = ag.geracao_atual + resposta
+                iniciar_execucao(resposta, continuar=True)
         
-        def mostrar_resultado_final(melhor_ind):
+        def pausar_ou_retomar():
+            execucao = estado['execucao']
+            if execucao is None:
+                return
+            if execucao.pausado:
+                execucao.retomar()
+            else:
+                execucao.pausar()
+            atualizar_botoes()
+        
+        def cancelar_execucao():
+            if estado['execucao'] is not None:
+                estado['execucao'].cancelar()
+        
+        def atualizar_botoes():
+            execucao = estado['execucao']
+            executando = execucao is not None
+            btn_executar.config(state=tk.DISABLED if executando or ag.populacao else tk.NORMAL)
+            btn_continuar.config(state=tk.NORMAL if not executando and ag.populacao else tk.DISABLED)
+            btn_pausar.config(state=tk.NORMAL if executando else tk.DISABLED,
+                              text="Retomar" if executando and execucao.pausado else "Pausar")
+            btn_cancelar.config(state=tk.NORMAL if executando else tk.DISABLED)
+        
+        def mostrar_resultado_final(melhor_ind, cancelado=False):
             """Mostra o resultado final graficamente"""
             # Atualizar área de texto
             texto_detalhes.delete('1.0', tk.END)
@@ -978,8 +1323,8 @@ Exemplo:
             visualizar_melhor_rota(melhor_ind)
             
             messagebox.showinfo(
-                "AG Concluído",
-                f"Algoritmo Genético concluído!\n\n"
+                "AG Cancelado" if cancelado else "AG Concluído",
+                f"Algoritmo Genético {'cancelado' if cancelado else 'concluído'}!\n\n"
                 f"Melhor custo encontrado: {melhor_ind.custo}\n"
                 f"Gerações executadas: {ag.geracao_atual}\n\n"
                 f"A melhor rota foi visualizada no canvas principal.",
@@ -1006,7 +1351,7 @@ Exemplo:
             visualizador = VisualizadorGrafo(self.grafo)
             
             if self.posicoes_salvas:
-                visualizador.posicoes_personalizadas = self.posicoes_salvas.copy()
+                visualizador.posicoes_personalizadas = self.posicoes_salvas
             
             fig = visualizador.desenhar_grafo(
                 titulo=f"Melhor Rota PCV (AG) - Custo: {melhor_ind.custo}",
@@ -1038,24 +1383,35 @@ Exemplo:
             
             self.atualizar_resultados(resultado)
         
-        def continuar_apos_visualizacao():
-            """Libera a execução após visualizar população"""
-            pausado_para_visualizacao.set(False)
+        def fechar_janela():
+            """Cancela a execução em andamento antes de fechar"""
+            if estado['execucao'] is not None:
+                estado['execucao'].cancelar()
+                estado['execucao'] = None
+            janela_ag.destroy()
         
         # Botões de controle
         btn_executar = ttk.Button(frame_controles, text="Executar AG", command=executar_ag)
         btn_executar.pack(side=tk.LEFT, padx=5)
         
-        btn_continuar_visualizacao = ttk.Button(frame_controles, text="Continuar Execução Após Visualizar", 
-                                                command=continuar_apos_visualizacao, state=tk.DISABLED)
-        btn_continuar_visualizacao.pack(side=tk.LEFT, padx=5)
+        btn_pausar = ttk.Button(frame_controles, text="Pausar", 
+                                command=pausar_ou_retomar, state=tk.DISABLED)
+        btn_pausar.pack(side=tk.LEFT, padx=5)
+        
+        btn_cancelar = ttk.Button(frame_controles, text="Cancelar", 
+                                  command=cancelar_execucao, state=tk.DISABLED)
+        btn_cancelar.pack(side=tk.LEFT, padx=5)
         
         btn_continuar = ttk.Button(frame_controles, text="Continuar Execução", 
                                    command=continuar_execucao, state=tk.DISABLED)
         btn_continuar.pack(side=tk.LEFT, padx=5)
         
+        ttk.Checkbutton(frame_controles, text="Pausar a cada 5 gerações para ver a população",
+                        variable=mostrar_pop_var).pack(side=tk.LEFT, padx=10)
+        
         ttk.Button(frame_controles, text="Fechar", 
-                  command=janela_ag.destroy).pack(side=tk.RIGHT, padx=5)
+                  command=fechar_janela).pack(side=tk.RIGHT, padx=5)
+        janela_ag.protocol("WM_DELETE_WINDOW", fechar_janela)
     
     def abrir_janela_interativa(self):
         """Abre uma janela matplotlib interativa com drag and drop"""
@@ -1074,7 +1430,7 @@ Exemplo:
         
         # Aplicar posições salvas se existirem
         if self.posicoes_salvas:
-            visualizador.posicoes_personalizadas = self.posicoes_salvas.copy()
+            visualizador.posicoes_personalizadas = self.posicoes_salvas
         
         # Usar o estado atual
         titulo = "Interativo - " + self.estado_atual['titulo']
@@ -1104,11 +1460,15 @@ Exemplo:
     def salvar_layout_personalizado(self):
         """Salva o layout personalizado do drag and drop"""
         if self.visualizador_atual and hasattr(self.visualizador_atual, 'posicoes') and self.visualizador_atual.posicoes:
-            self.posicoes_salvas = self.visualizador_atual.posicoes.copy()
+            try:
+                self.posicoes_salvas = salvar_layout(self.grafo, self.visualizador_atual.posicoes)
+            except OSError as erro:
+                messagebox.showerror("Erro", f"Erro ao gravar o layout:\n{erro}")
+                return
             
             messagebox.showinfo("Layout Salvo", 
                               "Layout personalizado salvo com sucesso!\n\n" +
-                              "Todas as visualizações agora usarão este layout.\n" +
+                              "Todas as visualizações (e as próximas aberturas deste grafo) usarão este layout.\n" +
                               "Use 'Resetar para Original' para voltar às coordenadas geográficas.")
             
             # Atualizar visualização atual
@@ -1118,10 +1478,34 @@ Exemplo:
                                  "Nenhum layout para salvar!\n\n" +
                                  "Primeiro abra a janela interativa e mova os vértices.")
     
+    def aplicar_layout_automatico(self):
+        """Calcula um layout por forças (Fruchterman-Reingold) e o salva como layout personalizado"""
+        from layout import calcular_layout  # NumPy só quando usado
+        
+        inicio = time.perf_counter()
+        posicoes = calcular_layout(self.grafo)
+        segundos = time.perf_counter() - inicio
+        try:
+            self.posicoes_salvas = salvar_layout(self.grafo, posicoes)
+        except OSError as erro:
+            # Sem disco, o layout vale só para esta sessão
+            self.posicoes_salvas = posicoes
+            messagebox.showwarning("Aviso", f"Layout aplicado, mas não foi gravado:\n{erro}")
+        self.visualizador_atual = None
+        
+        self.mostrar_grafo_original()
+        self.atualizar_resultados(f"Layout automático aplicado em {segundos:.2f}s "
+                                  f"({self.grafo.contar_vertices()} vértices).\n\n"
+                                  "Use 'Resetar para Original' para voltar às coordenadas geográficas.")
+    
     def resetar_layout(self):
         """Reseta para o layout original (coordenadas geográficas)"""
         if self.posicoes_salvas:
             self.posicoes_salvas = None
+            try:
+                remover_layout(self.grafo)
+            except OSError as erro:
+                messagebox.showerror("Erro", f"Erro ao apagar o layout salvo:\n{erro}")
             self.visualizador_atual = None
             
             messagebox.showinfo("Layout Resetado", 
@@ -1132,6 +1516,46 @@ Exemplo:
         else:
             messagebox.showinfo("Info", "O layout já está usando as coordenadas originais.")
     
+    def submeter_tarefa(self, nome, funcao, *args, ao_concluir=None):
+        """
+        Executa funcao(tarefa, *args) no agendador, sem bloquear a interface.
+        
+        ao_concluir(resultado) roda na thread da interface quando a tarefa
+        termina; erros são mostrados em uma caixa de mensagem.
+        """
+        def ao_erro(mensagem):
+            messagebox.showerror("Erro", f"{nome}:\n\n{mensagem}")
+        
+        self.agendador.submeter(nome, funcao, *args, ao_concluir=ao_concluir, ao_erro=ao_erro)
+        self.atualizar_lista_tarefas()
+    
+    def sondar_tarefas(self):
+        """Entrega as mensagens das tarefas (callbacks na thread da interface); reagenda-se"""
+        try:
+            if self.agendador.processar_mensagens():
+                self.atualizar_lista_tarefas()
+        finally:
+            self.root.after(INTERVALO_SONDAGEM_TAREFAS_MS, self.sondar_tarefas)
+    
+    def atualizar_lista_tarefas(self):
+        # A lista é refeita a cada progresso: a seleção é reaplicada pela tarefa
+        selecionadas = {self.tarefas_listadas[i].id for i in self.lista_tarefas.curselection()
+                        if i < len(self.tarefas_listadas)}
+        self.tarefas_listadas = self.agendador.ativas()
+        self.lista_tarefas.delete(0, tk.END)
+        for i, tarefa in enumerate(self.tarefas_listadas):
+            self.lista_tarefas.insert(tk.END, tarefa.descrever())
+            if tarefa.id in selecionadas:
+                self.lista_tarefas.selection_set(i)
+    
+    def cancelar_tarefa_selecionada(self):
+        selecao = self.lista_tarefas.curselection()
+        if not selecao:
+            messagebox.showinfo("Tarefas", "Selecione uma tarefa na lista.")
+            return
+        self.tarefas_listadas[selecao[0]].cancelar()
+        self.atualizar_lista_tarefas()
+    
     def limpar_canvas(self):
         """Limpa o canvas atual"""
         if self.canvas_atual:
@@ -1158,6 +1582,9 @@ Exemplo:
         Executa limpeza de canvases/figuras e encerra o mainloop corretamente.
         """
         try:
+            # Interromper análises em segundo plano
+            self.agendador.encerrar()
+            
             # Limpar canvas embutidos
             self.limpar_canvas()
 
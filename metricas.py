@@ -0,0 +1,381 @@
+"""
+Métricas estruturais de grafos
+- Análise estrutural em uma única DFS (conectividade, bipartição, graus,
+  componentes biconexas e pontos de articulação), em cache por versão do grafo
+- Cintura (tamanho do menor ciclo) com BFS podada e execução paralela opcional
+"""
+
+from collections import deque, Counter
+import os
+import weakref
+
+from grafo import Grafo
+
+
+# Adjacências do grafo nos processos trabalhadores (definidas pelo inicializador)
+_adjacencias_trabalhador = None
+
+# Cache das análises: {grafo: (versao, analise)}
+_cache_analises = weakref.WeakKeyDictionary()
+
+# Vértices visitados pela busca da cintura entre chamadas a verificar()
+INTERVALO_VERIFICACAO = 65536
+
+
+def obter_analise(grafo: Grafo) -> dict:
+    """
+    Retorna a análise estrutural do grafo, recalculando-a apenas se o
+    grafo foi modificado desde a última chamada (atributo versao).
+    """
+    versao = getattr(grafo, 'versao', None)
+    em_cache = _cache_analises.get(grafo)
+    if em_cache is not None and versao is not None and em_cache[0] == versao:
+        return em_cache[1]
+
+    analise = analisar_estrutura(grafo)
+    _cache_analises[grafo] = (versao, analise)
+    return analise
+
+
+def invalidar_analise(grafo: Grafo):
+    """Descarta a análise em cache do grafo (a próxima será recalculada)"""
+    _cache_analises.pop(grafo, None)
+
+
+def analisar_estrutura(grafo: Grafo) -> dict:
+    """
+    Calcula as propriedades estruturais do grafo em uma única DFS iterativa, O(V + E).
+
+    Returns:
+        Dicionário com:
+        - num_vertices, num_arestas (sem laços)
+        - conexo, num_componentes, componente ({v: id da componente})
+        - bipartido, particao ({v: 0 ou 1}, None se não for bipartido)
+        - histograma_graus ({grau: quantidade}), grau_minimo, grau_maximo
+        - blocos (componentes biconexas, cada uma uma lista de arestas (v1, v2))
+        - articulacoes (pontos de articulação)
+    """
+    vertices = grafo.obter_todos_vertices()
+    n = len(vertices)
+    indice = {v: i for i, v in enumerate(vertices)}
+    adjacencias = [[indice[w] for w, _ in grafo.obter_vizinhos(v)] for v in vertices]
+
+    histograma_graus = Counter(len(vizinhos) for vizinhos in adjacencias)
+    bipartido = True
+    num_lacos = 0
+
+    descoberta = [-1] * n
+    menor = [0] * n  # lowpoint: menor tempo de descoberta alcançável
+    pai = [-1] * n
+    proximo = [0] * n
+    lado = [0] * n
+    componente = [-1] * n
+    eh_articulacao = [False] * n
+    blocos = []
+    pilha_arestas = []
+    tempo = 0
+    num_componentes = 0
+
+    for raiz in range(n):
+        if descoberta[raiz] >= 0:
+            continue
+
+        componente[raiz] = num_componentes
+        num_componentes += 1
+        descoberta[raiz] = menor[raiz] = tempo
+        tempo += 1
+        filhos_raiz = 0
+        pilha_dfs = [raiz]
+
+        while pilha_dfs:
+            v = pilha_dfs[-1]
+
+            if proximo[v] < len(adjacencias[v]):
+                w = adjacencias[v][proximo[v]]
+                proximo[v] += 1
+
+                if w == v:
+                    # Laço: impede a bipartição, mas não afeta os blocos
+                    num_lacos += 1
+                    bipartido = False
+                elif descoberta[w] < 0:
+                    # Aresta de árvore
+                    pai[w] = v
+                    descoberta[w] = menor[w] = tempo
+                    tempo += 1
+                    lado[w] = 1 - lado[v]
+                    componente[w] = componente[raiz]
+                    pilha_arestas.append((v, w))
+                    pilha_dfs.append(w)
+                    if v == raiz:
+                        filhos_raiz += 1
+                elif w != pai[v] and descoberta[w] < descoberta[v]:
+                    # Aresta de retorno para um ancestral
+                    menor[v] = min(menor[v], descoberta[w])
+                    pilha_arestas.append((v, w))
+                    if lado[w] == lado[v]:
+                        bipartido = False
+            else:
+                pilha_dfs.pop()
+                p = pai[v]
+                if p < 0:
+                    continue
+
+                menor[p] = min(menor[p], menor[v])
+                if menor[v] >= descoberta[p]:
+                    # p separa a subárvore de v: fechar um bloco
+                    if p != raiz or filhos_raiz > 1:
+                        eh_articulacao[p] = True
+                    bloco = []
+                    while True:
+                        a, b = pilha_arestas.pop()
+                        bloco.append((vertices[a], vertices[b]))
+                        if (a, b) == (p, v):
+                            break
+                    blocos.append(bloco)
+
+    # Cada laço aparece duas vezes na lista de adjacência
+    num_arestas = sum(len(vizinhos) for vizinhos in adjacencias) // 2 - num_lacos // 2
+
+    return {
+        'num_vertices': n,
+        'num_arestas': num_arestas,
+        'conexo': num_componentes <= 1,
+        'num_componentes': num_componentes,
+        'componente': {vertices[i]: c for i, c in enumerate(componente)},
+        'bipartido': bipartido,
+        'particao': {vertices[i]: l for i, l in enumerate(lado)} if bipartido else None,
+        'histograma_graus': dict(histograma_graus),
+        'grau_minimo': min(histograma_graus) if n else 0,
+        'grau_maximo': max(histograma_graus) if n else 0,
+        'blocos': blocos,
+        'articulacoes': [vertices[i] for i in range(n) if eh_articulacao[i]]
+    }
+
+
+def construir_arvore_blocos(grafo: Grafo) -> dict:
+    """
+    Monta a árvore de blocos e articulações (block-cut tree) do grafo.
+
+    Os nós da árvore são os blocos (componentes biconexas) e os pontos de
+    articulação; cada articulação liga-se aos blocos que a contêm.
+
+    Returns:
+        Dicionário com:
+        - blocos: [{'vertices': [v], 'arestas': [(v1, v2)]}]
+        - articulacoes: pontos de articulação
+        - arestas: [(índice do bloco, articulação)]
+    """
+    analise = obter_analise(grafo)
+    articulacoes = set(analise['articulacoes'])
+    blocos = []
+    arestas = []
+
+    for i, arestas_bloco in enumerate(analise['blocos']):
+        vertices = list(dict.fromkeys(v for aresta in arestas_bloco for v in aresta))
+        blocos.append({'vertices': vertices, 'arestas': arestas_bloco})
+        arestas.extend((i, v) for v in vertices if v in articulacoes)
+
+    return {
+        'blocos': blocos,
+        'articulacoes': analise['articulacoes'],
+        'arestas': arestas
+    }
+
+
+def calcular_cintura(grafo: Grafo, processos: int = None, verificar=None) -> int:
+    """
+    Calcula a cintura (tamanho do menor ciclo) do grafo.
+
+    Otimizações em relação à BFS completa de cada vértice:
+    - só vértices do 2-core são origens (todo ciclo está contido nele)
+    - a BFS é podada quando a profundidade não pode mais gerar um
+      ciclo menor que o melhor encontrado (2·d ≥ melhor)
+    - a busca para assim que o limite inferior é atingido
+      (3 em geral, 4 para grafos bipartidos)
+
+    Args:
+        grafo: Grafo a analisar
+        processos: Número de processos para distribuir as origens
+                   (None ou 1 executa no processo atual)
+        verificar: Função sem argumentos chamada periodicamente durante a
+                   busca; uma exceção nela a interrompe (cancelamento)
+
+    Returns:
+        Tamanho do menor ciclo, ou 0 se o grafo for acíclico
+    """
+    vertices = grafo.obter_todos_vertices()
+    indice = {v: i for i, v in enumerate(vertices)}
+    adjacencias = [[indice[w] for w, _ in grafo.obter_vizinhos(v)] for v in vertices]
+
+    # Laço é um ciclo de tamanho 1
+    if any(i in vizinhos for i, vizinhos in enumerate(adjacencias)):
+        return 1
+
+    origens = obter_2_core(adjacencias)
+    if not origens:
+        return 0
+
+    limite_inferior = 4 if eh_bipartido_adjacencias(adjacencias) else 3
+
+    if not processos or processos <= 1 or len(origens) < 2 * processos:
+        melhor = cintura_a_partir_de(adjacencias, origens, float('inf'), limite_inferior, verificar)
+    else:
+        melhor = cintura_paralela(adjacencias, origens, limite_inferior, processos, verificar)
+
+    return melhor if melhor != float('inf') else 0
+
+
+def obter_2_core(adjacencias) -> list:
+    """
+    Retorna os vértices do 2-core (remove repetidamente vértices de grau ≤ 1).
+    """
+    grau = [len(vizinhos) for vizinhos in adjacencias]
+    removido = [False] * len(adjacencias)
+    fila = deque(i for i, g in enumerate(grau) if g <= 1)
+
+    while fila:
+        v = fila.popleft()
+        if removido[v]:
+            continue
+        removido[v] = True
+        for w in adjacencias[v]:
+            if not removido[w]:
+                grau[w] -= 1
+                if grau[w] <= 1:
+                    fila.append(w)
+
+    return [i for i in range(len(adjacencias)) if not removido[i]]
+
+
+def eh_bipartido_adjacencias(adjacencias) -> bool:
+    """Verifica se o grafo (em listas de adjacência por índice) é bipartido"""
+    cor = [-1] * len(adjacencias)
+
+    for inicio in range(len(adjacencias)):
+        if cor[inicio] >= 0:
+            continue
+        cor[inicio] = 0
+        fila = deque([inicio])
+        while fila:
+            v = fila.popleft()
+            for w in adjacencias[v]:
+                if cor[w] < 0:
+                    cor[w] = 1 - cor[v]
+                    fila.append(w)
+                elif cor[w] == cor[v]:
+                    return False
+
+    return True
+
+
+def cintura_a_partir_de(adjacencias, origens, melhor, limite_inferior, verificar=None):
+    """
+    Menor ciclo encontrado por BFS a partir das origens dadas.
+
+    Args:
+        adjacencias: Listas de adjacência por índice
+        origens: Índices dos vértices de origem
+        melhor: Melhor cintura já conhecida (limite superior)
+        limite_inferior: Valor que encerra a busca quando alcançado
+        verificar: Chamada a cada INTERVALO_VERIFICACAO vértices visitados
+                   (somando as BFS); uma exceção nela interrompe a busca
+    """
+    distancia = [-1] * len(adjacencias)
+    pai = [-1] * len(adjacencias)
+    visitados_desde_verificacao = 0
+
+    for inicio in origens:
+        if melhor <= limite_inferior:
+            break
+
+        if verificar is not None and visitados_desde_verificacao >= INTERVALO_VERIFICACAO:
+            verificar()
+            visitados_desde_verificacao = 0
+
+        distancia[inicio] = 0
+        visitados = [inicio]
+        fila = deque([inicio])
+
+        while fila:
+            v = fila.popleft()
+
+            # Ciclos achados a partir de v têm tamanho ≥ 2·d(v)
+            if 2 * distancia[v] >= melhor:
+                break
+
+            for w in adjacencias[v]:
+                if distancia[w] < 0:
+                    distancia[w] = distancia[v] + 1
+                    pai[w] = v
+                    visitados.append(w)
+                    fila.append(w)
+                elif pai[v] != w:
+                    # Encontrou um ciclo
+                    melhor = min(melhor, distancia[v] + distancia[w] + 1)
+
+        # Limpar apenas os vértices tocados por esta BFS
+        for v in visitados:
+            distancia[v] = -1
+            pai[v] = -1
+        visitados_desde_verificacao += len(visitados)
+
+    return melhor
+
+
+def _inicializar_trabalhador(adjacencias):
+    """Guarda as adjacências no processo trabalhador (enviadas uma vez só)"""
+    global _adjacencias_trabalhador
+    _adjacencias_trabalhador = adjacencias
+
+
+def _cintura_bloco(origens, melhor, limite_inferior):
+    """Tarefa executada nos processos trabalhadores"""
+    return cintura_a_partir_de(_adjacencias_trabalhador, origens, melhor, limite_inferior)
+
+
+def cintura_paralela(adjacencias, origens, limite_inferior, processos, verificar=None):
+    """
+    Distribui as origens em blocos por um pool de processos.
+
+    Cada bloco novo parte do melhor valor conhecido até o momento, e os
+    blocos restantes são cancelados quando o limite inferior é atingido
+    (ou quando verificar, chamada a cada bloco concluído, levanta exceção).
+    """
+    # Importado só aqui: evita carregar multiprocessing no import do módulo
+    from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+    processos = min(processos, os.cpu_count() or 1)
+    tamanho_bloco = max(1, len(origens) // (processos * 8))
+    blocos = [origens[i:i + tamanho_bloco] for i in range(0, len(origens), tamanho_bloco)]
+    blocos.reverse()
+    melhor = float('inf')
+
+    with ProcessPoolExecutor(max_workers=processos, initializer=_inicializar_trabalhador,
+                             initargs=(adjacencias,)) as executor:
+        pendentes = set()
+        while blocos or pendentes:
+            while blocos and len(pendentes) < processos * 2 and melhor > limite_inferior:
+                pendentes.add(executor.submit(_cintura_bloco, blocos.pop(), melhor, limite_inferior))
+
+            if not pendentes:
+                break
+
+            concluidos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+            for futuro in concluidos:
+                melhor = min(melhor, futuro.result())
+
+            if verificar is not None:
+                try:
+                    verificar()
+                except BaseException:
+                    for futuro in pendentes:
+                        futuro.cancel()
+                    raise
+
+            if melhor <= limite_inferior:
+                for futuro in pendentes:
+                    futuro.cancel()
+                break
+
+    return melhor
@@ -0,0 +1,183 @@
+"""
+Índice espacial e níveis de detalhe para visualizar grafos enormes
+Os vértices ficam ordenados por célula de uma grade regular, então os
+vértices de um retângulo (a área visível) saem de uma fatia contígua por
+coluna da grade. Quando há elementos demais à vista, o grafo é agregado:
+cada célula de uma grade mais grossa vira um ponto (no centróide dos
+seus vértices) e as arestas entre células distintas viram um único
+segmento. Os níveis agregados são calculados sob demanda e guardados.
+
+Tudo é vetorizado com NumPy (já exigido pelo matplotlib).
+"""
+
+import math
+
+import numpy as np
+
+
+def polilinha(xs, ys, origens, destinos):
+    """
+    Arestas como uma única polilinha separada por NaN (x0, x1, nan, ...).
+
+    Um Line2D com esses dados vira um só Path, montado sem laço Python,
+    enquanto LineCollection.set_segments cria um Path por aresta.
+
+    Returns:
+        (x, y) com 3 pontos por aresta
+    """
+    x = np.full((len(origens), 3), np.nan)
+    y = np.full((len(origens), 3), np.nan)
+    x[:, 0], x[:, 1] = xs[origens], xs[destinos]
+    y[:, 0], y[:, 1] = ys[origens], ys[destinos]
+    return x.ravel(), y.ravel()
+
+
+class IndiceViewport:
+    """
+    Consulta dos elementos visíveis de um grafo em uma janela (x0..x1, y0..y1).
+
+    Os vértices são identificados pelo índice (0..n-1) nos arrays de
+    posições; as arestas, pelo índice nos arrays de origens/destinos.
+    """
+
+    # Resolução da agregação: células por largura da janela visível
+    CELULAS_POR_JANELA = 160
+
+    def __init__(self, xs, ys, origens, destinos, vertices_por_celula: int = 4):
+        self.xs = np.asarray(xs, dtype=np.float64)
+        self.ys = np.asarray(ys, dtype=np.float64)
+        self.origens = np.asarray(origens, dtype=np.int64)
+        self.destinos = np.asarray(destinos, dtype=np.int64)
+        n = len(self.xs)
+
+        self.x_min = float(self.xs.min()) if n else 0.0
+        self.y_min = float(self.ys.min()) if n else 0.0
+        largura = (float(self.xs.max()) - self.x_min) if n else 1.0
+        altura = (float(self.ys.max()) - self.y_min) if n else 1.0
+        extensao = max(largura, altura, 1e-9)
+
+        # Grade com ~vertices_por_celula vértices por célula (em média)
+        lado_celulas = max(1, int(math.sqrt(max(n, 1) / vertices_por_celula)))
+        self.lado = extensao / lado_celulas * (1 + 1e-9)
+        self.colunas = int(largura / self.lado) + 1
+        self.linhas = int(altura / self.lado) + 1
+
+        cx = ((self.xs - self.x_min) / self.lado).astype(np.int64)
+        cy = ((self.ys - self.y_min) / self.lado).astype(np.int64)
+        chaves = cx * self.linhas + cy
+        self.ordem = np.argsort(chaves, kind='stable')
+        # inicio[c]..inicio[c + 1]: posições em ordem dos vértices da célula c
+        self.inicio = np.searchsorted(chaves[self.ordem], np.arange(self.colunas * self.linhas + 1))
+
+        self.niveis = {}  # {expoente: nível agregado}
+
+    def _fatias(self, x0, x1, y0, y1):
+        """(inícios, fins) em self.ordem das células que cobrem o retângulo, uma por coluna"""
+        c0 = max(0, int((x0 - self.x_min) // self.lado))
+        c1 = min(self.colunas - 1, int((x1 - self.x_min) // self.lado))
+        l0 = max(0, int((y0 - self.y_min) // self.lado))
+        l1 = min(self.linhas - 1, int((y1 - self.y_min) // self.lado))
+        if c0 > c1 or l0 > l1:
+            vazio = np.empty(0, dtype=np.int64)
+            return vazio, vazio
+        colunas = np.arange(c0, c1 + 1) * self.linhas
+        return self.inicio[colunas + l0], self.inicio[colunas + l1 + 1]
+
+    def estimar_vertices(self, x0, x1, y0, y1) -> int:
+        """Limite superior do número de vértices no retângulo, sem materializá-los"""
+        inicios, fins = self._fatias(x0, x1, y0, y1)
+        return int((fins - inicios).sum())
+
+    def vertices_no_retangulo(self, x0, x1, y0, y1):
+        """Índices dos vértices dentro do retângulo (uma fatia por coluna da grade)"""
+        inicios, fins = self._fatias(x0, x1, y0, y1)
+        if not len(inicios):
+            return np.empty(0, dtype=np.int64)
+        candidatos = np.concatenate([self.ordem[i:f] for i, f in zip(inicios, fins)])
+
+        # Células da borda podem ter vértices fora do retângulo
+        xs, ys = self.xs[candidatos], self.ys[candidatos]
+        return candidatos[(xs >= x0) & (xs <= x1) & (ys >= y0) & (ys <= y1)]
+
+    def arestas_incidentes(self, vertices):
+        """Índices das arestas com pelo menos uma extremidade no conjunto"""
+        mascara = np.zeros(len(self.xs), dtype=bool)
+        mascara[vertices] = True
+        return np.flatnonzero(mascara[self.origens] | mascara[self.destinos])
+
+    def nivel_agregado(self, expoente: int) -> dict:
+        """
+        Grafo agregado em células de lado self.lado · 2^expoente.
+
+        Returns:
+            {'lado', 'xs', 'ys', 'contagens', 'origens', 'destinos'}: um ponto por
+            célula não vazia e uma aresta por par de células ligadas
+        """
+        nivel = self.niveis.get(expoente)
+        if nivel is not None:
+            return nivel
+
+        lado = self.lado * (2 ** expoente)
+        cx = ((self.xs - self.x_min) // lado).astype(np.int64)
+        cy = ((self.ys - self.y_min) // lado).astype(np.int64)
+        chaves = cx * (int(cy.max(initial=0)) + 1) + cy
+        celulas, celula_do_vertice = np.unique(chaves, return_inverse=True)
+
+        contagens = np.bincount(celula_do_vertice, minlength=len(celulas))
+        xs = np.bincount(celula_do_vertice, weights=self.xs, minlength=len(celulas)) / contagens
+        ys = np.bincount(celula_do_vertice, weights=self.ys, minlength=len(celulas)) / contagens
+
+        a = celula_do_vertice[self.origens]
+        b = celula_do_vertice[self.destinos]
+        distintas = a != b
+        a, b = np.minimum(a[distintas], b[distintas]), np.maximum(a[distintas], b[distintas])
+        pares = np.unique(a * len(celulas) + b)
+
+        nivel = {
+            'lado': lado,
+            'xs': xs,
+            'ys': ys,
+            'contagens': contagens,
+            'origens': pares // len(celulas),
+            'destinos': pares % len(celulas)
+        }
+        self.niveis[expoente] = nivel
+        return nivel
+
+    def consultar(self, x0, x1, y0, y1, limite: int) -> dict:
+        """
+        Elementos a desenhar na janela.
+
+        Se a janela tiver até limite vértices, devolve os vértices e arestas
+        exatos (nivel 0); senão, os do nível agregado cuja célula tem cerca
+        de 1/CELULAS_POR_JANELA da largura da janela.
+
+        Returns:
+            {'nivel', 'vertices', 'arestas'} no nível 0, ou
+            {'nivel', 'xs', 'ys', 'contagens', 'arestas_x', 'arestas_y'} nos
+            agregados (arestas como em polilinha)
+        """
+        # A estimativa evita materializar milhões de índices com o zoom afastado
+        if self.estimar_vertices(x0, x1, y0, y1) <= 2 * limite:
+            vertices = self.vertices_no_retangulo(x0, x1, y0, y1)
+            if len(vertices) <= limite:
+                return {'nivel': 0, 'vertices': vertices, 'arestas': self.arestas_incidentes(vertices)}
+
+        lado_desejado = max(x1 - x0, y1 - y0) / self.CELULAS_POR_JANELA
+        expoente = max(1, math.ceil(math.log2(max(lado_desejado / self.lado, 1.0))))
+        nivel = self.nivel_agregado(expoente)
+
+        xs, ys = nivel['xs'], nivel['ys']
+        visiveis = (xs >= x0) & (xs <= x1) & (ys >= y0) & (ys <= y1)
+        arestas = visiveis[nivel['origens']] | visiveis[nivel['destinos']]
+
+        arestas_x, arestas_y = polilinha(xs, ys, nivel['origens'][arestas], nivel['destinos'][arestas])
+
+        return {
+            'nivel': expoente,
+            'xs': xs[visiveis],
+            'ys': ys[visiveis],
+            'contagens': nivel['contagens'][visiveis],
+            'arestas_x': arestas_x,
+            'arestas_y': arestas_y
+        }
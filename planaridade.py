@@ -1,16 +1,193 @@
-from collections import deque
+from collections import Counter, deque
+import os
 from grafo import Grafo
+from metricas import calcular_cintura, obter_analise, construir_arvore_blocos
+import instrumentacao
+
+
+class Intervalo:
+    """
+    Intervalo de arestas de retorno na pilha de conflitos do teste LR.
+    
+    low e high são as arestas de retorno mais baixa e mais alta do intervalo.
+    """
+    
+    def __init__(self, low=None, high=None):
+        self.low = low
+        self.high = high
+    
+    def vazio(self) -> bool:
+        """Retorna True se o intervalo não contém arestas"""
+        return self.low is None and self.high is None
+    
+    def copiar(self):
+        """Retorna uma cópia do intervalo"""
+        return Intervalo(self.low, self.high)
+    
+    def conflitante(self, aresta, ponto_baixo) -> bool:
+        """Verifica se o intervalo conflita com a aresta (retorna acima dela)"""
+        return not self.vazio() and ponto_baixo[self.high] > ponto_baixo[aresta]
+
+
+class ParConflito:
+    """
+    Par de intervalos (esquerdo, direito) que precisam ficar em lados
+    opostos da árvore DFS.
+    """
+    
+    def __init__(self, esquerdo=None, direito=None):
+        self.esquerdo = esquerdo if esquerdo is not None else Intervalo()
+        self.direito = direito if direito is not None else Intervalo()
+    
+    def trocar(self):
+        """Troca os lados esquerdo e direito"""
+        self.esquerdo, self.direito = self.direito, self.esquerdo
+    
+    def mais_baixo(self, ponto_baixo):
+        """Retorna o menor lowpoint entre as arestas do par"""
+        if self.esquerdo.vazio():
+            return ponto_baixo[self.direito.low]
+        if self.direito.vazio():
+            return ponto_baixo[self.esquerdo.low]
+        return min(ponto_baixo[self.esquerdo.low], ponto_baixo[self.direito.low])
+
+
+def diagnosticar_bloco(arestas) -> tuple:
+    """
+    Testa a planaridade de um bloco (componente biconexa).
+    
+    Função de módulo para poder ser executada em processos trabalhadores.
+    
+    Returns:
+        (eh_planar, razao)
+    """
+    num_vertices = len({v for aresta in arestas for v in aresta})
+    num_arestas = len(arestas)
+    
+    # K3,3 (9 arestas) é o menor grafo não planar
+    if num_vertices <= 4 or num_arestas <= 8:
+        return True, "Bloco pequeno demais para conter K5 ou K3,3"
+    
+    if num_arestas > 3 * num_vertices - 6:
+        return False, f"Violação E ≤ 3V - 6: {num_arestas} > {3*num_vertices - 6}"
+    
+    # Um bloco com E = V é um ciclo simples
+    if num_arestas == num_vertices:
+        return True, "Bloco é um ciclo"
+    
+    if VerificadorPlanaridade(Grafo()).eh_planar_arestas(arestas):
+        return True, "Bloco é planar (teste Left-Right)"
+    return False, "Teste LR falhou no bloco"
+
+
+def agrupar_cadeias(arestas) -> list:
+    """
+    Poda os vértices de grau 1 (repetidamente) e agrupa as arestas restantes
+    em cadeias: caminhos maximais cujos vértices internos têm grau 2.
+    
+    Árvores penduradas não afetam a planaridade, e todas as arestas de uma
+    cadeia são igualmente essenciais para a não-planaridade (remover
+    qualquer uma delas deixa o resto da cadeia pendurado).
+    
+    Returns:
+        [[(v1, v2), ...]] uma lista de arestas por cadeia
+    """
+    incidentes = {}
+    for i, (v1, v2) in enumerate(arestas):
+        incidentes.setdefault(v1, []).append(i)
+        incidentes.setdefault(v2, []).append(i)
+    viva = [True] * len(arestas)
+    grau = {v: len(indices) for v, indices in incidentes.items()}
+    
+    def outra_ponta(i, v):
+        v1, v2 = arestas[i]
+        return v2 if v1 == v else v1
+    
+    pendentes = [v for v, g in grau.items() if g == 1]
+    while pendentes:
+        v = pendentes.pop()
+        if grau[v] != 1:
+            continue
+        i = next(i for i in incidentes[v] if viva[i])
+        viva[i] = False
+        w = outra_ponta(i, v)
+        grau[v] -= 1
+        grau[w] -= 1
+        if grau[w] == 1:
+            pendentes.append(w)
+    
+    visitada = [False] * len(arestas)
+    cadeias = []
+    for inicio in range(len(arestas)):
+        if not viva[inicio] or visitada[inicio]:
+            continue
+        visitada[inicio] = True
+        cadeia = [arestas[inicio]]
+        # Estende nos dois sentidos enquanto o vértice tiver grau 2
+        for v in arestas[inicio]:
+            atual = inicio
+            while grau[v] == 2:
+                proxima = next(i for i in incidentes[v] if viva[i] and i != atual)
+                if visitada[proxima]:
+                    break  # Ciclo isolado
+                visitada[proxima] = True
+                cadeia.append(arestas[proxima])
+                atual, v = proxima, outra_ponta(proxima, v)
+        cadeias.append(cadeia)
+    return cadeias
+
+
+def ordenar_por_proximidade(fixas: list, candidatas: list) -> list:
+    """
+    Ordena as cadeias candidatas por uma BFS que parte dos vértices das
+    cadeias fixas: primeiro as que alcançam vértices novos (a árvore da
+    BFS, em ordem de distância), depois as que só fecham ciclos; as não
+    alcançadas mantêm a ordem original, no fim.
+    
+    Como a árvore sozinha é planar, o menor prefixo não-planar fica perto
+    de "fixas + caminhos curtos entre elas", e a poda de agrupar_cadeias
+    remove os galhos da árvore que não foram usados.
+    """
+    if not fixas:
+        return candidatas
+    
+    incidentes = {}
+    for i, cadeia in enumerate(candidatas):
+        for aresta in cadeia:
+            for v in aresta:
+                incidentes.setdefault(v, []).append(i)
+    
+    fila = deque(dict.fromkeys(v for cadeia in fixas for aresta in cadeia for v in aresta))
+    visitados = set(fila)
+    incluida = [False] * len(candidatas)
+    arvore, ciclos = [], []
+    while fila:
+        v = fila.popleft()
+        for i in incidentes.get(v, ()):
+            if incluida[i]:
+                continue
+            incluida[i] = True
+            novos = [w for aresta in candidatas[i] for w in aresta if w not in visitados]
+            (arvore if novos else ciclos).append(candidatas[i])
+            for w in novos:
+                if w not in visitados:
+                    visitados.add(w)
+                    fila.append(w)
+    
+    return arvore + ciclos + [cadeia for i, cadeia in enumerate(candidatas) if not incluida[i]]
 
 
 class VerificadorPlanaridade:
     """
-    Verificação de planaridade usando algoritmo de Hopcroft-Tarjan (1974).
+    Verificação de planaridade usando o teste Left-Right (LR)
+    de de Fraysseix e Rosenstiehl, na formulação de Brandes (2009).
     
-    O algoritmo é baseado em:
-    1. DFS (Busca em Profundidade) para criar árvore DFS
-    2. Cálculo de lowpoints (pontos baixos)
-    3. Verificação de ciclos e entrelaçamento
-    4. Teste de planaridade por componentes biconexas
+    O algoritmo roda em tempo O(V + E) e é baseado em:
+    1. DFS de orientação: orienta as arestas, calcula alturas,
+       lowpoints e a profundidade de aninhamento de cada aresta
+    2. DFS de teste: percorre as arestas em ordem de aninhamento
+       mantendo uma pilha de pares de conflito; o grafo é planar
+       se e somente se as restrições esquerda/direita são satisfatíveis
     """
     
     def __init__(self, grafo: Grafo):
@@ -21,329 +198,835 @@ class VerificadorPlanaridade:
         self.num_vertices = grafo.contar_vertices()
         self.num_arestas = grafo.contar_arestas()
         
-        # Estruturas para DFS
-        self.numero_dfs = {}  # Número DFS de cada vértice
-        self.ponto_baixo = {}  # Lowpoint de cada vértice
-        self.pai_dfs = {}  # Pai na árvore DFS
-        self.contador_dfs = 0
-        self.visitado = set()
+        # Certificados (calculados sob demanda)
+        self.embedding = None  # {v: [vizinhos em sentido horário]}
+        self.subgrafo_kuratowski = None
+        self.diagnostico_blocos = None
+        self.resultado_planaridade = None  # (eh_planar, razao) de verificar_planaridade
+        
+        self.reiniciar_estruturas()
+    
+    def reiniciar_estruturas(self, num_vertices=0):
+        """
+        (Re)inicializa as estruturas usadas pelas DFS do teste LR.
+        
+        As DFS trabalham com índices inteiros 0..n-1 e guardam a árvore
+        em arrays indexados pelo vértice.
+        """
+        # Mapeamento vértice <-> índice
+        self.vertices_indice = []  # índice -> vértice
+        self.indice = {}  # vértice -> índice
+        self.adjacencias = []  # [[índices dos vizinhos]] testadas
+        
+        # Árvore DFS (arrays indexados pelo índice do vértice)
+        self.altura = [-1] * num_vertices  # Altura na árvore DFS (-1 = não visitado)
+        self.pai = [-1] * num_vertices  # Pai na árvore DFS (-1 para raízes)
+        self.filhos = [[] for _ in range(num_vertices)]
+        self.aresta_pai = [None] * num_vertices  # Aresta de árvore que chega no vértice
+        self.pre_ordem = [-1] * num_vertices
+        self.pos_ordem = [-1] * num_vertices
+        self.fim_subarvore = [-1] * num_vertices  # Maior pré-ordem da subárvore
+        self.vertices_em_pre_ordem = []
+        self.retornos = [[] for _ in range(num_vertices)]  # Destinos das back edges
+        self.contador_pre = 0
+        self.contador_pos = 0
+        self.raizes = []  # Raízes da floresta DFS (uma por componente)
+        self.proximo = [0] * num_vertices  # Próxima adjacência a visitar em cada DFS
+        
+        # Orientação das arestas
+        self.adjacencias_orientadas = [[] for _ in range(num_vertices)]
         
-        # Classificação de arestas
-        self.arestas_arvore = set()  # Arestas da árvore DFS
-        self.arestas_retorno = set()  # Back edges
+        # Estruturas do teste LR (indexadas por aresta orientada (v, w))
+        self.ponto_baixo = {}  # Lowpoint de cada aresta
+        self.ponto_baixo2 = {}  # Segundo lowpoint de cada aresta
+        self.profundidade_aninhamento = {}
+        self.aresta_ponto_baixo = {}
+        self.ref = {}
+        self.lado = {}
+        self.pilha = []  # Pilha de pares de conflito
+        self.base_pilha = {}
+        
+        self.resultado_lr = None  # Resultado do último teste do grafo inteiro
+        
+        # Estruturas do embedding (alocadas em construir_embedding)
+        self.sentido_horario = []  # [{w: próximo vizinho em sentido horário}]
+        self.sentido_anti_horario = []  # [{w: próximo em sentido anti-horário}]
+        self.primeiro_vizinho = []
+        self.referencia_esquerda = []
+        self.referencia_direita = []
     
-    def verificar_planaridade(self) -> tuple:
+    @instrumentacao.medir_fase('planaridade.verificar_planaridade')
+    def verificar_planaridade(self, processos: int = None) -> tuple:
         """
         Verifica se o grafo é planar
         Passos:
         1. Verificações rápidas (condições necessárias)
-        2. DFS para construir árvore e calcular lowpoints
-        3. Testar entrelaçamento de ciclos
+        2. Teste Left-Right de cada bloco (verificar_planaridade_por_blocos),
+           distribuído por um pool de processos se processos > 1
+        
+        O resultado fica guardado no verificador: o diagnóstico por blocos,
+        o embedding e o subgrafo de Kuratowski reaproveitam os mesmos testes.
         """
+        if self.resultado_planaridade is None:
+            self.resultado_planaridade = self.decidir_planaridade(processos)
+        return self.resultado_planaridade
+    
+    def decidir_planaridade(self, processos: int = None) -> tuple:
+        """Executa as verificações de verificar_planaridade (sem o cache)"""
         # Caso trivial: grafos pequenos sempre são planares
         if self.num_vertices <= 4:
             return True, "Grafo com ≤ 4 vértices é sempre planar"
         
+        # Laços não influenciam a planaridade nem as cotas abaixo
+        num_arestas = self.obter_analise()['num_arestas']
+        
         # Condição necessária: E ≤ 3V - 6 para grafos planares
-        if self.num_arestas > 3 * self.num_vertices - 6:
-            return False, f"Violação E ≤ 3V - 6: {self.num_arestas} > {3*self.num_vertices - 6}"
+        if num_arestas > 3 * self.num_vertices - 6:
+            return False, f"Violação E ≤ 3V - 6: {num_arestas} > {3*self.num_vertices - 6}"
         
         # Verificar se é grafo bipartido (sem triângulos)
         if self.eh_bipartido():
             # Para grafos bipartidos: E ≤ 2V - 4
-            if self.num_arestas > 2 * self.num_vertices - 4:
-                return False, f"Grafo bipartido viola E ≤ 2V - 4: {self.num_arestas} > {2*self.num_vertices - 4}"
-        
-        # Verificação especial para grafos 3-regulares densos
-        # (como o grafo de Petersen)
-        if self.eh_3_regular() and self.num_vertices >= 10:
-            # Grafos 3-regulares planares com V ≥ 10 têm propriedades específicas
-            # Petersen tem 10 vértices, 15 arestas e cintura 5
-            cintura = self.calcular_cintura()
-            if cintura >= 5 and self.num_arestas >= 15:
-                # Provável grafo de Petersen ou similar (não-planar)
-                return False, "Grafo 3-regular de cintura ≥ 5 com V=10, E=15 (padrão Petersen - não-planar)"
-        
-        # Executar DFS e calcular lowpoints
-        vertices = self.grafo.obter_todos_vertices()
-        if not vertices:
-            return True, "Grafo vazio é planar"
-        
-        # Testar cada componente conexa
-        for vertice_inicio in vertices:
-            if vertice_inicio not in self.visitado:
-                if not self.dfs_planaridade(vertice_inicio, None):
-                    return False, "Grafo contém subdivisão de K5 ou K3,3 (não-planar)"
-        
-        return True, "Grafo é planar"
-    
-    def dfs_planaridade(self, v, pai) -> bool:
-        """
-        DFS modificada para teste de planaridade.
-        """
-        self.visitado.add(v)
-        self.contador_dfs += 1
-        self.numero_dfs[v] = self.contador_dfs
-        self.ponto_baixo[v] = self.contador_dfs
-        self.pai_dfs[v] = pai
-        
-        # Explorar vizinhos
-        for vizinho, _ in self.grafo.obter_vizinhos(v):
-            if vizinho not in self.visitado:
-                # Aresta de árvore
-                self.arestas_arvore.add((v, vizinho))
-                
-                # Recursão
-                if not self.dfs_planaridade(vizinho, v):
-                    return False
-                
-                # Atualizar lowpoint
-                self.ponto_baixo[v] = min(self.ponto_baixo[v], self.ponto_baixo[vizinho])
-                
-                # Verificar entrelaçamento (condição de planaridade)
-                if not self.verificar_entrelaracao(v, vizinho):
-                    return False
-                    
-            elif vizinho != pai:
-                # Back edge (aresta de retorno)
-                self.arestas_retorno.add((v, vizinho))
-                self.ponto_baixo[v] = min(self.ponto_baixo[v], self.numero_dfs[vizinho])
+            if num_arestas > 2 * self.num_vertices - 4:
+                return False, f"Grafo bipartido viola E ≤ 2V - 4: {num_arestas} > {2*self.num_vertices - 4}"
         
-        return True
+        # Planar se e somente se todos os blocos forem planares
+        diagnostico = self.verificar_planaridade_por_blocos(processos)
+        nao_planares = [bloco for bloco in diagnostico['blocos'] if not bloco['planar']]
+        if nao_planares:
+            return False, (f"Teste LR falhou em {len(nao_planares)} de {len(diagnostico['blocos'])} "
+                           "bloco(s): grafo contém subdivisão de K5 ou K3,3 (não-planar)")
+        
+        return True, "Grafo é planar (teste Left-Right por blocos)"
     
-    def verificar_entrelaracao(self, v, w) -> bool:
+    def verificar_planaridade_por_blocos(self, processos: int = None) -> dict:
         """
-        Verifica se há entrelaçamento inválido de ciclos.
+        Verifica a planaridade bloco a bloco.
+        
+        Um grafo é planar se e somente se todos os seus blocos (componentes
+        biconexas) são planares. Os blocos são obtidos da árvore de blocos
+        e articulações e testados de forma independente, opcionalmente
+        distribuídos por um pool de processos.
+        
+        Args:
+            processos: Número de processos (None ou 1 executa no processo atual)
+        
+        Returns:
+            {'planar': bool, 'blocos': [{'indice', 'vertices', 'num_arestas',
+             'planar', 'razao'}], 'articulacoes': [v]}
         """
-        # Se lowpoint[w] >= dfs[v], então (v,w) é uma aresta de corte
-        # e não há ciclo passando por cima de v
-        if self.ponto_baixo[w] >= self.numero_dfs[v]:
-            return True
+        if self.diagnostico_blocos is not None:
+            return self.diagnostico_blocos
         
-        # Verificar os filhos de v na árvore DFS
-        filhos_v = [u for p, u in self.arestas_arvore if p == v]
+        arvore = construir_arvore_blocos(self.grafo)
+        arestas_blocos = [bloco['arestas'] for bloco in arvore['blocos']]
         
-        # Para cada par de filhos, verificar se há entrelaçamento
-        for i, filho1 in enumerate(filhos_v):
-            for filho2 in filhos_v[i+1:]:
-                if self.detectar_entrelaracao_entre_ramos(v, filho1, filho2):
-                    return False
+        # Só vale a pena distribuir se houver blocos grandes o bastante
+        grandes = sum(1 for arestas in arestas_blocos if len(arestas) > 8)
+        if (len(arestas_blocos) == 1 and grandes == 1
+                and len(arestas_blocos[0]) == self.obter_analise()['num_arestas']):
+            # Um único bloco com todas as arestas: o teste do grafo inteiro é o
+            # mesmo, e deixa as estruturas prontas para obter_embedding
+            if self.teste_lr():
+                resultados = [(True, "Bloco é planar (teste Left-Right)")]
+            else:
+                resultados = [(False, "Teste LR falhou no bloco")]
+        elif processos and processos > 1 and grandes > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            processos = min(processos, os.cpu_count() or 1, grandes)
+            with ProcessPoolExecutor(max_workers=processos) as executor:
+                tamanho_lote = max(1, len(arestas_blocos) // (processos * 4))
+                resultados = list(executor.map(diagnosticar_bloco, arestas_blocos,
+                                               chunksize=tamanho_lote))
+        else:
+            resultados = [diagnosticar_bloco(arestas) for arestas in arestas_blocos]
         
-        return True
+        blocos = []
+        for i, (bloco, (eh_planar, razao)) in enumerate(zip(arvore['blocos'], resultados)):
+            blocos.append({
+                'indice': i,
+                'vertices': bloco['vertices'],
+                'num_arestas': len(bloco['arestas']),
+                'planar': eh_planar,
+                'razao': razao
+            })
+        
+        self.diagnostico_blocos = {
+            'planar': all(bloco['planar'] for bloco in blocos),
+            'blocos': blocos,
+            'articulacoes': arvore['articulacoes']
+        }
+        return self.diagnostico_blocos
     
-    def detectar_entrelaracao_entre_ramos(self, raiz, ramo1, ramo2) -> bool:
+    def teste_lr(self, adjacencias=None) -> bool:
         """
-        Detecta se dois ramos da árvore DFS têm back edges que se entrelaçam.
+        Executa o teste Left-Right completo em todas as componentes.
         
-        Dois ramos entrelaçam se:
-        - Ramo1 tem back edge para ancestral A
-        - Ramo2 tem back edge para ancestral B
-        - A está abaixo de raiz mas acima de onde Ramo2 conecta
-        - B está abaixo de raiz mas acima de onde Ramo1 conecta
+        Args:
+            adjacencias: {v: [vizinhos]} a testar; por padrão, o grafo inteiro
         """
-        # Obter back edges de cada ramo
-        back_edges_ramo1 = self.obter_back_edges_do_ramo(ramo1)
-        back_edges_ramo2 = self.obter_back_edges_do_ramo(ramo2)
+        if adjacencias is None:
+            vertices = self.grafo.obter_todos_vertices()
+        else:
+            vertices = list(adjacencias)
+        
+        n = len(vertices)
+        self.reiniciar_estruturas(n)
+        self.vertices_indice = vertices
+        self.indice = {v: i for i, v in enumerate(vertices)}
+        
+        if adjacencias is None:
+            self.adjacencias = [[self.indice[w] for w, _ in self.grafo.obter_vizinhos(v)]
+                                for v in vertices]
+        else:
+            self.adjacencias = [[self.indice[w] for w in adjacencias[v]] for v in vertices]
+        
+        # Fase 1: orientação
+        with instrumentacao.fase('planaridade.orientacao'):
+            for v in range(n):
+                if self.altura[v] < 0:
+                    self.altura[v] = 0
+                    self.raizes.append(v)
+                    self.dfs_planaridade(v)
+            
+            # Ordenar adjacências pela profundidade de aninhamento
+            for v in range(n):
+                self.adjacencias_orientadas[v].sort(
+                    key=lambda w: self.profundidade_aninhamento[(v, w)]
+                )
+        
+        # Fase 2: teste
+        with instrumentacao.fase('planaridade.teste'):
+            self.proximo = [0] * n
+            resultado = all(self.dfs_teste(raiz) for raiz in self.raizes)
+        
+        if instrumentacao.ativa:
+            instrumentacao.contar('planaridade.testes_lr')
+            instrumentacao.contar('planaridade.visitas_dfs', self.contador_pre)
+            instrumentacao.contar('planaridade.arestas_orientadas', len(self.ponto_baixo))
         
-        # Para cada par de back edges, verificar entrelaçamento
-        for origem1, destino1 in back_edges_ramo1:
-            for origem2, destino2 in back_edges_ramo2:
-                # Verificar se os intervalos se entrelaçam
-                # Entrelaçamento ocorre quando:
-                # [destino1...origem1] entrelaça com [destino2...origem2]
+        if adjacencias is None:
+            self.resultado_lr = resultado
+        return resultado
+    
+    def visitar(self, v):
+        """Registra a pré-ordem de v na DFS de orientação"""
+        self.pre_ordem[v] = self.contador_pre
+        self.vertices_em_pre_ordem.append(v)
+        self.contador_pre += 1
+    
+    def dfs_planaridade(self, raiz):
+        """
+        DFS de orientação do teste LR (iterativa).
+        
+        Orienta cada aresta no sentido em que é percorrida, monta a árvore
+        DFS (pai, filhos, pré/pós-ordem e intervalos das subárvores) e
+        calcula lowpoint, segundo lowpoint e profundidade de aninhamento
+        de cada aresta.
+        """
+        adjacencias = self.adjacencias
+        altura = self.altura
+        proximo = self.proximo
+        
+        self.visitar(raiz)
+        pilha_dfs = [raiz]
+        
+        while pilha_dfs:
+            v = pilha_dfs[-1]
+            
+            if proximo[v] < len(adjacencias[v]):
+                w = adjacencias[v][proximo[v]]
+                if w == v or (v, w) in self.ponto_baixo or (w, v) in self.ponto_baixo:
+                    # Laço ou aresta já orientada
+                    proximo[v] += 1
+                    continue
+                
+                vw = (v, w)
+                self.adjacencias_orientadas[v].append(w)
+                self.ponto_baixo[vw] = altura[v]
+                self.ponto_baixo2[vw] = altura[v]
                 
-                num_destino1 = self.numero_dfs[destino1]
-                num_origem1 = self.numero_dfs[origem1]
-                num_destino2 = self.numero_dfs[destino2]
-                num_origem2 = self.numero_dfs[origem2]
+                if altura[w] < 0:
+                    # Aresta de árvore: descer (proximo[v] avança quando w terminar)
+                    self.pai[w] = v
+                    self.filhos[v].append(w)
+                    self.aresta_pai[w] = vw
+                    altura[w] = altura[v] + 1
+                    self.visitar(w)
+                    pilha_dfs.append(w)
+                else:
+                    # Back edge (aresta de retorno)
+                    self.retornos[v].append(w)
+                    self.ponto_baixo[vw] = altura[w]
+                    self.atualizar_pontos_baixos(vw)
+                    proximo[v] += 1
+            else:
+                # v terminou: fechar o intervalo da subárvore
+                pilha_dfs.pop()
+                self.pos_ordem[v] = self.contador_pos
+                self.contador_pos += 1
+                self.fim_subarvore[v] = self.contador_pre - 1
                 
-                # Verificar entrelaçamento de intervalos
-                if (num_destino1 < num_destino2 < num_origem1 < num_origem2 or
-                    num_destino2 < num_destino1 < num_origem2 < num_origem1):
-                    return True
+                e = self.aresta_pai[v]
+                if e is not None:
+                    self.atualizar_pontos_baixos(e)
+                    proximo[e[0]] += 1
+    
+    def atualizar_pontos_baixos(self, vw):
+        """
+        Calcula a profundidade de aninhamento de vw (já finalizada) e
+        propaga seus lowpoints para a aresta pai de v.
+        """
+        v = vw[0]
+        
+        # Profundidade de aninhamento (arestas "cordais" vão depois)
+        self.profundidade_aninhamento[vw] = 2 * self.ponto_baixo[vw]
+        if self.ponto_baixo2[vw] < self.altura[v]:
+            self.profundidade_aninhamento[vw] += 1
         
-        return False
+        # Atualizar lowpoints da aresta pai
+        e = self.aresta_pai[v]
+        if e is not None:
+            if self.ponto_baixo[vw] < self.ponto_baixo[e]:
+                self.ponto_baixo2[e] = min(self.ponto_baixo[e], self.ponto_baixo2[vw])
+                self.ponto_baixo[e] = self.ponto_baixo[vw]
+            elif self.ponto_baixo[vw] > self.ponto_baixo[e]:
+                self.ponto_baixo2[e] = min(self.ponto_baixo2[e], self.ponto_baixo[vw])
+            else:
+                self.ponto_baixo2[e] = min(self.ponto_baixo2[e], self.ponto_baixo2[vw])
     
-    def obter_back_edges_do_ramo(self, raiz_ramo) -> list:
+    def dfs_teste(self, raiz) -> bool:
         """
-        Obtém todas as back edges originadas da subárvore com raiz em raiz_ramo.
+        DFS de teste do algoritmo LR (iterativa).
+        
+        Percorre as arestas de cada vértice em ordem de aninhamento e
+        acumula as restrições esquerda/direita das arestas de retorno na pilha.
         """
-        back_edges = []
-        descendentes = self.obter_descendentes(raiz_ramo)
+        proximo = self.proximo
+        pilha_dfs = [raiz]
         
-        for origem, destino in self.arestas_retorno:
-            if origem in descendentes:
-                back_edges.append((origem, destino))
+        while pilha_dfs:
+            v = pilha_dfs[-1]
+            ordem = self.adjacencias_orientadas[v]
+            
+            if proximo[v] < len(ordem):
+                w = ordem[proximo[v]]
+                ei = (v, w)
+                self.base_pilha[ei] = self.pilha[-1] if self.pilha else None
+                
+                if ei == self.aresta_pai[w]:
+                    # Aresta de árvore: integrar quando w terminar
+                    pilha_dfs.append(w)
+                    continue
+                
+                # Aresta de retorno
+                self.aresta_ponto_baixo[ei] = ei
+                self.pilha.append(ParConflito(direito=Intervalo(ei, ei)))
+                if not self.integrar_aresta(ei, proximo[v]):
+                    return False
+                proximo[v] += 1
+            else:
+                pilha_dfs.pop()
+                e = self.aresta_pai[v]
+                if e is not None:
+                    # Remover arestas de retorno que terminam no pai
+                    self.remover_arestas_retorno(e)
+                    u = e[0]
+                    if not self.integrar_aresta(e, proximo[u]):
+                        return False
+                    proximo[u] += 1
         
-        return back_edges
+        return True
     
-    def obter_descendentes(self, v) -> set:
+    def integrar_aresta(self, ei, posicao) -> bool:
         """
-        Retorna todos os descendentes de v na árvore DFS.
+        Integra as arestas de retorno de ei (a posicao-ésima aresta de v)
+        às restrições da aresta pai de v.
         """
-        descendentes = {v}
+        v = ei[0]
+        e = self.aresta_pai[v]
         
-        for u, w in self.arestas_arvore:
-            if u == v:
-                descendentes.update(self.obter_descendentes(w))
+        if self.ponto_baixo[ei] < self.altura[v]:
+            if posicao == 0:
+                self.aresta_ponto_baixo[e] = self.aresta_ponto_baixo[ei]
+            else:
+                return self.adicionar_restricoes(ei, e)
         
-        return descendentes
+        return True
     
-    def teste_kuratowski_simplificado(self) -> bool:
+    def adicionar_restricoes(self, ei, e) -> bool:
         """
-        Teste simplificado para subdivisões de K5 e K3,3.
+        Adiciona as restrições da aresta ei às da aresta pai e.
+        Retorna False se as restrições se tornarem insatisfatíveis.
         """
-        # Se o grafo tem muitas arestas e alta conectividade,
-        # pode conter K5 ou K3,3
+        par = ParConflito()
         
-        # K5 tem 5 vértices e 10 arestas
-        # K3,3 tem 6 vértices e 9 arestas
+        # Juntar as arestas de retorno de ei em par.direito
+        while True:
+            q = self.pilha.pop()
+            if not q.esquerdo.vazio():
+                q.trocar()
+            if not q.esquerdo.vazio():
+                return False  # Não planar
+            
+            if self.ponto_baixo[q.direito.low] > self.ponto_baixo[e]:
+                # Juntar intervalos
+                if par.direito.vazio():
+                    par.direito = q.direito.copiar()
+                else:
+                    self.ref[par.direito.low] = q.direito.high
+                par.direito.low = q.direito.low
+            else:
+                # Alinhar
+                self.ref[q.direito.low] = self.aresta_ponto_baixo[e]
+            
+            topo = self.pilha[-1] if self.pilha else None
+            if topo is self.base_pilha[ei]:
+                break
         
-        if self.num_vertices >= 5 and self.num_arestas >= 9:
-            # Verificar se há subgrafo denso
-            densidade_media = (2.0 * self.num_arestas) / self.num_vertices
+        # Juntar as arestas de retorno conflitantes dos irmãos anteriores em par.esquerdo
+        while self.pilha and (self.pilha[-1].esquerdo.conflitante(ei, self.ponto_baixo) or
+                              self.pilha[-1].direito.conflitante(ei, self.ponto_baixo)):
+            q = self.pilha.pop()
+            if q.direito.conflitante(ei, self.ponto_baixo):
+                q.trocar()
+            if q.direito.conflitante(ei, self.ponto_baixo):
+                return False  # Não planar
             
-            # Se densidade é muito alta, provavelmente não é planar
-            if densidade_media > 5.5:  # Limiar heurístico
-                return False
+            # Juntar o intervalo abaixo de lowpt(ei) em par.direito
+            self.ref[par.direito.low] = q.direito.high
+            if q.direito.low is not None:
+                par.direito.low = q.direito.low
+            
+            if par.esquerdo.vazio():
+                par.esquerdo = q.esquerdo.copiar()
+            else:
+                self.ref[par.esquerdo.low] = q.esquerdo.high
+            par.esquerdo.low = q.esquerdo.low
+        
+        if not (par.esquerdo.vazio() and par.direito.vazio()):
+            self.pilha.append(par)
         
         return True
     
-    def eh_bipartido(self) -> bool:
+    def remover_arestas_retorno(self, e):
         """
-        Verifica se o grafo é bipartido (2-colorível).
+        Remove da pilha as arestas de retorno que terminam no pai u de e
+        e define o lado de e pelo de sua aresta de retorno mais alta.
         """
-        vertices = self.grafo.obter_todos_vertices()
-        if not vertices:
-            return True
+        u = e[0]
         
-        cor = {}
+        # Descartar pares de conflito inteiros que terminam em u
+        while self.pilha and self.pilha[-1].mais_baixo(self.ponto_baixo) == self.altura[u]:
+            par = self.pilha.pop()
+            if par.esquerdo.low is not None:
+                self.lado[par.esquerdo.low] = -1
         
-        for inicio in vertices:
-            if inicio in cor:
-                continue
+        if self.pilha:
+            # Aparar o par do topo
+            par = self.pilha.pop()
             
-            # BFS
-            fila = deque([inicio])
-            cor[inicio] = 0
+            # Aparar intervalo esquerdo
+            while par.esquerdo.high is not None and par.esquerdo.high[1] == u:
+                par.esquerdo.high = self.ref.get(par.esquerdo.high)
+            if par.esquerdo.high is None and par.esquerdo.low is not None:
+                # Intervalo acabou de ficar vazio
+                self.ref[par.esquerdo.low] = par.direito.low
+                self.lado[par.esquerdo.low] = -1
+                par.esquerdo.low = None
             
-            while fila:
-                v = fila.popleft()
-                
-                for vizinho, _ in self.grafo.obter_vizinhos(v):
-                    if vizinho not in cor:
-                        cor[vizinho] = 1 - cor[v]
-                        fila.append(vizinho)
-                    elif cor[vizinho] == cor[v]:
-                        return False
+            # Aparar intervalo direito
+            while par.direito.high is not None and par.direito.high[1] == u:
+                par.direito.high = self.ref.get(par.direito.high)
+            if par.direito.high is None and par.direito.low is not None:
+                # Intervalo acabou de ficar vazio
+                self.ref[par.direito.low] = par.esquerdo.low
+                self.lado[par.direito.low] = -1
+                par.direito.low = None
+            
+            self.pilha.append(par)
         
-        return True
+        # O lado de e é o lado de uma aresta de retorno mais alta
+        if self.ponto_baixo[e] < self.altura[u] and self.pilha:
+            topo_esquerdo = self.pilha[-1].esquerdo.high
+            topo_direito = self.pilha[-1].direito.high
+            
+            if topo_esquerdo is not None and (topo_direito is None or
+                                              self.ponto_baixo[topo_esquerdo] > self.ponto_baixo[topo_direito]):
+                self.ref[e] = topo_esquerdo
+            else:
+                self.ref[e] = topo_direito
     
-    def eh_3_regular(self) -> bool:
+    def obter_embedding(self) -> dict:
         """
-        Verifica se o grafo é 3-regular (todos os vértices têm grau 3).
+        Retorna um embedding combinatório do grafo (sistema de rotação):
+        {v: [vizinhos em sentido horário]}. Retorna None se o grafo não for planar.
+        """
+        if self.embedding is None:
+            # Reaproveitar o teste do grafo inteiro, se já foi executado
+            if self.resultado_lr is None:
+                self.teste_lr()
+            if not self.resultado_lr:
+                return None
+            self.construir_embedding()
+        
+        return self.embedding
+    
+    @instrumentacao.medir_fase('planaridade.embedding')
+    def construir_embedding(self):
         """
-        vertices = self.grafo.obter_todos_vertices()
+        Fase 3 do algoritmo LR: converte os lados das arestas de retorno
+        em um sistema de rotação. Deve ser chamada após um teste LR bem-sucedido.
+        """
+        # Aplicar o sinal (lado) final à profundidade de aninhamento
+        for e in self.profundidade_aninhamento:
+            self.profundidade_aninhamento[e] *= self.sinal(e)
         
-        for v in vertices:
-            grau = len(self.grafo.obter_vizinhos(v))
-            if grau != 3:
-                return False
+        n = len(self.vertices_indice)
+        self.sentido_horario = [{} for _ in range(n)]
+        self.sentido_anti_horario = [{} for _ in range(n)]
+        self.primeiro_vizinho = [None] * n
+        self.referencia_esquerda = [None] * n
+        self.referencia_direita = [None] * n
         
-        return True
+        # Ordem inicial: arestas que saem de v, por aninhamento com sinal
+        for v, vizinhos in enumerate(self.adjacencias_orientadas):
+            vizinhos.sort(key=lambda w: self.profundidade_aninhamento[(v, w)])
+            anterior = None
+            for w in vizinhos:
+                self.adicionar_semiaresta_horario(v, w, anterior)
+                anterior = w
+        
+        # Inserir as semiarestas que chegam em cada vértice
+        self.proximo = [0] * n
+        for raiz in self.raizes:
+            self.dfs_embedding(raiz)
+        
+        self.embedding = {
+            self.vertices_indice[v]: [self.vertices_indice[w] for w in self.obter_vizinhos_em_ordem(v)]
+            for v in range(n)
+        }
     
-    def calcular_cintura(self) -> int:
+    def sinal(self, e) -> int:
         """
-        Calcula a cintura (tamanho do menor ciclo presente no grafo) do grafo.
-        Usa BFS de cada vértice para encontrar o menor ciclo.
+        Resolve o lado (+1 direita, -1 esquerda) de e seguindo a cadeia de refs.
+        """
+        cadeia = []
+        while self.ref.get(e) is not None:
+            cadeia.append(e)
+            e = self.ref[e]
+        
+        lado = self.lado.get(e, 1)
+        for aresta in reversed(cadeia):
+            lado = self.lado.get(aresta, 1) * lado
+            self.lado[aresta] = lado
+            self.ref[aresta] = None
+        
+        return lado
+    
+    def dfs_embedding(self, raiz):
+        """
+        DFS de embedding (iterativa): posiciona cada aresta de retorno (v, w)
+        na lista de rotação do ancestral w, do lado definido pelo teste.
         """
-        vertices = self.grafo.obter_todos_vertices()
-        cintura_minima = float('inf')
+        proximo = self.proximo
+        pilha_dfs = [raiz]
         
-        for inicio in vertices:
-            # BFS para encontrar ciclos a partir de 'inicio'
-            distancia = {inicio: 0}
-            pai = {inicio: None}
-            fila = deque([inicio])
+        while pilha_dfs:
+            v = pilha_dfs[-1]
+            ordem = self.adjacencias_orientadas[v]
             
-            while fila:
-                v = fila.popleft()
+            if proximo[v] >= len(ordem):
+                pilha_dfs.pop()
+                continue
+            
+            w = ordem[proximo[v]]
+            proximo[v] += 1
+            ei = (v, w)
+            
+            if ei == self.aresta_pai[w]:
+                # Aresta de árvore
+                self.adicionar_semiaresta_primeiro(w, v)
+                self.referencia_esquerda[v] = w
+                self.referencia_direita[v] = w
+                pilha_dfs.append(w)
+            elif self.lado.get(ei, 1) == 1:
+                # Colocar v logo após referencia_direita[w]
+                self.adicionar_semiaresta_horario(w, v, self.referencia_direita[w])
+            else:
+                # Colocar v logo antes de referencia_esquerda[w]
+                self.adicionar_semiaresta_anti_horario(w, v, self.referencia_esquerda[w])
+                self.referencia_esquerda[w] = v
+    
+    def adicionar_semiaresta_horario(self, v, w, referencia):
+        """Insere w na rotação de v logo após referencia (sentido horário)"""
+        horario = self.sentido_horario[v]
+        anti_horario = self.sentido_anti_horario[v]
+        
+        if referencia is None:
+            horario[w] = w
+            anti_horario[w] = w
+            self.primeiro_vizinho[v] = w
+            return
+        
+        seguinte = horario[referencia]
+        horario[referencia] = w
+        horario[w] = seguinte
+        anti_horario[seguinte] = w
+        anti_horario[w] = referencia
+    
+    def adicionar_semiaresta_anti_horario(self, v, w, referencia):
+        """Insere w na rotação de v logo antes de referencia"""
+        if referencia is None:
+            self.adicionar_semiaresta_horario(v, w, None)
+            return
+        
+        self.adicionar_semiaresta_horario(v, w, self.sentido_anti_horario[v][referencia])
+        if referencia == self.primeiro_vizinho[v]:
+            self.primeiro_vizinho[v] = w
+    
+    def adicionar_semiaresta_primeiro(self, v, w):
+        """Insere w como primeiro vizinho na rotação de v"""
+        self.adicionar_semiaresta_anti_horario(v, w, self.primeiro_vizinho[v])
+    
+    def obter_vizinhos_em_ordem(self, v) -> list:
+        """Retorna os vizinhos de v em sentido horário a partir do primeiro"""
+        primeiro = self.primeiro_vizinho[v]
+        if primeiro is None:
+            return []
+        
+        ordem = [primeiro]
+        atual = self.sentido_horario[v][primeiro]
+        while atual != primeiro:
+            ordem.append(atual)
+            atual = self.sentido_horario[v][atual]
+        
+        return ordem
+    
+    def obter_faces(self) -> list:
+        """
+        Percorre as faces do embedding. Cada face é a lista de semiarestas
+        (v, w) da sua fronteira. Retorna None se o grafo não for planar.
+        """
+        if self.obter_embedding() is None:
+            return None
+        
+        visitadas = set()
+        faces = []
+        nomes = self.vertices_indice
+        
+        for v, rotacao in enumerate(self.sentido_horario):
+            for w in rotacao:
+                if (v, w) in visitadas:
+                    continue
                 
-                for vizinho, _ in self.grafo.obter_vizinhos(v):
-                    if vizinho not in distancia:
-                        distancia[vizinho] = distancia[v] + 1
-                        pai[vizinho] = v
-                        fila.append(vizinho)
-                    elif pai[v] != vizinho:
-                        # Encontrou um ciclo
-                        tamanho_ciclo = distancia[v] + distancia[vizinho] + 1
-                        cintura_minima = min(cintura_minima, tamanho_ciclo)
-        
-        return cintura_minima if cintura_minima != float('inf') else 0
+                face = []
+                a, b = v, w
+                while (a, b) not in visitadas:
+                    visitadas.add((a, b))
+                    face.append((nomes[a], nomes[b]))
+                    a, b = b, self.sentido_anti_horario[b][a]
+                faces.append(face)
+        
+        return faces
+    
+    def contar_faces(self) -> int:
+        """
+        Conta as faces do embedding planar (incluindo a face externa).
+        
+        Cada componente contribui com suas próprias faces, mas a face
+        externa é compartilhada entre todas elas.
+        """
+        faces = self.obter_faces()
+        if faces is None:
+            return None
+        
+        isolados = sum(1 for v in self.raizes if self.primeiro_vizinho[v] is None)
+        return len(faces) + isolados - (len(self.raizes) - 1)
+    
+    def obter_subgrafo_kuratowski(self, verificar=None) -> dict:
+        """
+        Extrai uma subdivisão de K5 ou K3,3 contida no grafo.
+        
+        Trabalha sobre cadeias de arestas (ver agrupar_cadeias): a cada
+        rodada, uma busca binária acha a menor sequência de cadeias que
+        ainda é não-planar, cuja última cadeia é essencial; o resto é
+        descartado. Quando todas as cadeias restantes são essenciais, o
+        subgrafo mínimo não-planar é uma subdivisão de Kuratowski. Cada
+        rodada custa O(log E) testes LR de O(V + E), e o número de rodadas
+        acompanha o número de cadeias da obstrução, não o de arestas. As
+        candidatas são ordenadas por proximidade às cadeias já essenciais
+        (ver ordenar_por_proximidade), o que descarta de uma vez a maior
+        parte do grafo quando a obstrução usa caminhos longos.
+        
+        Args:
+            verificar: Função chamada antes de cada teste LR; uma exceção
+                       nela interrompe a extração (cancelamento)
+        
+        Returns:
+            {'tipo': 'K5' ou 'K3,3', 'arestas': [(v1, v2)],
+             'vertices_ramificacao': [v]} ou None se o grafo for planar
+        """
+        if self.subgrafo_kuratowski is not None:
+            return self.subgrafo_kuratowski
+        
+        # A obstrução está contida em um único bloco: extrair só dele
+        # (blocos na mesma ordem de obter_analise, já diagnosticados)
+        arestas = None
+        blocos = obter_analise(self.grafo)['blocos']
+        for bloco in self.verificar_planaridade_por_blocos()['blocos']:
+            if not bloco['planar']:
+                arestas = list(blocos[bloco['indice']])
+                break
+        if arestas is None:
+            return None
+        
+        # Cada rodada acha, por busca binária, o menor prefixo das cadeias
+        # candidatas que junto com as fixas (já essenciais) é não-planar: a
+        # última cadeia do prefixo é essencial e tudo depois dele é descartado.
+        # Arestas essenciais continuam essenciais em subgrafos menores.
+        essenciais = set()
+        fixas, candidatas = [], agrupar_cadeias(arestas)
+        while True:
+            arestas_fixas = [a for cadeia in fixas for a in cadeia]
+            if verificar is not None:
+                verificar()
+            if not candidatas or not self.eh_planar_arestas(arestas_fixas):
+                break
+            
+            # Invariante: fixas + candidatas[:alto] é não-planar, fixas + candidatas[:baixo] é planar
+            baixo, alto = 0, len(candidatas)
+            while alto - baixo > 1:
+                if verificar is not None:
+                    verificar()
+                meio = (baixo + alto) // 2
+                if self.eh_planar_arestas(arestas_fixas + [a for cadeia in candidatas[:meio] for a in cadeia]):
+                    baixo = meio
+                else:
+                    alto = meio
+            essenciais.update(candidatas[alto - 1])
+            
+            # Poda e reagrupa o subgrafo não-planar que sobrou
+            restantes = arestas_fixas + [a for cadeia in candidatas[:alto] for a in cadeia]
+            fixas, candidatas = [], []
+            for cadeia in agrupar_cadeias(restantes):
+                if any(a in essenciais for a in cadeia):
+                    essenciais.update(cadeia)
+                    fixas.append(cadeia)
+                else:
+                    candidatas.append(cadeia)
+            candidatas = ordenar_por_proximidade(fixas, candidatas)
+        arestas = arestas_fixas
+        
+        grau = Counter()
+        for v1, v2 in arestas:
+            grau[v1] += 1
+            grau[v2] += 1
+        ramificacao = [v for v, g in grau.items() if g >= 3]
+        
+        self.subgrafo_kuratowski = {
+            'tipo': 'K5' if len(ramificacao) == 5 else 'K3,3',
+            'arestas': arestas,
+            'vertices_ramificacao': ramificacao
+        }
+        return self.subgrafo_kuratowski
+    
+    def eh_planar_arestas(self, arestas) -> bool:
+        """
+        Testa a planaridade do subgrafo formado pelas arestas dadas.
+        """
+        adjacencias = {}
+        for v1, v2 in arestas:
+            adjacencias.setdefault(v1, []).append(v2)
+            adjacencias.setdefault(v2, []).append(v1)
+        
+        # Condição necessária E ≤ 3V - 6 evita a DFS em subgrafos densos
+        if len(adjacencias) >= 3 and len(arestas) > 3 * len(adjacencias) - 6:
+            return False
+        
+        return VerificadorPlanaridade(self.grafo).teste_lr(adjacencias)
+    
+    def eh_descendente(self, u, v) -> bool:
+        """
+        Verifica em O(1) se u é descendente de v (ou o próprio v) na árvore
+        DFS da última execução de teste_lr, pelos intervalos de pré-ordem.
+        """
+        i, j = self.indice[u], self.indice[v]
+        return self.pre_ordem[j] <= self.pre_ordem[i] <= self.fim_subarvore[j]
+    
+    def obter_descendentes(self, v) -> set:
+        """
+        Retorna todos os descendentes de v na árvore DFS.
+        """
+        i = self.indice[v]
+        intervalo = self.vertices_em_pre_ordem[self.pre_ordem[i]:self.fim_subarvore[i] + 1]
+        return {self.vertices_indice[u] for u in intervalo}
+    
+    def obter_arestas_retorno(self, v) -> list:
+        """
+        Retorna as arestas de retorno (v, ancestral) que saem de v.
+        """
+        i = self.indice[v]
+        return [(v, self.vertices_indice[w]) for w in self.retornos[i]]
+    
+    def obter_analise(self) -> dict:
+        """
+        Análise estrutural do grafo (componentes, bipartição, graus, blocos
+        e articulações), calculada em uma única DFS e reaproveitada enquanto
+        o grafo não for modificado.
+        """
+        return obter_analise(self.grafo)
+    
+    def eh_bipartido(self) -> bool:
+        """
+        Verifica se o grafo é bipartido (2-colorível).
+        """
+        return self.obter_analise()['bipartido']
+    
+    def eh_3_regular(self) -> bool:
+        """
+        Verifica se o grafo é 3-regular (todos os vértices têm grau 3).
+        """
+        return set(self.obter_analise()['histograma_graus']) <= {3}
+    
+    def calcular_cintura(self, processos: int = None) -> int:
+        """
+        Calcula a cintura (tamanho do menor ciclo presente no grafo) do grafo.
+        Delega para metricas.calcular_cintura (BFS podada com parada antecipada).
+        """
+        return calcular_cintura(self.grafo, processos)
     
     def obter_caracteristica_euler(self) -> dict:
         """
-        Calcula a característica de Euler.
+        Calcula a característica de Euler a partir das faces reais do embedding.
+        
+        Para um grafo planar com C componentes, V - E + F = 1 + C.
         """
-        V = self.num_vertices
-        E = self.num_arestas
+        analise = self.obter_analise()
+        V = analise['num_vertices']
+        E = analise['num_arestas']
         
-        # Verificar se é conexo
-        if not self.eh_conexo():
-            num_componentes = self.contar_componentes()
+        F = self.contar_faces()
+        if F is None:
             return {
                 'vertices': V,
                 'arestas': E,
-                'faces': f'N/A (grafo tem {num_componentes} componentes)',
-                'caracteristica_euler': f'V - E + F = 1 + C'
+                'faces': 'N/A (grafo não planar)',
+                'caracteristica_euler': 'N/A'
             }
         
-        F = 2 - V + E
-        
         return {
             'vertices': V,
             'arestas': E,
             'faces': F,
+            'componentes': analise['num_componentes'],
             'caracteristica_euler': V - E + F
         }
     
     def eh_conexo(self) -> bool:
-        """Verifica se o grafo é conexo usando BFS."""
-        vertices = self.grafo.obter_todos_vertices()
-        if not vertices:
-            return True
-        
-        visitados = set()
-        fila = deque([vertices[0]])
-        visitados.add(vertices[0])
-        
-        while fila:
-            v = fila.popleft()
-            for vizinho, _ in self.grafo.obter_vizinhos(v):
-                if vizinho not in visitados:
-                    visitados.add(vizinho)
-                    fila.append(vizinho)
-        
-        return len(visitados) == len(vertices)
+        """Verifica se o grafo é conexo."""
+        return self.obter_analise()['conexo']
     
     def contar_componentes(self) -> int:
         """Conta o número de componentes conexas."""
-        vertices = self.grafo.obter_todos_vertices()
-        visitados = set()
-        componentes = 0
-        
-        for v in vertices:
-            if v not in visitados:
-                componentes += 1
-                # BFS para marcar componente
-                fila = deque([v])
-                visitados.add(v)
-                
-                while fila:
-                    u = fila.popleft()
-                    for vizinho, _ in self.grafo.obter_vizinhos(u):
-                        if vizinho not in visitados:
-                            visitados.add(vizinho)
-                            fila.append(vizinho)
-        
-        return componentes
\ No newline at end of file
+        return self.obter_analise()['num_componentes']
@@ -0,0 +1,303 @@
+"""
+Verificação de regressão de desempenho
+Executa a suíte de benchmark.py várias vezes, calcula a mediana de cada
+caso e compara com a linha de base versionada (linha_base_desempenho.json).
+Sai com código 1 se AEstrela.encontrar_caminho, WelshPowell.color_graph,
+VerificadorPlanaridade.verificar_planaridade ou as gerações/s do AG
+piorarem além do limiar.
+
+Um caso só é regressão se a mediana piorar mais que o limiar E o teste
+de Mann-Whitney entre as amostras da base e as atuais indicar piora
+significativa (p < 0,05): baseado em postos, o teste não é enganado por
+uma ou duas rodadas atrapalhadas, e ruído não reprova. Linhas de base
+antigas, sem as amostras, são comparadas só pela mediana.
+
+Uso:
+    python regressao_desempenho.py                  # compara com a linha de base
+    python regressao_desempenho.py --atualizar-base # regrava a linha de base
+    python regressao_desempenho.py --resultados resultados.json  # sem executar
+"""
+
+import argparse
+import functools
+import json
+import math
+import os
+import statistics
+import sys
+
+from benchmark import executar_suite, obter_metadados, GERACOES_AG
+
+
+LINHA_BASE_PADRAO = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                 'linha_base_desempenho.json')
+
+# Casos medidos quando a linha de base não define outros
+CONFIGURACAO_PADRAO = {
+    'geradores': ['grade', 'triangulacao'],
+    'tamanhos': [1000, 10_000],
+    'algoritmos': ['a_estrela', 'welsh_powell', 'planaridade', 'ag'],
+    'rodadas': 7,
+    'semente': 0
+}
+
+LIMIAR_PADRAO = 0.10  # Piora relativa tolerada na mediana
+
+NIVEL_SIGNIFICANCIA = 0.05
+
+# Acima deste número de pares (base × atual) o p-valor usa a aproximação normal
+LIMITE_PARES_EXATO = 400
+
+# Algoritmo -> (função medida, métrica, maior é melhor)
+METRICAS = {
+    'a_estrela': ('AEstrela.encontrar_caminho', 'tempo_ms', False),
+    'welsh_powell': ('WelshPowell.color_graph', 'tempo_ms', False),
+    'planaridade': ('VerificadorPlanaridade.verificar_planaridade', 'tempo_ms', False),
+    'ag': ('AlgoritmoGeneticoPCV (gerações/s)', 'geracoes_por_segundo', True)
+}
+
+
+# ============================================================================
+# ESTATÍSTICA
+# ============================================================================
+
+@functools.lru_cache(maxsize=None)
+def distribuicao_u(m: int, n: int) -> tuple:
+    """
+    Distribuição exata de U sob a hipótese nula: contagens[u] é o número de
+    ordenações de m + n valores distintos em que os m primeiros superam os
+    n outros em exatamente u pares.
+    """
+    if m == 0 or n == 0:
+        return (1,)
+    # O maior valor é de um dos m (supera os n) ou de um dos n (não supera nenhum)
+    maior_em_m = (0,) * n + distribuicao_u(m - 1, n)
+    maior_em_n = distribuicao_u(m, n - 1) + (0,) * n
+    return tuple(a + b for a, b in zip(maior_em_m, maior_em_n))
+
+
+def teste_mann_whitney(menores: list, maiores: list) -> float:
+    """
+    P-valor unilateral de Mann-Whitney para "os valores de maiores tendem a
+    ser maiores que os de menores".
+
+    Não assume distribuição e, por usar só os postos, não se deixa levar
+    por poucas rodadas atípicas. Empates contam meio par.
+    """
+    m, n = len(maiores), len(menores)
+    u = sum(1.0 if x > y else 0.5 if x == y else 0.0 for x in maiores for y in menores)
+
+    if m * n <= LIMITE_PARES_EXATO:
+        contagens = distribuicao_u(m, n)
+        return sum(contagens[math.ceil(u):]) / sum(contagens)
+
+    media = m * n / 2
+    desvio = math.sqrt(m * n * (m + n + 1) / 12)
+    return 1 - statistics.NormalDist().cdf((u - 0.5 - media) / desvio)
+
+
+def resumir_caso(caso: dict) -> dict:
+    """Converte os tempos de um caso da suíte na métrica comparável"""
+    _, metrica, _ = METRICAS[caso['algoritmo']]
+    if metrica == 'geracoes_por_segundo':
+        geracoes = caso['extra'].get('geracoes', GERACOES_AG)
+        amostras = [geracoes / t for t in caso['tempos_s'] if t > 0]
+    else:
+        amostras = [t * 1000 for t in caso['tempos_s']]
+
+    return {
+        'gerador': caso['gerador'],
+        'n': caso['n'],
+        'algoritmo': caso['algoritmo'],
+        'metrica': metrica,
+        'mediana': statistics.median(amostras),
+        'amostras': len(amostras),
+        'valores': amostras
+    }
+
+
+def chave_caso(caso: dict) -> tuple:
+    return caso['algoritmo'], caso['gerador'], caso['n']
+
+
+# ============================================================================
+# COMPARAÇÃO
+# ============================================================================
+
+def comparar(base: list, atual: list, limiar: float = LIMIAR_PADRAO) -> list:
+    """
+    Compara os casos resumidos com os da linha de base.
+
+    Returns:
+        Lista de {'funcao', 'gerador', 'n', 'base', 'atual', 'variacao',
+        'p_valor', 'situacao'}, onde variacao > 0 é piora, p_valor é o do teste
+        de Mann-Whitney no sentido da variação (None sem as amostras) e
+        situacao é 'OK', 'MELHORA', 'REGRESSÃO', 'NOVO' ou 'AUSENTE'
+    """
+    casos_base = {chave_caso(caso): caso for caso in base}
+    casos_atuais = {chave_caso(caso): caso for caso in atual}
+    linhas = []
+
+    for chave in sorted(casos_base.keys() | casos_atuais.keys()):
+        algoritmo, gerador, n = chave
+        funcao, _, maior_melhor = METRICAS[algoritmo]
+        anterior = casos_base.get(chave)
+        novo = casos_atuais.get(chave)
+        linha = {'funcao': funcao, 'gerador': gerador, 'n': n,
+                 'base': anterior['mediana'] if anterior else None,
+                 'atual': novo['mediana'] if novo else None,
+                 'variacao': None, 'p_valor': None}
+
+        if anterior is None:
+            linha['situacao'] = 'NOVO'
+        elif novo is None:
+            linha['situacao'] = 'AUSENTE'
+        else:
+            # Razão orientada: acima de 1 sempre significa piora
+            razao = novo['mediana'] / anterior['mediana']
+            if maior_melhor:
+                razao = 1 / razao
+            variacao = razao - 1
+            linha['variacao'] = variacao
+
+            if anterior.get('valores') and novo.get('valores'):
+                # Amostras orientadas: na métrica "pior", maior sempre é pior
+                pior_base, pior_atual = anterior['valores'], novo['valores']
+                if maior_melhor:
+                    pior_base, pior_atual = pior_atual, pior_base
+                if variacao >= 0:
+                    linha['p_valor'] = teste_mann_whitney(pior_base, pior_atual)
+                else:
+                    linha['p_valor'] = teste_mann_whitney(pior_atual, pior_base)
+                significativa_pior = significativa_melhor = linha['p_valor'] < NIVEL_SIGNIFICANCIA
+            else:
+                # Sem as amostras, o limiar é o único piso de ruído
+                significativa_pior = significativa_melhor = True
+
+            if variacao > limiar and significativa_pior:
+                linha['situacao'] = 'REGRESSÃO'
+            elif variacao < -limiar and significativa_melhor:
+                linha['situacao'] = 'MELHORA'
+            else:
+                linha['situacao'] = 'OK'
+
+        linhas.append(linha)
+
+    return linhas
+
+
+def formatar_tabela(linhas: list) -> str:
+    """Tabela de diferenças agrupada por função"""
+    def numero(valor):
+        return f"{valor:.2f}" if valor is not None else "-"
+
+    saida = [f"{'Gerador':<14}{'n':>8}{'Base':>14}{'Atual':>14}{'Variação':>11}{'p':>9}  Situação"]
+    funcao_anterior = None
+    for linha in linhas:
+        if linha['funcao'] != funcao_anterior:
+            funcao_anterior = linha['funcao']
+            saida.append("")
+            saida.append(linha['funcao'])
+            saida.append("-" * 70)
+        variacao = f"{linha['variacao'] * 100:+.1f}%" if linha['variacao'] is not None else "-"
+        p_valor = f"{linha['p_valor']:.3f}" if linha['p_valor'] is not None else "-"
+        saida.append(f"{linha['gerador']:<14}{linha['n']:>8}{numero(linha['base']):>14}"
+                     f"{numero(linha['atual']):>14}{variacao:>11}{p_valor:>9}  {linha['situacao']}")
+
+    return "\n".join(saida)
+
+
+# ============================================================================
+# LINHA DE BASE
+# ============================================================================
+
+def medir(configuracao: dict, progresso=None) -> list:
+    """
+    Executa a suíte inteira uma vez por rodada e resume cada caso.
+
+    Cada caso guarda uma amostra por rodada: o teste de Mann-Whitney
+    compara as posições (postos) dessas amostras contra as da linha de
+    base, então precisa de várias delas por caso, e mais rodadas permitem
+    p-valores menores. Rodar a suíte completa a cada rodada (em vez de
+    repetir cada caso em sequência) faz com que uma fase lenta da máquina
+    atinja no máximo uma amostra de cada caso, em vez de todas as amostras
+    de um caso só.
+    """
+    casos = {}
+    for rodada in range(configuracao['rodadas']):
+        if progresso:
+            progresso(f"Rodada {rodada + 1}/{configuracao['rodadas']}")
+        for caso in executar_suite(configuracao['geradores'], configuracao['tamanhos'],
+                                   configuracao['algoritmos'], 1, configuracao['semente']):
+            chave = chave_caso(caso)
+            if chave in casos:
+                casos[chave]['tempos_s'].extend(caso['tempos_s'])
+            else:
+                casos[chave] = caso
+
+    return [resumir_caso(caso) for caso in casos.values()]
+
+
+def carregar_linha_base(caminho: str) -> dict:
+    with open(caminho, encoding='utf-8') as arquivo:
+        return json.load(arquivo)
+
+
+def salvar_linha_base(caminho: str, configuracao: dict, casos: list):
+    documento = {'metadados': obter_metadados(), 'configuracao': configuracao, 'casos': casos}
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        arquivo.write(json.dumps(documento, ensure_ascii=False, indent=2) + '\n')
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compara o desempenho com a linha de base")
+    parser.add_argument('--base', default=LINHA_BASE_PADRAO, help="Arquivo da linha de base")
+    parser.add_argument('--limiar', type=float, default=LIMIAR_PADRAO,
+                        help="Piora relativa tolerada (0.10 = 10%%)")
+    parser.add_argument('--rodadas', type=int, help="Repetições por caso")
+    parser.add_argument('--resultados', help="Comparar um JSON de benchmark.py em vez de executar")
+    parser.add_argument('--atualizar-base', action='store_true',
+                        help="Medir e regravar a linha de base")
+    args = parser.parse_args(argv)
+
+    def progresso(linha):
+        print(linha, file=sys.stderr, flush=True)
+
+    if args.atualizar_base:
+        configuracao = dict(CONFIGURACAO_PADRAO)
+        if args.rodadas:
+            configuracao['rodadas'] = args.rodadas
+        salvar_linha_base(args.base, configuracao, medir(configuracao, progresso))
+        print(f"Linha de base gravada em {args.base}")
+        return 0
+
+    try:
+        linha_base = carregar_linha_base(args.base)
+    except (OSError, json.JSONDecodeError) as erro:
+        print(f"Erro ao ler a linha de base: {erro}", file=sys.stderr)
+        return 2
+
+    if args.resultados:
+        with open(args.resultados, encoding='utf-8') as arquivo:
+            atual = [resumir_caso(caso) for caso in json.load(arquivo)['resultados']]
+    else:
+        # Mesmos casos da linha de base, para que a comparação seja justa
+        configuracao = dict(CONFIGURACAO_PADRAO, **linha_base.get('configuracao', {}))
+        if args.rodadas:
+            configuracao['rodadas'] = args.rodadas
+        atual = medir(configuracao, progresso)
+
+    linhas = comparar(linha_base['casos'], atual, args.limiar)
+    print(formatar_tabela(linhas))
+
+    regressoes = sum(1 for linha in linhas if linha['situacao'] == 'REGRESSÃO')
+    print()
+    if regressoes:
+        print(f"{regressoes} regressão(ões) acima de {args.limiar * 100:.0f}%")
+        return 1
+    print(f"Nenhuma regressão acima de {args.limiar * 100:.0f}%")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,217 @@
+"""
+Renderização offscreen de imagens de resultados (sem Tk nem display)
+Desenha o grafo com os mesmos parâmetros de GraphApp.estado_atual
+(título, arestas destacadas e cores dos vértices) em PNG ou SVG usando só
+o canvas Agg. Lotes de centenas de rotas ou colorações são divididos
+entre processos trabalhadores: o grafo e as posições são enviados uma vez
+por processo (no inicializador), e cada tarefa leva só o seu estado.
+
+Uso:
+    python renderizador.py parana estados.jsonl --saida relatorio/ --formato svg
+
+Cada linha de estados.jsonl é um estado:
+    {"nome": "rota_1", "titulo": "Curitiba → Cascavel",
+     "destacar_arestas": [["Curitiba", "Ponta Grossa"], ...],
+     "cores_vertices": {"Curitiba": 0, "Cascavel": 1}}
+com os vértices por nome ou ID.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+
+FORMATOS = ('png', 'svg')
+DPI_PADRAO = 100
+TAMANHO_FIG_PADRAO = (12, 8)
+
+
+def arestas_do_caminho(caminho: list) -> list:
+    """Arestas consecutivas de um caminho (formato de destacar_arestas)"""
+    return list(zip(caminho, caminho[1:]))
+
+
+def nome_arquivo(estado: dict, indice: int) -> str:
+    """Nome do arquivo (sem extensão): 'nome' do estado ou o índice no lote"""
+    nome = str(estado.get('nome') or f"grafo_{indice:04d}")
+    return ''.join(c if c.isalnum() or c in '-_.' else '_' for c in nome)
+
+
+class RenderizadorOffscreen:
+    """
+    Figura Agg de um grafo, desenhada uma vez e reaproveitada por estado.
+
+    Arestas, vértices e rótulos são criados (e o tight_layout calculado)
+    só na construção; cada estado troca apenas título, destaques e cores
+    (VisualizadorGrafo.aplicar_estado) antes de gravar o arquivo.
+    """
+
+    def __init__(self, grafo, posicoes: dict = None, dpi: int = DPI_PADRAO,
+                 tamanho_fig=TAMANHO_FIG_PADRAO, mostrar_pesos: bool = True, modo: str = None):
+        """
+        Args:
+            posicoes: Posições dos vértices ({v: [x, y]}); None usa as do grafo
+        """
+        # O canvas Agg é criado explicitamente (offscreen=True): o backend do
+        # pyplot não é trocado, então figuras abertas na interface não são afetadas
+        from visualizador import VisualizadorGrafo
+
+        self.dpi = dpi
+        self.visualizador = VisualizadorGrafo(grafo)
+        self.visualizador.posicoes_personalizadas = posicoes
+        # Título provisório com a mesma fonte: o tight_layout já reserva o espaço
+        self.fig = self.visualizador.desenhar_grafo(titulo='Grafo', mostrar_pesos=mostrar_pesos,
+                                                    tamanho_fig=tamanho_fig, modo=modo, offscreen=True)
+        # Layout já aplicado: sem motor, savefig não faz um desenho extra antes de gravar
+        self.fig.set_layout_engine(None)
+
+    def renderizar(self, estado: dict, caminho: str) -> str:
+        """
+        Grava um estado ({'titulo', 'destacar_arestas', 'cores_vertices'}).
+
+        O formato vem da extensão do caminho (.png ou .svg).
+
+        Returns:
+            O caminho gravado
+        """
+        self.visualizador.aplicar_estado(estado.get('titulo', 'Grafo'), estado.get('destacar_arestas'),
+                                         estado.get('cores_vertices'))
+        self.fig.savefig(caminho, dpi=self.dpi)
+        return caminho
+
+
+def renderizar(grafo, estado: dict, caminho: str, posicoes: dict = None, **opcoes) -> str:
+    """Renderiza um único estado (para vários, ver renderizar_lote)"""
+    return RenderizadorOffscreen(grafo, posicoes, **opcoes).renderizar(estado, caminho)
+
+
+# ============================================================================
+# PROCESSOS TRABALHADORES
+# ============================================================================
+
+def _inicializar_trabalhador(grafo, posicoes, opcoes):
+    """Desenha a figura base no processo (grafo e posições enviados uma vez só)"""
+    global _renderizador_trabalhador
+    os.environ['MPLBACKEND'] = 'Agg'
+    _renderizador_trabalhador = RenderizadorOffscreen(grafo, posicoes, **opcoes)
+
+
+def _renderizar_no_trabalhador(estado, caminho):
+    """Tarefa executada nos processos trabalhadores"""
+    return _renderizador_trabalhador.renderizar(estado, caminho)
+
+
+def renderizar_lote(grafo, estados: list, diretorio: str, formato: str = 'png', processos: int = None,
+                    progresso=None, **opcoes) -> list:
+    """
+    Renderiza vários estados em paralelo, um arquivo por estado.
+
+    As posições são calculadas uma vez aqui (layout.posicoes_do_grafo, que
+    inclui o layout por forças dos vértices sem coordenadas) e todas as
+    imagens usam as mesmas.
+
+    Args:
+        estados: Dicionários como GraphApp.estado_atual, com 'nome' opcional
+        processos: Processos trabalhadores (None = número de CPUs; 1 = sem pool)
+        progresso: Função chamada com (concluídos, total) a cada imagem
+        **opcoes: dpi, tamanho_fig, mostrar_pesos, modo (ver RenderizadorOffscreen)
+
+    Returns:
+        Caminhos gravados, na ordem dos estados
+    """
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato não suportado: {formato} (opções: {', '.join(FORMATOS)})")
+    from layout import posicoes_do_grafo
+
+    os.makedirs(diretorio, exist_ok=True)
+    posicoes = posicoes_do_grafo(grafo)
+    caminhos = [os.path.join(diretorio, f"{nome_arquivo(estado, i)}.{formato}")
+                for i, estado in enumerate(estados)]
+    processos = min(processos or os.cpu_count() or 1, max(1, len(estados)))
+
+    if processos == 1:
+        renderizador = RenderizadorOffscreen(grafo, posicoes, **opcoes)
+        for i, (estado, caminho) in enumerate(zip(estados, caminhos), 1):
+            renderizador.renderizar(estado, caminho)
+            if progresso:
+                progresso(i, len(estados))
+        return caminhos
+
+    # Importado só aqui: evita carregar multiprocessing no import do módulo
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    with ProcessPoolExecutor(max_workers=processos, initializer=_inicializar_trabalhador,
+                             initargs=(grafo, posicoes, opcoes)) as executor:
+        futuros = [executor.submit(_renderizar_no_trabalhador, estado, caminho)
+                   for estado, caminho in zip(estados, caminhos)]
+        for concluidos, futuro in enumerate(as_completed(futuros), 1):
+            futuro.result()  # Propaga o erro da primeira imagem que falhar
+            if progresso:
+                progresso(concluidos, len(estados))
+
+    return caminhos
+
+
+# ============================================================================
+# LINHA DE COMANDO
+# ============================================================================
+
+def resolver_estado(grafo, estado: dict) -> dict:
+    """Troca nomes/IDs em texto (como vêm do JSON) pelos IDs dos vértices"""
+    from cli import resolver_vertice
+
+    resolvido = dict(estado)
+    if estado.get('destacar_arestas'):
+        resolvido['destacar_arestas'] = [(resolver_vertice(grafo, v1), resolver_vertice(grafo, v2))
+                                         for v1, v2 in estado['destacar_arestas']]
+    if estado.get('cores_vertices'):
+        resolvido['cores_vertices'] = {resolver_vertice(grafo, v): cor
+                                       for v, cor in estado['cores_vertices'].items()}
+    return resolvido
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Renderiza estados do grafo em PNG/SVG sem interface gráfica")
+    parser.add_argument('grafo', help="Arquivo (.csv, .gr, .tsp, .snap) ou grafo embutido (trabalho, parana)")
+    parser.add_argument('estados', help="Arquivo JSON Lines de estados ou '-' (stdin)")
+    parser.add_argument('--saida', default='.', help="Diretório das imagens")
+    parser.add_argument('--formato', choices=FORMATOS, default='png')
+    parser.add_argument('--processos', type=int, help="Processos trabalhadores (padrão: número de CPUs)")
+    parser.add_argument('--dpi', type=int, default=DPI_PADRAO)
+    parser.add_argument('--sem-pesos', dest='mostrar_pesos', action='store_false',
+                        help="Não desenhar os pesos das arestas")
+    args = parser.parse_args(argv)
+
+    from carregador import carregar_grafo
+    from cli import ler_tarefas
+
+    try:
+        grafo, _ = carregar_grafo(args.grafo)
+        if args.estados == '-':
+            estados = list(ler_tarefas(sys.stdin))
+        else:
+            with open(args.estados, encoding='utf-8') as entrada:
+                estados = list(ler_tarefas(entrada))
+        invalidos = [e for e in estados if 'invalida' in e]
+        if invalidos:
+            raise ValueError(f"JSON inválido na linha {invalidos[0]['linha']}: {invalidos[0]['invalida']}")
+        estados = [resolver_estado(grafo, estado) for estado in estados]
+    except (OSError, ValueError) as erro:
+        print(f"Erro: {erro}", file=sys.stderr)
+        return 2
+
+    def progresso(concluidos, total):
+        print(f"\r{concluidos}/{total}", end='', file=sys.stderr, flush=True)
+
+    inicio = time.perf_counter()
+    caminhos = renderizar_lote(grafo, estados, args.saida, args.formato, args.processos, progresso,
+                               dpi=args.dpi, mostrar_pesos=args.mostrar_pesos)
+    print(file=sys.stderr)
+    print(json.dumps({'imagens': caminhos, 'tempo_s': time.perf_counter() - inicio}, ensure_ascii=False))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
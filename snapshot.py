@@ -0,0 +1,371 @@
+"""
+Snapshot binário de grafos
+Formato versionado com tabela de vértices, coordenadas, adjacência CSR,
+pesos e nomes em um pool de strings. A leitura usa mmap e visões NumPy
+(ou memoryview, sem NumPy) sobre o arquivo, sem nenhuma interpretação
+de texto: o grafo abre em milissegundos e pode ser compartilhado entre
+processos, que mapeiam o mesmo arquivo somente para leitura.
+
+Layout (little-endian):
+    cabeçalho   '<8sIIQQI4x'  mágica, versão, flags, V, E, nº de seções
+    seções      '<8sQQ' × n   nome, deslocamento, tamanho em bytes
+    dados       cada seção alinhada em 64 bytes
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from ast import literal_eval
+
+from grafo import Grafo
+
+
+MAGICA = b'GRAFOSNP'
+VERSAO_FORMATO = 1
+ALINHAMENTO = 64
+
+FORMATO_CABECALHO = struct.Struct('<8sIIQQI4x')
+FORMATO_SECAO = struct.Struct('<8sQQ')
+
+# Flags do cabeçalho
+IDS_INTEIROS = 1  # IDs em 'ids' (int64); senão em pool de strings
+IDS_SEQUENCIAIS = 2  # IDs são exatamente 0..V-1 (índice = ID)
+PESOS_INTEIROS = 4  # Todos os pesos são inteiros
+
+# Seção -> typecode (array / memoryview.cast) e dtype NumPy
+TIPOS_SECOES = {
+    b'ids': ('q', '<i8'),  # IDs inteiros
+    b'idsoff': ('q', '<i8'),  # Pool dos IDs não inteiros (repr)
+    b'idsdado': ('B', 'u1'),
+    b'x': ('d', '<f8'),  # Coordenadas (NaN = ausente)
+    b'y': ('d', '<f8'),
+    b'indptr': ('q', '<i8'),  # CSR: vizinhos de i em indices[indptr[i]:indptr[i+1]]
+    b'indices': ('i', '<i4'),
+    b'pesos': ('d', '<f8'),  # Peso de cada entrada de indices
+    b'arestas': ('i', '<i4'),  # Pares (v1, v2) na ordem de inserção
+    b'pesosar': ('d', '<f8'),  # Peso de cada aresta
+    b'nomesoff': ('q', '<i8'),  # Pool de nomes
+    b'nomes': ('B', 'u1')
+}
+
+
+def _pool_strings(textos) -> tuple:
+    """Concatena as strings em UTF-8; retorna (deslocamentos, bytes)"""
+    deslocamentos = array('q', [0])
+    dados = bytearray()
+    for texto in textos:
+        dados += texto.encode('utf-8')
+        deslocamentos.append(len(dados))
+    return deslocamentos, bytes(dados)
+
+
+def salvar_snapshot(grafo, caminho: str) -> dict:
+    """
+    Grava o grafo (Grafo ou GrafoSnapshot) no formato binário.
+
+    Returns:
+        {'vertices', 'arestas', 'bytes'}
+    """
+    if sys.byteorder != 'little':
+        raise RuntimeError("Snapshots só podem ser gravados em máquinas little-endian")
+
+    vertices = grafo.obter_todos_vertices()
+    indice = {v: i for i, v in enumerate(vertices)}
+    arestas = grafo.obter_todas_arestas()
+
+    flags = 0
+    secoes = {}
+
+    if all(type(v) is int for v in vertices):
+        flags |= IDS_INTEIROS
+        secoes[b'ids'] = array('q', vertices)
+        if vertices == list(range(len(vertices))):
+            flags |= IDS_SEQUENCIAIS
+    else:
+        secoes[b'idsoff'], secoes[b'idsdado'] = _pool_strings(repr(v) for v in vertices)
+
+    nan = float('nan')
+    x = array('d')
+    y = array('d')
+    for v in vertices:
+        pos = grafo.obter_posicao_vertice(v)
+        x.append(nan if pos is None or pos[0] is None else pos[0])
+        y.append(nan if pos is None or pos[1] is None else pos[1])
+    secoes[b'x'] = x
+    secoes[b'y'] = y
+
+    indptr = array('q', [0])
+    indices = array('i')
+    pesos = array('d')
+    for v in vertices:
+        for vizinho, peso in grafo.obter_vizinhos(v):
+            indices.append(indice[vizinho])
+            pesos.append(peso)
+        indptr.append(len(indices))
+    secoes[b'indptr'] = indptr
+    secoes[b'indices'] = indices
+    secoes[b'pesos'] = pesos
+
+    pares = array('i')
+    pesos_arestas = array('d')
+    for v1, v2, peso in arestas:
+        pares.append(indice[v1])
+        pares.append(indice[v2])
+        pesos_arestas.append(peso)
+    secoes[b'arestas'] = pares
+    secoes[b'pesosar'] = pesos_arestas
+
+    if all(type(p) is int for _, _, p in arestas):
+        flags |= PESOS_INTEIROS
+
+    secoes[b'nomesoff'], secoes[b'nomes'] = _pool_strings(
+        grafo.obter_nome_vertice(v) for v in vertices
+    )
+
+    # Posicionar as seções após o cabeçalho e a tabela, alinhadas
+    deslocamento = FORMATO_CABECALHO.size + FORMATO_SECAO.size * len(secoes)
+    tabela = []
+    for nome, dados in secoes.items():
+        deslocamento = -(-deslocamento // ALINHAMENTO) * ALINHAMENTO
+        tamanho = len(dados) * (dados.itemsize if isinstance(dados, array) else 1)
+        tabela.append((nome, deslocamento, tamanho))
+        deslocamento += tamanho
+
+    with open(caminho, 'wb') as arquivo:
+        arquivo.write(FORMATO_CABECALHO.pack(MAGICA, VERSAO_FORMATO, flags,
+                                             len(vertices), len(arestas), len(secoes)))
+        for nome, inicio, tamanho in tabela:
+            arquivo.write(FORMATO_SECAO.pack(nome, inicio, tamanho))
+        for (nome, inicio, _), dados in zip(tabela, secoes.values()):
+            arquivo.write(b'\0' * (inicio - arquivo.tell()))
+            arquivo.write(dados if isinstance(dados, bytes) else dados.tobytes())
+
+    return {'vertices': len(vertices), 'arestas': len(arestas), 'bytes': deslocamento}
+
+
+def importar_numpy():
+    """Importa o NumPy sob demanda (None se não estiver instalado)"""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def abrir_snapshot(caminho: str) -> 'GrafoSnapshot':
+    """Abre um snapshot mapeando o arquivo em memória"""
+    return GrafoSnapshot(caminho)
+
+
+class GrafoSnapshot:
+    """
+    Grafo somente leitura sobre um snapshot mapeado em memória.
+
+    Oferece a mesma API de consulta do Grafo; os dados são lidos
+    diretamente do arquivo mapeado conforme são consultados.
+    """
+
+    versao = 0  # Imutável: caches por versão nunca são invalidados
+
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+        self._arquivo = open(caminho, 'rb')
+        self._mapa = mmap.mmap(self._arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magica, versao, flags, num_vertices, num_arestas, num_secoes = \
+            FORMATO_CABECALHO.unpack_from(self._mapa, 0)
+        if magica != MAGICA:
+            self.fechar()
+            raise ValueError(f"Arquivo não é um snapshot de grafo: {caminho}")
+        if versao != VERSAO_FORMATO:
+            self.fechar()
+            raise ValueError(f"Versão de snapshot não suportada: {versao}")
+
+        self.flags = flags
+        self.num_vertices = num_vertices
+        self.num_arestas = num_arestas
+
+        self.secoes = {}
+        for i in range(num_secoes):
+            nome, inicio, tamanho = FORMATO_SECAO.unpack_from(
+                self._mapa, FORMATO_CABECALHO.size + i * FORMATO_SECAO.size
+            )
+            self.secoes[nome.rstrip(b'\0')] = self._visao(nome.rstrip(b'\0'), inicio, tamanho)
+
+        # Materializados sob demanda
+        self._indice = None
+        self._lista_vertices = None
+        self._lista_arestas = None
+
+    def _visao(self, nome, inicio, tamanho):
+        """Visão (sem cópia) de uma seção do arquivo mapeado"""
+        tipo, dtype = TIPOS_SECOES[nome]
+        np = importar_numpy()
+        if np is not None:
+            return np.frombuffer(self._mapa, dtype=dtype,
+                                 count=tamanho // np.dtype(dtype).itemsize, offset=inicio)
+        if sys.byteorder != 'little':
+            raise RuntimeError("Leitura sem NumPy requer máquina little-endian")
+        return memoryview(self._mapa)[inicio:inicio + tamanho].cast(tipo)
+
+    # ------------------------------------------------------------------
+    # Conversões índice <-> ID
+    # ------------------------------------------------------------------
+
+    def _texto_do_pool(self, deslocamentos, dados, i) -> str:
+        return bytes(dados[deslocamentos[i]:deslocamentos[i + 1]]).decode('utf-8')
+
+    def _ids(self) -> list:
+        """IDs de todos os vértices, por índice (o pool é decodificado uma só vez)"""
+        if self._lista_vertices is None:
+            if self.flags & IDS_SEQUENCIAIS:
+                self._lista_vertices = list(range(self.num_vertices))
+            elif self.flags & IDS_INTEIROS:
+                self._lista_vertices = self.secoes[b'ids'].tolist()
+            else:
+                deslocamentos = self.secoes[b'idsoff']
+                dados = self.secoes[b'idsdado']
+                self._lista_vertices = [literal_eval(self._texto_do_pool(deslocamentos, dados, i))
+                                        for i in range(self.num_vertices)]
+        return self._lista_vertices
+
+    def id_do_indice(self, i):
+        """ID do vértice de índice i"""
+        if self.flags & IDS_SEQUENCIAIS:
+            return int(i)
+        return self._ids()[i]
+
+    def indice_do_id(self, id_vertice):
+        """Índice do vértice (None se não existir)"""
+        if self.flags & IDS_SEQUENCIAIS:
+            if type(id_vertice) is int and 0 <= id_vertice < self.num_vertices:
+                return id_vertice
+            return None
+        if self._indice is None:
+            self._indice = {v: i for i, v in enumerate(self.obter_todos_vertices())}
+        return self._indice.get(id_vertice)
+
+    def _peso(self, valor):
+        return int(valor) if self.flags & PESOS_INTEIROS else float(valor)
+
+    # ------------------------------------------------------------------
+    # API de consulta do Grafo
+    # ------------------------------------------------------------------
+
+    def obter_todos_vertices(self):
+        """Retorna lista de todos os vértices"""
+        return list(self._ids())
+
+    def obter_vizinhos(self, id_vertice):
+        """Retorna os vizinhos de um vértice como [(vizinho, peso)]"""
+        i = self.indice_do_id(id_vertice)
+        if i is None:
+            return []
+        indptr = self.secoes[b'indptr']
+        inicio, fim = int(indptr[i]), int(indptr[i + 1])
+        vizinhos = self.secoes[b'indices'][inicio:fim].tolist()
+        pesos = self.secoes[b'pesos'][inicio:fim].tolist()
+        if not self.flags & IDS_SEQUENCIAIS:
+            ids = self._ids()
+            vizinhos = [ids[w] for w in vizinhos]
+        if self.flags & PESOS_INTEIROS:
+            pesos = [int(p) for p in pesos]
+        return list(zip(vizinhos, pesos))
+
+    def obter_peso_aresta(self, v1, v2):
+        """Retorna o peso da aresta entre dois vértices"""
+        i = self.indice_do_id(v1)
+        j = self.indice_do_id(v2)
+        if i is None or j is None:
+            return None
+        indptr = self.secoes[b'indptr']
+        inicio, fim = int(indptr[i]), int(indptr[i + 1])
+        vizinhos = self.secoes[b'indices'][inicio:fim].tolist()
+        if j in vizinhos:
+            return self._peso(self.secoes[b'pesos'][inicio + vizinhos.index(j)])
+        return None
+
+    def obter_grau(self, id_vertice):
+        """Retorna o grau de um vértice"""
+        i = self.indice_do_id(id_vertice)
+        if i is None:
+            return 0
+        indptr = self.secoes[b'indptr']
+        return int(indptr[i + 1]) - int(indptr[i])
+
+    def obter_posicao_vertice(self, id_vertice):
+        """Retorna as coordenadas (x, y) de um vértice"""
+        i = self.indice_do_id(id_vertice)
+        if i is None:
+            return None
+        x = float(self.secoes[b'x'][i])
+        y = float(self.secoes[b'y'][i])
+        # NaN representa coordenada ausente
+        return (None if x != x else x, None if y != y else y)
+
+    def obter_nome_vertice(self, id_vertice):
+        """Retorna o nome de um vértice"""
+        i = self.indice_do_id(id_vertice)
+        if i is None:
+            return str(id_vertice)
+        return self._texto_do_pool(self.secoes[b'nomesoff'], self.secoes[b'nomes'], i)
+
+    def obter_todas_arestas(self):
+        """Retorna lista de todas as arestas"""
+        if self._lista_arestas is None:
+            pares = self.secoes[b'arestas'].tolist()
+            pesos = self.secoes[b'pesosar'].tolist()
+            if self.flags & PESOS_INTEIROS:
+                pesos = [int(p) for p in pesos]
+            if not self.flags & IDS_SEQUENCIAIS:
+                ids = self.obter_todos_vertices()
+                pares = [ids[i] for i in pares]
+            self._lista_arestas = list(zip(pares[0::2], pares[1::2], pesos))
+        return self._lista_arestas
+
+    def contar_vertices(self):
+        """Retorna o número de vértices"""
+        return self.num_vertices
+
+    def contar_arestas(self):
+        """Retorna o número de arestas"""
+        return self.num_arestas
+
+    # ------------------------------------------------------------------
+    # Conversão, ciclo de vida e serialização
+    # ------------------------------------------------------------------
+
+    def para_grafo(self, grafo: Grafo = None) -> Grafo:
+        """Copia o conteúdo do snapshot para um Grafo mutável (novo, se não informado)"""
+        grafo = grafo if grafo is not None else Grafo()
+        grafo.adicionar_vertices_em_lote(
+            (v, self.obter_nome_vertice(v), *self.obter_posicao_vertice(v))
+            for v in self.obter_todos_vertices()
+        )
+        grafo.adicionar_arestas_em_lote(self.obter_todas_arestas())
+        return grafo
+
+    def fechar(self):
+        """Libera o mapeamento (as visões obtidas antes deixam de ser válidas)"""
+        self.secoes = {}
+        try:
+            self._mapa.close()
+        except BufferError:
+            # Ainda há visões NumPy externas; o mapa é liberado com elas
+            pass
+        self._arquivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.fechar()
+
+    def __reduce__(self):
+        # Em processos trabalhadores o arquivo é mapeado de novo, sem copiar dados
+        return (abrir_snapshot, (self.caminho,))
+
+    def __str__(self):
+        return (f"Snapshot de grafo com {self.num_vertices} vértices e "
+                f"{self.num_arestas} arestas ({self.caminho})")
@@ -0,0 +1,172 @@
+"""
+Teste da verificação de planaridade
+Confere o veredito do teste Left-Right em grafos conhecidos e aleatórios e
+valida os certificados: V - E + F = 1 + C pelas faces do embedding (planar)
+e subdivisão de K5 ou K3,3 no subgrafo de Kuratowski (não-planar).
+"""
+
+from collections import Counter
+
+from grafo import Grafo
+from geradores import (gerar_erdos_renyi, gerar_grade, gerar_petersen_generalizado,
+                       gerar_triangulacao_planar)
+from planaridade import VerificadorPlanaridade
+
+
+def criar_grafo(arestas: list) -> Grafo:
+    """Grafo com os vértices e arestas (peso 1) da lista"""
+    grafo = Grafo()
+    for v1, v2 in arestas:
+        for v in (v1, v2):
+            if v not in grafo.vertices:
+                grafo.adicionar_vertice(v)
+        grafo.adicionar_aresta(v1, v2, 1)
+    return grafo
+
+
+def criar_k5() -> Grafo:
+    return criar_grafo([(i, j) for i in range(5) for j in range(i + 1, 5)])
+
+
+def criar_k33() -> Grafo:
+    return criar_grafo([(i, j) for i in range(3) for j in range(3, 6)])
+
+
+def criar_grade_com_k5() -> Grafo:
+    """Grade 8×8 com um K5 (IDs texto) pendurado por um caminho: vários blocos"""
+    grafo = gerar_grade(8, semente=1)
+    k5 = [(f"k{i}", f"k{j}") for i in range(5) for j in range(i + 1, 5)]
+    for v1, v2 in k5 + [(63, 'p'), ('p', 'k0')]:
+        for v in (v1, v2):
+            if v not in grafo.vertices:
+                grafo.adicionar_vertice(v)
+        grafo.adicionar_aresta(v1, v2, 1)
+    return grafo
+
+
+def criar_triangulacao_com_corda(n: int, semente: int) -> Grafo:
+    """Triangulação planar maximal com uma aresta a mais (sempre não-planar)"""
+    grafo = gerar_triangulacao_planar(n, semente=semente)
+    for v in range(n):
+        for w in range(v + 1, n):
+            if grafo.obter_peso_aresta(v, w) is None:
+                grafo.adicionar_aresta(v, w, 1)
+                return grafo
+    return grafo
+
+
+def verificar_euler(verificador: VerificadorPlanaridade) -> dict:
+    """V - E + F = 1 + C com F contado nas faces do embedding"""
+    euler = verificador.obter_caracteristica_euler()
+    assert euler['caracteristica_euler'] == 1 + euler['componentes'], \
+        f"V - E + F = {euler['caracteristica_euler']}, esperado {1 + euler['componentes']}"
+    return euler
+
+
+def verificar_subdivisao(grafo: Grafo, kuratowski: dict):
+    """
+    Confere que as arestas do certificado existem no grafo e formam uma
+    subdivisão de K5 ou K3,3: os vértices de ramificação têm grau 4 (K5) ou
+    3 (K3,3), os demais grau 2, e contrair os caminhos entre ramificações
+    dá exatamente o grafo completo (K5) ou bipartido completo (K3,3).
+    """
+    arestas = kuratowski['arestas']
+    assert len(set(map(frozenset, arestas))) == len(arestas), "Aresta repetida no certificado"
+    vizinhos = {}
+    for v1, v2 in arestas:
+        assert grafo.obter_peso_aresta(v1, v2) is not None, f"Aresta {v1}-{v2} não existe no grafo"
+        vizinhos.setdefault(v1, []).append(v2)
+        vizinhos.setdefault(v2, []).append(v1)
+
+    tipo = kuratowski['tipo']
+    grau_ramificacao, num_ramificacao = (4, 5) if tipo == 'K5' else (3, 6)
+    ramificacao = {v for v, lista in vizinhos.items() if len(lista) != 2}
+    assert ramificacao == set(kuratowski['vertices_ramificacao']), "Vértices de ramificação divergentes"
+    assert len(ramificacao) == num_ramificacao, f"{tipo} com {len(ramificacao)} ramificações"
+    assert all(len(vizinhos[v]) == grau_ramificacao for v in ramificacao), f"Grau errado em {tipo}"
+
+    # Contrair cada caminho de vértices de grau 2 entre duas ramificações
+    pares = Counter()
+    percorridas = 0
+    for origem in ramificacao:
+        for proximo in vizinhos[origem]:
+            anterior, atual = origem, proximo
+            percorridas += 1
+            while atual not in ramificacao:
+                a, b = vizinhos[atual]
+                anterior, atual = atual, (b if a == anterior else a)
+                percorridas += 1
+            assert atual != origem, "Caminho volta à mesma ramificação"
+            pares[frozenset((origem, atual))] += 1
+    assert percorridas == 2 * len(arestas), "Ciclo solto fora dos caminhos entre ramificações"
+    assert all(contagem == 2 for contagem in pares.values()), "Caminhos paralelos entre ramificações"
+
+    if tipo == 'K5':
+        assert len(pares) == 10, f"K5 contraído com {len(pares)} arestas"
+    else:
+        # Bipartição a partir de uma ramificação: os vizinhos contraídos formam o outro lado
+        inicio = next(iter(ramificacao))
+        lado_b = {w for par in pares if inicio in par for w in par if w != inicio}
+        lado_a = ramificacao - lado_b
+        assert len(lado_a) == len(lado_b) == 3, "K3,3 contraído sem lados de 3"
+        assert set(pares) == {frozenset((a, b)) for a in lado_a for b in lado_b}, "K3,3 incompleto"
+
+
+def verificar_grafo(descricao: str, grafo: Grafo, esperado: bool = None) -> bool:
+    """
+    Veredito (comparado ao esperado, se informado) e certificado; o
+    diagnóstico com pool de processos deve concordar com o serial.
+    """
+    verificador = VerificadorPlanaridade(grafo)
+    eh_planar, razao = verificador.verificar_planaridade()
+    if esperado is not None:
+        assert eh_planar == esperado, f"{descricao}: veredito {eh_planar}, esperado {esperado} ({razao})"
+
+    if eh_planar:
+        euler = verificar_euler(verificador)
+        certificado = f"V-E+F = {euler['caracteristica_euler']} (C = {euler['componentes']})"
+    else:
+        kuratowski = verificador.obter_subgrafo_kuratowski()
+        assert kuratowski is not None, f"{descricao}: não-planar sem subgrafo de Kuratowski"
+        verificar_subdivisao(grafo, kuratowski)
+        certificado = f"subdivisão de {kuratowski['tipo']} com {len(kuratowski['arestas'])} arestas"
+
+    paralelo = VerificadorPlanaridade(grafo).verificar_planaridade(processos=2)[0]
+    assert paralelo == eh_planar, f"{descricao}: veredito com processos=2 diverge do serial"
+
+    print(f"  {descricao:<36} {'planar' if eh_planar else 'não-planar':<11} {certificado}")
+    return eh_planar
+
+
+def main():
+    print("=" * 80)
+    print("TESTE DA VERIFICAÇÃO DE PLANARIDADE")
+    print("=" * 80)
+    print()
+
+    print("GRAFOS CONHECIDOS:")
+    verificar_grafo("K5", criar_k5(), False)
+    verificar_grafo("K3,3", criar_k33(), False)
+    verificar_grafo("Petersen GP(5, 2)", gerar_petersen_generalizado(5, 2), False)
+    verificar_grafo("Grade 12×12", gerar_grade(12, semente=0), True)
+    verificar_grafo("Triangulação planar (300)", gerar_triangulacao_planar(300, semente=0), True)
+    verificar_grafo("Triangulação + 1 aresta (300)", criar_triangulacao_com_corda(300, 0), False)
+    verificar_grafo("Grade 8×8 com K5 pendurado", criar_grade_com_k5(), False)
+    print()
+
+    print("GRAFOS ALEATÓRIOS (Erdős–Rényi, n = 40):")
+    vereditos = Counter()
+    for semente in range(12):
+        grau_medio = 2.0 + semente % 4 * 0.5
+        grafo = gerar_erdos_renyi(40, grau_medio=grau_medio, semente=semente)
+        vereditos[verificar_grafo(f"semente {semente}, grau médio {grau_medio}", grafo)] += 1
+    print()
+    assert vereditos[True] and vereditos[False], "Amostra aleatória sem os dois vereditos"
+
+    print("=" * 80)
+    print("TESTE CONCLUÍDO COM SUCESSO!")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
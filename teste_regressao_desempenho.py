@@ -0,0 +1,89 @@
+"""
+Teste do critério de regressão de desempenho
+Simula rodadas de benchmark com ruído comum de máquina (variação
+log-normal e picos ocasionais) e verifica que regressao_desempenho.comparar
+reprova uma piora real de 20% e não reprova medições sem mudança.
+"""
+
+import random
+
+from regressao_desempenho import comparar, LIMIAR_PADRAO, CONFIGURACAO_PADRAO
+
+
+RODADAS = CONFIGURACAO_PADRAO['rodadas']
+SIMULACOES = 100
+RUIDO = 0.05  # Desvio relativo típico entre rodadas
+PROBABILIDADE_PICO = 0.1  # Rodadas atrapalhadas por outro processo
+PICO = 1.3
+
+
+def simular_rodadas(gerador, valor: float) -> list:
+    """Tempos (ms) de RODADAS rodadas de um caso cujo tempo real é valor"""
+    amostras = []
+    for _ in range(RODADAS):
+        amostra = valor * gerador.lognormvariate(0, RUIDO)
+        if gerador.random() < PROBABILIDADE_PICO:
+            amostra *= PICO
+        amostras.append(amostra)
+    return amostras
+
+
+def resumir(algoritmo: str, amostras: list) -> dict:
+    return {'gerador': 'grade', 'n': 1000, 'algoritmo': algoritmo,
+            'mediana': sorted(amostras)[len(amostras) // 2],
+            'amostras': len(amostras), 'valores': amostras}
+
+
+def taxa_regressoes(piora: float, algoritmo: str = 'a_estrela') -> float:
+    """
+    Fração das simulações reprovadas quando o caso fica piora vezes mais
+    lento (para gerações/s, a métrica é dividida por piora).
+    """
+    gerador = random.Random(0)
+    reprovadas = 0
+    for _ in range(SIMULACOES):
+        base = simular_rodadas(gerador, 10.0)
+        atual = simular_rodadas(gerador, 10.0 * piora)
+        if algoritmo == 'ag':
+            base = [1000 / t for t in base]
+            atual = [1000 / t for t in atual]
+        linhas = comparar([resumir(algoritmo, base)], [resumir(algoritmo, atual)], LIMIAR_PADRAO)
+        reprovadas += linhas[0]['situacao'] == 'REGRESSÃO'
+    return reprovadas / SIMULACOES
+
+
+def main():
+    print("=" * 80)
+    print("TESTE DO CRITÉRIO DE REGRESSÃO DE DESEMPENHO")
+    print("=" * 80)
+    print()
+    print(f"Rodadas por caso: {RODADAS}  Ruído: {RUIDO:.0%}  "
+          f"Picos: {PROBABILIDADE_PICO:.0%} das rodadas (+{PICO - 1:.0%})")
+    print(f"Limiar: {LIMIAR_PADRAO:.0%}  Simulações: {SIMULACOES}")
+    print()
+
+    casos = [
+        ('Piora de 20% (tempo)', 1.20, 'a_estrela', lambda taxa: taxa >= 0.95),
+        ('Piora de 20% (gerações/s)', 1.20, 'ag', lambda taxa: taxa >= 0.95),
+        ('Sem mudança (tempo)', 1.00, 'a_estrela', lambda taxa: taxa <= 0.05),
+        ('Sem mudança (gerações/s)', 1.00, 'ag', lambda taxa: taxa <= 0.05),
+        ('Melhora de 20% (tempo)', 1 / 1.20, 'a_estrela', lambda taxa: taxa == 0),
+    ]
+
+    falhas = 0
+    for descricao, piora, algoritmo, esperado in casos:
+        taxa = taxa_regressoes(piora, algoritmo)
+        situacao = "OK" if esperado(taxa) else "FALHOU"
+        falhas += situacao != "OK"
+        print(f"  {descricao:<30} reprovadas: {taxa:6.1%}  {situacao}")
+
+    print()
+    assert falhas == 0, f"{falhas} caso(s) com taxa de reprovação inesperada"
+
+    print("=" * 80)
+    print("TESTE CONCLUÍDO COM SUCESSO!")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
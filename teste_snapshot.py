@@ -0,0 +1,140 @@
+"""
+Teste do snapshot binário de grafos
+Grava e reabre grafos com IDs texto, tuplas e inteiros (sequenciais ou
+não) e confere que o GrafoSnapshot responde às consultas exatamente como
+o Grafo original, inclusive depois de convertido de volta, regravado e
+reaberto pelo carregador.
+"""
+
+import os
+import pickle
+import tempfile
+
+from grafo import Grafo
+from carregador import carregar_arquivo, criar_grafo_parana
+from geradores import gerar_grade
+from snapshot import abrir_snapshot, salvar_snapshot
+
+
+def criar_grafo_ids_texto() -> Grafo:
+    """IDs texto (com acento, espaço e aspas), pesos fracionários e uma coordenada ausente"""
+    grafo = Grafo()
+    cidades = [("Curitiba", -25.43, -49.27), ("São José dos Pinhais", -25.53, -49.21),
+               ("Ponta Grossa", -25.09, -50.16), ("Vila \"Velha\"", None, None),
+               ("Guarapuava", -25.39, -51.46)]
+    for cidade, latitude, longitude in cidades:
+        grafo.adicionar_vertice(cidade, nome=cidade.upper(), x=latitude, y=longitude)
+    grafo.adicionar_aresta("Curitiba", "São José dos Pinhais", 15.5)
+    grafo.adicionar_aresta("Curitiba", "Ponta Grossa", 114.25)
+    grafo.adicionar_aresta("Ponta Grossa", "Vila \"Velha\"", 20.0)
+    grafo.adicionar_aresta("Ponta Grossa", "Guarapuava", 165.75)
+    grafo.adicionar_aresta("Guarapuava", "Curitiba", 258.5)
+    return grafo
+
+
+def criar_grafo_ids_tuplas() -> Grafo:
+    """IDs (linha, coluna) de uma grade 4×4 com pesos inteiros"""
+    grafo = Grafo()
+    for i in range(4):
+        for j in range(4):
+            grafo.adicionar_vertice((i, j), x=float(i), y=float(j))
+    for i in range(4):
+        for j in range(4):
+            if i < 3:
+                grafo.adicionar_aresta((i, j), (i + 1, j), 1 + i + j)
+            if j < 3:
+                grafo.adicionar_aresta((i, j), (i, j + 1), 2 + i * j)
+    return grafo
+
+
+def criar_grafo_ids_esparsos() -> Grafo:
+    """IDs inteiros não sequenciais (inclusive negativos)"""
+    grafo = Grafo()
+    ids = [1000, -7, 42, 3, 999999]
+    for id_vertice in ids:
+        grafo.adicionar_vertice(id_vertice)
+    for v1, v2 in zip(ids, ids[1:] + ids[:1]):
+        grafo.adicionar_aresta(v1, v2, abs(v1 - v2))
+    return grafo
+
+
+def comparar_grafos(descricao: str, original, copia):
+    """Confere que copia responde às consultas do Grafo como o original"""
+    vertices = original.obter_todos_vertices()
+    assert copia.obter_todos_vertices() == vertices, f"{descricao}: vértices divergentes"
+    assert copia.contar_vertices() == original.contar_vertices()
+    assert copia.contar_arestas() == original.contar_arestas()
+    assert list(copia.obter_todas_arestas()) == list(original.obter_todas_arestas()), \
+        f"{descricao}: arestas divergentes"
+
+    for v in vertices:
+        assert copia.obter_nome_vertice(v) == original.obter_nome_vertice(v), f"{descricao}: nome de {v!r}"
+        assert copia.obter_posicao_vertice(v) == original.obter_posicao_vertice(v), \
+            f"{descricao}: posição de {v!r}"
+        assert copia.obter_grau(v) == original.obter_grau(v), f"{descricao}: grau de {v!r}"
+        assert sorted(copia.obter_vizinhos(v), key=repr) == sorted(original.obter_vizinhos(v), key=repr), \
+            f"{descricao}: vizinhos de {v!r}"
+        for w, peso in original.obter_vizinhos(v):
+            assert copia.obter_peso_aresta(v, w) == peso, f"{descricao}: peso de {v!r}-{w!r}"
+
+    # Vértices inexistentes: mesmas respostas vazias do Grafo
+    ausente = "vértice inexistente"
+    assert copia.obter_vizinhos(ausente) == []
+    assert copia.obter_grau(ausente) == 0
+    assert copia.obter_posicao_vertice(ausente) is None
+
+
+def verificar_ida_e_volta(descricao: str, grafo: Grafo, diretorio: str):
+    """Grava, reabre e compara; depois regrava a partir do próprio snapshot"""
+    caminho = os.path.join(diretorio, "grafo.snap")
+    info = salvar_snapshot(grafo, caminho)
+    assert info['vertices'] == grafo.contar_vertices() and info['arestas'] == grafo.contar_arestas()
+
+    with abrir_snapshot(caminho) as snapshot:
+        comparar_grafos(f"{descricao} (snapshot)", grafo, snapshot)
+        comparar_grafos(f"{descricao} (para_grafo)", grafo, snapshot.para_grafo())
+
+        # Processos trabalhadores recebem o snapshot por pickle (mapeia de novo)
+        copia = pickle.loads(pickle.dumps(snapshot))
+        comparar_grafos(f"{descricao} (pickle)", grafo, copia)
+        copia.fechar()
+
+        regravado = os.path.join(diretorio, "regravado.snap")
+        salvar_snapshot(snapshot, regravado)
+
+    with abrir_snapshot(regravado) as snapshot:
+        comparar_grafos(f"{descricao} (regravado)", grafo, snapshot)
+
+    mutavel, estatisticas = carregar_arquivo(caminho, mutavel=True)
+    assert isinstance(mutavel, Grafo)
+    comparar_grafos(f"{descricao} (carregador)", grafo, mutavel)
+
+    print(f"  {descricao:<40} {grafo.contar_vertices():>4} vértices  "
+          f"{grafo.contar_arestas():>4} arestas  {info['bytes']:>6} bytes  OK")
+
+
+def main():
+    print("=" * 80)
+    print("TESTE DO SNAPSHOT BINÁRIO DE GRAFOS")
+    print("=" * 80)
+    print()
+
+    casos = [
+        ("IDs texto", criar_grafo_ids_texto()),
+        ("IDs tuplas", criar_grafo_ids_tuplas()),
+        ("IDs inteiros não sequenciais", criar_grafo_ids_esparsos()),
+        ("IDs sequenciais (grade 20×20)", gerar_grade(20, semente=0)),
+        ("Grafo do Paraná", criar_grafo_parana()),
+    ]
+    with tempfile.TemporaryDirectory() as diretorio:
+        for descricao, grafo in casos:
+            verificar_ida_e_volta(descricao, grafo, diretorio)
+    print()
+
+    print("=" * 80)
+    print("TESTE CONCLUÍDO COM SUCESSO!")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,74 @@
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import tkinter as tk
+import time
+from collections import ChainMap
+
+# Backends gráficos carregados sob demanda (ver carregar_backend)
+plt = None
+mpatches = None
+FigureCanvasTkAgg = None
+tk = None
+
+
+def carregar_backend():
+    """
+    Importa matplotlib e tkinter apenas quando um visualizador é criado,
+    para que os módulos de algoritmos não paguem esse custo de importação.
+    """
+    global plt, mpatches, FigureCanvasTkAgg, tk
+    if plt is None:
+        import matplotlib.pyplot as _plt
+        import matplotlib.patches as _mpatches
+        plt, mpatches = _plt, _mpatches
+    if FigureCanvasTkAgg is None:
+        try:
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg as _canvas
+            import tkinter as _tk
+            FigureCanvasTkAgg, tk = _canvas, _tk
+        except ImportError:
+            # Sem Tk (ex.: servidor): só o desenho em figura fica disponível
+            pass
+
+
+class IndiceEspacial:
+    """
+    Índice em grade para encontrar o vértice sob o cursor.
+    
+    Cada vértice fica na célula (x // lado, y // lado); uma busca com raio
+    ≤ lado só examina as 9 células em volta do ponto, em vez de todos os
+    vértices.
+    """
+    
+    def __init__(self, posicoes, lado):
+        self.lado = lado
+        self.celulas = {}
+        for v, (x, y) in posicoes.items():
+            self.celulas.setdefault(self.celula(x, y), []).append(v)
+    
+    def celula(self, x, y):
+        return int(x // self.lado), int(y // self.lado)
+    
+    def mover(self, v, origem, destino):
+        """Atualiza a célula de v após um arraste"""
+        antiga, nova = self.celula(*origem), self.celula(*destino)
+        if antiga == nova:
+            return
+        self.celulas[antiga].remove(v)
+        if not self.celulas[antiga]:
+            del self.celulas[antiga]
+        self.celulas.setdefault(nova, []).append(v)
+    
+    def mais_proximo(self, x, y, raio, posicoes):
+        """Vértice mais próximo de (x, y) a no máximo raio, ou None"""
+        cx, cy = self.celula(x, y)
+        melhor, dist_minima = None, raio * raio
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for v in self.celulas.get((cx + dx, cy + dy), ()):
+                    vx, vy = posicoes[v]
+                    dist = (x - vx) ** 2 + (y - vy) ** 2
+                    if dist < dist_minima:
+                        melhor, dist_minima = v, dist
+        return melhor
+
 
 class VisualizadorGrafo:
     """Classe para visualizar grafos usando matplotlib"""
@@ -20,7 +87,24 @@ class VisualizadorGrafo:
         '#C7CEEA',  # Lavanda
     ]
     
+    RAIO_SELECAO = 0.1  # Distância máxima do clique ao centro do vértice
+    QUADROS_POR_SEGUNDO_ARRASTE = 60
+    
+    # Acima deste número de arestas o modo automático usa coleções
+    LIMITE_ARESTAS_DETALHADO = 500
+    
+    # Acima deste, só os elementos da área visível (modo exploração)
+    LIMITE_ARESTAS_RAPIDO = 50_000
+    
+    # Com mais vértices à vista, o modo exploração desenha o grafo agregado
+    LIMITE_VERTICES_VISIVEIS = 5_000
+    
+    # Área aproximada de um rótulo em pixels: no modo rápido, os rótulos só
+    # são desenhados quando os visíveis cabem na área do eixo
+    AREA_ROTULO_PX = 70 * 18
+    
     def __init__(self, grafo):
+        carregar_backend()
         self.grafo = grafo
         self.arrastavel = False
         self.vertice_selecionado = None
@@ -29,34 +113,194 @@ class VisualizadorGrafo:
         self.textos_arestas = []  # Armazena textos dos pesos
         self.posicoes = {}  # Posições atuais dos vértices
         self.posicoes_personalizadas = None  # Posições personalizadas (do drag and drop)
+        self.incidentes = {}  # {vertice: [(linha, texto_peso ou None, v1, v2)]}
+        self.indice_espacial = None
+        self.artistas_arrastados = []  # Artistas redesenhados por blit durante o arraste
+        self.fundo_arraste = None
+        self.ultimo_quadro = 0.0
         
-    def desenhar_grafo(self, titulo="Grafo", destacar_arestas=None, cores_vertices=None, mostrar_pesos=True, tamanho_fig=(12, 8), arrastavel=False):
+        # Modo rápido (coleções)
+        self.modo_rapido = False
+        self.colecao_arestas = None
+        self.colecao_vertices = None
+        self.ordem_vertices = []  # Vértice de cada posição em colecao_vertices
+        self.indice_vertice = {}
+        self.arestas_desenhadas = []  # [(v1, v2, peso)] na ordem dos segmentos
+        self.segmentos = []
+        self.arestas_por_vertice = {}  # {vertice: [índices em arestas_desenhadas]}
+        self.rotulos_vertices = {}  # Rótulos visíveis: {vertice: Text}
+        self.rotulos_pesos = {}  # {índice da aresta: Text}
+        self.mostrar_pesos = True
+        
+        # Modo exploração (só a área visível, agregada com o zoom afastado)
+        self.modo_exploracao = False
+        self.indice_viewport = None
+        self.linha_arestas = None  # Line2D com todas as arestas visíveis (polilinha)
+        self.linha_destacadas = None
+        self.colecao_agregada = None
+        self.arestas_destacadas = None  # Máscara NumPy por índice de aresta
+        self.janela_consultada = None
+        self.nivel_exibido = None  # 0 = exato, k > 0 = agregado em células de lado·2^k
+        
+    def desenhar_grafo(self, titulo="Grafo", destacar_arestas=None, cores_vertices=None, mostrar_pesos=True, tamanho_fig=(12, 8), arrastavel=False, modo=None, offscreen=False):
         """
         Desenha o grafo
+        
+        Args:
+            offscreen: Criar a figura com matplotlib.figure.Figure e canvas
+                       Agg, fora do pyplot (sem janela e sem registro global
+                       de figuras; ver renderizador.py)
+            modo: 'detalhado' (um artista por aresta/vértice), 'rapido'
+                  (LineCollection/EllipseCollection com rótulos conforme o zoom),
+                  'exploracao' (coleções só com a área visível, agregadas com o
+                  zoom afastado; sem arraste) ou None para escolher pelo
+                  número de arestas
         """
-        # Usar subplots em vez de figure diretamente
-        fig, ax = plt.subplots(figsize=tamanho_fig, num=None)  # num=None força nova figura limpa
+        if offscreen:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+            fig = Figure(figsize=tamanho_fig)
+            FigureCanvasAgg(fig)
+            ax = fig.add_subplot()
+        else:
+            # Usar subplots em vez de figure diretamente
+            fig, ax = plt.subplots(figsize=tamanho_fig, num=None)  # num=None força nova figura limpa
         
         self.arrastavel = arrastavel
         self.artistas_vertices = {}
         self.linhas_arestas = []
         self.textos_arestas = []
+        self.incidentes = {}
         
-        # Posições dos vértices (baseadas nas coordenadas geográficas ou customizadas)
-        self.posicoes = {}
+        if modo is None:
+            num_arestas = self.grafo.contar_arestas()
+            if num_arestas > self.LIMITE_ARESTAS_RAPIDO:
+                modo = 'exploracao'
+            elif num_arestas > self.LIMITE_ARESTAS_DETALHADO:
+                modo = 'rapido'
+            else:
+                modo = 'detalhado'
+        self.modo_rapido = modo == 'rapido'
+        self.modo_exploracao = modo == 'exploracao'
+        if self.modo_exploracao:
+            arrastavel = False
+            self.arrastavel = False
         
+        # Posições dos vértices (customizadas/salvas ou geográficas). As
+        # posições base são compartilhadas, não copiadas: os arrastes vão
+        # para a primeira camada do ChainMap
         if self.posicoes_personalizadas:
-            # Usar posições customizadas do drag and drop
-            self.posicoes = {k: list(v) for k, v in self.posicoes_personalizadas.items()}
+            base = self.posicoes_personalizadas
+        else:
+            # Coordenadas geográficas originais (longitude no eixo x, norte em
+            # cima); vértices sem coordenadas recebem posições por forças
+            from layout import posicoes_do_grafo
+            base = posicoes_do_grafo(self.grafo)
+        self.posicoes = ChainMap({}, base)
+        
+        if self.modo_exploracao:
+            self.desenhar_exploracao(ax, destacar_arestas, cores_vertices, mostrar_pesos)
+        elif self.modo_rapido:
+            self.desenhar_colecoes(ax, destacar_arestas, cores_vertices, mostrar_pesos)
         else:
-            # Usar coordenadas geográficas originais
-            for id_vertice in self.grafo.obter_todos_vertices():
-                pos = self.grafo.obter_posicao_vertice(id_vertice)
-                if pos:
-                    # Inverter longitude para ajustar visualização (oeste é negativo)
-                    # E inverter latitude para que norte fique em cima
-                    self.posicoes[id_vertice] = [pos[1], pos[0]]  # Lista mutável para drag
+            self.desenhar_artistas(ax, destacar_arestas, cores_vertices, mostrar_pesos, arrastavel)
+        
+        # Configurações do gráfico
+        ax.set_aspect('equal')
+        ax.set_title(titulo, fontsize=16, fontweight='bold', pad=20)
+        ax.axis('off')
+        
+        # Adicionar legenda se houver coloração
+        self.desenhar_legenda(ax, cores_vertices)
+        
+        self.fig = fig
+        self.ax = ax
+        
+        # Adicionar eventos de drag and drop se solicitado
+        if arrastavel:
+            self.indice_espacial = IndiceEspacial(self.posicoes, self.RAIO_SELECAO)
+            fig.canvas.mpl_connect('button_press_event', self.ao_pressionar)
+            fig.canvas.mpl_connect('button_release_event', self.ao_soltar)
+            fig.canvas.mpl_connect('motion_notify_event', self.ao_mover)
+            
+            # Adicionar instrução
+            ax.text(0.02, 0.98, 'Arraste os vértices para reposicionar', 
+                   transform=ax.transAxes, fontsize=10, verticalalignment='top',
+                   bbox=dict(boxstyle='round', facecolor='yellow', alpha=0.5))
         
+        fig.tight_layout()
+        
+        if self.modo_rapido:
+            # Rótulos recalculados a cada zoom/deslocamento
+            ax.callbacks.connect('xlim_changed', self.atualizar_rotulos)
+            ax.callbacks.connect('ylim_changed', self.atualizar_rotulos)
+            self.atualizar_rotulos()
+        elif self.modo_exploracao:
+            # Coleções refeitas com a área visível a cada zoom/deslocamento
+            ax.callbacks.connect('xlim_changed', self.atualizar_janela_visivel)
+            ax.callbacks.connect('ylim_changed', self.atualizar_janela_visivel)
+            self.atualizar_janela_visivel()
+        return fig
+    
+    def desenhar_legenda(self, ax, cores_vertices):
+        """Legenda com uma entrada por cor usada (remove a anterior)"""
+        if ax.get_legend() is not None:
+            ax.get_legend().remove()
+        if cores_vertices:
+            num_cores = max(cores_vertices.values()) + 1
+            elementos_legenda = []
+            for i in range(num_cores):
+                cor = self.PALETA_CORES[i % len(self.PALETA_CORES)]
+                elementos_legenda.append(mpatches.Patch(color=cor, label=f'Cor {i}'))
+            ax.legend(handles=elementos_legenda, loc='upper right', fontsize=10)
+    
+    def aplicar_estado(self, titulo=None, destacar_arestas=None, cores_vertices=None):
+        """
+        Troca o título, as arestas destacadas e as cores dos vértices de uma
+        figura já desenhada, só mudando o estilo dos artistas existentes.
+        Usado para renderizar várias rotas/colorações do mesmo grafo sem
+        recriar a figura (ver renderizador.py).
+        """
+        destacadas = set()
+        for v1, v2 in destacar_arestas or ():
+            destacadas.add((v1, v2))
+            destacadas.add((v2, v1))
+        
+        if titulo is not None:
+            self.ax.set_title(titulo, fontsize=16, fontweight='bold', pad=20)
+        
+        if self.modo_exploracao:
+            import numpy as np
+            from matplotlib.colors import to_rgba_array
+            paleta = to_rgba_array(self.PALETA_CORES + ['#3498db'])
+            self.cores_colecao = paleta[[cores_vertices[v] % len(self.PALETA_CORES)
+                                         if cores_vertices and v in cores_vertices
+                                         else len(self.PALETA_CORES) for v in self.ordem_vertices]]
+            self.arestas_destacadas = np.array([(v1, v2) in destacadas for v1, v2, _ in self.arestas_desenhadas],
+                                               dtype=bool)
+            self.janela_consultada = None
+            self.atualizar_janela_visivel()
+        elif self.modo_rapido:
+            esta_destacada = [(v1, v2) in destacadas for v1, v2, _ in self.arestas_desenhadas]
+            self.colecao_arestas.set_colors([(1.0, 0.0, 0.0, 0.8) if d else (0.5, 0.5, 0.5, 0.6)
+                                             for d in esta_destacada])
+            self.colecao_arestas.set_linewidths([4 if d else 1.5 for d in esta_destacada])
+            self.cores_colecao = [self.cor_vertice(v, cores_vertices) for v in self.ordem_vertices]
+            self.colecao_vertices.set_facecolors(self.cores_colecao)
+        else:
+            for linha, v1, v2 in self.linhas_arestas:
+                if (v1, v2) in destacadas:
+                    linha.set(color='r', linewidth=4, alpha=0.8)
+                else:
+                    linha.set(color='gray', linewidth=1.5, alpha=0.6)
+            for id_vertice, artista in self.artistas_vertices.items():
+                artista['cor'] = self.cor_vertice(id_vertice, cores_vertices)
+                artista['circulo'].set_facecolor(artista['cor'])
+        
+        self.desenhar_legenda(self.ax, cores_vertices)
+    
+    def desenhar_artistas(self, ax, destacar_arestas, cores_vertices, mostrar_pesos, arrastavel):
+        """Modo detalhado: uma linha por aresta, um círculo e um texto por vértice"""
         # Desenhar arestas
         for v1, v2, peso in self.grafo.obter_todas_arestas():
             if v1 in self.posicoes and v2 in self.posicoes:
@@ -76,22 +320,24 @@ class VisualizadorGrafo:
                 self.linhas_arestas.append((linha, v1, v2))
                 
                 # Adicionar peso da aresta
+                texto = None
                 if mostrar_pesos:
                     meio_x, meio_y = (x1 + x2) / 2, (y1 + y2) / 2
                     texto = ax.text(meio_x, meio_y, str(peso), 
                            bbox=dict(boxstyle='round,pad=0.3', facecolor='white', edgecolor='gray', alpha=0.8),
                            ha='center', va='center', fontsize=8, zorder=2)
                     self.textos_arestas.append((texto, v1, v2, peso))
+                
+                # Índice por vértice: o arraste só toca nas arestas incidentes
+                incidencia = (linha, texto, v1, v2)
+                self.incidentes.setdefault(v1, []).append(incidencia)
+                if v2 != v1:
+                    self.incidentes.setdefault(v2, []).append(incidencia)
         
         # Desenhar vértices
         for id_vertice, pos in self.posicoes.items():
             x, y = pos
-            # Determinar cor do vértice
-            if cores_vertices and id_vertice in cores_vertices:
-                indice_cor = cores_vertices[id_vertice] % len(self.PALETA_CORES)
-                cor = self.PALETA_CORES[indice_cor]
-            else:
-                cor = '#3498db'  # Azul padrão
+            cor = self.cor_vertice(id_vertice, cores_vertices)
             
             # Desenhar círculo do vértice
             circulo = plt.Circle((x, y), 0.08, color=cor, ec='black', 
@@ -106,91 +352,397 @@ class VisualizadorGrafo:
                            edgecolor='none', alpha=0.7))
             
             self.artistas_vertices[id_vertice] = {'circulo': circulo, 'texto': texto, 'cor': cor}
+    
+    def cor_vertice(self, id_vertice, cores_vertices):
+        if cores_vertices and id_vertice in cores_vertices:
+            return self.PALETA_CORES[cores_vertices[id_vertice] % len(self.PALETA_CORES)]
+        return '#3498db'  # Azul padrão
+    
+    def desenhar_colecoes(self, ax, destacar_arestas, cores_vertices, mostrar_pesos):
+        """
+        Modo rápido: todas as arestas em uma LineCollection e todos os
+        vértices em uma EllipseCollection (mesmo raio, cores e contorno do
+        modo detalhado). Os rótulos ficam a cargo de atualizar_rotulos.
+        """
+        from matplotlib.collections import EllipseCollection, LineCollection
         
-        # Configurações do gráfico
-        ax.set_aspect('equal')
-        ax.set_title(titulo, fontsize=16, fontweight='bold', pad=20)
-        ax.axis('off')
+        destacadas = set()
+        for v1, v2 in destacar_arestas or ():
+            destacadas.add((v1, v2))
+            destacadas.add((v2, v1))
         
-        # Adicionar legenda se houver coloração
+        self.mostrar_pesos = mostrar_pesos
+        self.rotulos_vertices = {}
+        self.rotulos_pesos = {}
+        self.arestas_desenhadas = []
+        self.segmentos = []
+        self.arestas_por_vertice = {}
+        cores_arestas = []
+        larguras = []
+        
+        for v1, v2, peso in self.grafo.obter_todas_arestas():
+            if v1 not in self.posicoes or v2 not in self.posicoes:
+                continue
+            indice = len(self.arestas_desenhadas)
+            self.arestas_desenhadas.append((v1, v2, peso))
+            self.segmentos.append([tuple(self.posicoes[v1]), tuple(self.posicoes[v2])])
+            self.arestas_por_vertice.setdefault(v1, []).append(indice)
+            if v2 != v1:
+                self.arestas_por_vertice.setdefault(v2, []).append(indice)
+            
+            if (v1, v2) in destacadas:
+                cores_arestas.append((1.0, 0.0, 0.0, 0.8))
+                larguras.append(4)
+            else:
+                cores_arestas.append((0.5, 0.5, 0.5, 0.6))
+                larguras.append(1.5)
+        
+        self.colecao_arestas = LineCollection(self.segmentos, colors=cores_arestas,
+                                              linewidths=larguras, zorder=1)
+        ax.add_collection(self.colecao_arestas)
+        
+        self.ordem_vertices = list(self.posicoes)
+        self.indice_vertice = {v: i for i, v in enumerate(self.ordem_vertices)}
+        self.cores_colecao = [self.cor_vertice(v, cores_vertices) for v in self.ordem_vertices]
+        n = len(self.ordem_vertices)
+        self.colecao_vertices = EllipseCollection(
+            [0.16] * n, [0.16] * n, [0] * n, units='xy',
+            offsets=[self.posicoes[v] for v in self.ordem_vertices], offset_transform=ax.transData,
+            facecolors=self.cores_colecao, edgecolors='black', linewidths=2, zorder=3
+        )
+        ax.add_collection(self.colecao_vertices)
+        
+        # Coleções não entram no autoscale como os patches: limites explícitos
+        if self.posicoes:
+            xs = [x for x, _ in self.posicoes.values()]
+            ys = [y for _, y in self.posicoes.values()]
+            margem = 0.3
+            ax.set_xlim(min(xs) - margem, max(xs) + margem)
+            ax.set_ylim(min(ys) - margem, max(ys) + margem)
+    
+    def desenhar_exploracao(self, ax, destacar_arestas, cores_vertices, mostrar_pesos):
+        """
+        Modo exploração: monta o índice espacial (nivel_detalhe.IndiceViewport)
+        e artistas vazios; atualizar_janela_visivel os preenche só com o que
+        está à vista. As arestas são duas polilinhas (normais e destacadas).
+        """
+        import numpy as np
+        from matplotlib.collections import EllipseCollection
+        from matplotlib.colors import to_rgba_array
+        from nivel_detalhe import IndiceViewport
+        
+        destacadas = set()
+        for v1, v2 in destacar_arestas or ():
+            destacadas.add((v1, v2))
+            destacadas.add((v2, v1))
+        
+        self.mostrar_pesos = mostrar_pesos
+        self.rotulos_vertices = {}
+        self.rotulos_pesos = {}
+        self.ordem_vertices = list(self.posicoes)
+        self.indice_vertice = {v: i for i, v in enumerate(self.ordem_vertices)}
+        self.arestas_desenhadas = [(v1, v2, peso) for v1, v2, peso in self.grafo.obter_todas_arestas()
+                                   if v1 in self.posicoes and v2 in self.posicoes]
+        
+        # Cor de cada vértice como índice na paleta (o último é o azul padrão)
+        paleta = to_rgba_array(self.PALETA_CORES + ['#3498db'])
         if cores_vertices:
-            num_cores = max(cores_vertices.values()) + 1
-            elementos_legenda = []
-            for i in range(num_cores):
-                cor = self.PALETA_CORES[i % len(self.PALETA_CORES)]
-                elementos_legenda.append(mpatches.Patch(color=cor, label=f'Cor {i}'))
-            ax.legend(handles=elementos_legenda, loc='upper right', fontsize=10)
+            indices_cores = [cores_vertices[v] % len(self.PALETA_CORES) if v in cores_vertices
+                             else len(self.PALETA_CORES) for v in self.ordem_vertices]
+        else:
+            indices_cores = np.full(len(self.ordem_vertices), len(self.PALETA_CORES))
+        self.cores_colecao = paleta[indices_cores]
+        self.arestas_destacadas = np.array([(v1, v2) in destacadas for v1, v2, _ in self.arestas_desenhadas],
+                                           dtype=bool)
         
-        # Adicionar eventos de drag and drop se solicitado
-        if arrastavel:
-            self.fig = fig
-            self.ax = ax
-            fig.canvas.mpl_connect('button_press_event', self.ao_pressionar)
-            fig.canvas.mpl_connect('button_release_event', self.ao_soltar)
-            fig.canvas.mpl_connect('motion_notify_event', self.ao_mover)
+        self.indice_viewport = IndiceViewport(
+            [self.posicoes[v][0] for v in self.ordem_vertices],
+            [self.posicoes[v][1] for v in self.ordem_vertices],
+            [self.indice_vertice[v1] for v1, _, _ in self.arestas_desenhadas],
+            [self.indice_vertice[v2] for _, v2, _ in self.arestas_desenhadas]
+        )
+        
+        self.colecao_arestas = None
+        self.linha_arestas, = ax.plot([], [], color='gray', linewidth=1.5, alpha=0.6, zorder=1)
+        self.linha_destacadas, = ax.plot([], [], 'r-', linewidth=4, alpha=0.8, zorder=1)
+        self.colecao_vertices = EllipseCollection(
+            0.16, 0.16, 0, units='xy', offsets=np.empty((0, 2)), offset_transform=ax.transData,
+            edgecolors='black', linewidths=2, zorder=3
+        )
+        ax.add_collection(self.colecao_vertices)
+        # Células agregadas: marcadores em pixels, que não crescem com o zoom
+        self.colecao_agregada = ax.scatter([], [], color='#3498db', edgecolors='none', zorder=3)
+        
+        self.janela_consultada = None
+        self.nivel_exibido = None
+        if self.posicoes:
+            indice, margem = self.indice_viewport, 0.3
+            ax.set_xlim(indice.xs.min() - margem, indice.xs.max() + margem)
+            ax.set_ylim(indice.ys.min() - margem, indice.ys.max() + margem)
+    
+    def atualizar_janela_visivel(self, eixo=None):
+        """
+        Modo exploração: consulta o índice com os limites atuais do eixo e
+        troca o conteúdo das coleções. Com até LIMITE_VERTICES_VISIVEIS
+        vértices à vista, desenha os vértices e arestas exatos (com cores,
+        destaques e rótulos que couberem); acima disso, o nível agregado.
+        
+        Arestas com as duas extremidades fora da área visível não entram.
+        """
+        if not self.modo_exploracao:
+            return
+        import numpy as np
+        from nivel_detalhe import polilinha
+        
+        ax = self.ax
+        x0, x1 = sorted(ax.get_xlim())
+        y0, y1 = sorted(ax.get_ylim())
+        # xlim_changed e ylim_changed chegam juntos em cada zoom
+        if (x0, x1, y0, y1) == self.janela_consultada:
+            return
+        self.janela_consultada = (x0, x1, y0, y1)
+        
+        indice = self.indice_viewport
+        consulta = indice.consultar(x0, x1, y0, y1, self.LIMITE_VERTICES_VISIVEIS)
+        self.nivel_exibido = consulta['nivel']
+        vertices_rotulados, arestas_rotuladas = [], []
+        
+        if consulta['nivel'] == 0:
+            vertices, arestas = consulta['vertices'], consulta['arestas']
+            self.colecao_vertices.set_offsets(np.column_stack([indice.xs[vertices], indice.ys[vertices]]))
+            self.colecao_vertices.set_facecolors(self.cores_colecao[vertices])
             
-            # Adicionar instrução
-            ax.text(0.02, 0.98, 'Arraste os vértices para reposicionar', 
-                   transform=ax.transAxes, fontsize=10, verticalalignment='top',
-                   bbox=dict(boxstyle='round', facecolor='yellow', alpha=0.5))
+            destacadas = self.arestas_destacadas[arestas]
+            for linha, selecao in ((self.linha_arestas, arestas[~destacadas]),
+                                   (self.linha_destacadas, arestas[destacadas])):
+                linha.set_data(*polilinha(indice.xs, indice.ys, indice.origens[selecao],
+                                          indice.destinos[selecao]))
+            self.linha_arestas.set_linewidth(1.5)
+            self.colecao_agregada.set_offsets(np.empty((0, 2)))
+            
+            capacidade = max(1, int(ax.bbox.width * ax.bbox.height / self.AREA_ROTULO_PX))
+            if len(vertices) <= capacidade:
+                vertices_rotulados = [self.ordem_vertices[i] for i in vertices]
+                if self.mostrar_pesos:
+                    meio_x = (indice.xs[indice.origens[arestas]] + indice.xs[indice.destinos[arestas]]) / 2
+                    meio_y = (indice.ys[indice.origens[arestas]] + indice.ys[indice.destinos[arestas]]) / 2
+                    no_eixo = (meio_x >= x0) & (meio_x <= x1) & (meio_y >= y0) & (meio_y <= y1)
+                    arestas_rotuladas = arestas[no_eixo].tolist()
+                    if len(vertices) + len(arestas_rotuladas) > capacidade:
+                        arestas_rotuladas = []
+        else:
+            self.colecao_vertices.set_offsets(np.empty((0, 2)))
+            self.linha_arestas.set_data(consulta['arestas_x'], consulta['arestas_y'])
+            self.linha_arestas.set_linewidth(0.8)
+            self.linha_destacadas.set_data([], [])
+            self.colecao_agregada.set_offsets(np.column_stack([consulta['xs'], consulta['ys']]))
+            # Área do marcador cresce com o log do número de vértices da célula
+            self.colecao_agregada.set_sizes(4 + 4 * np.log2(consulta['contagens']))
         
-        plt.tight_layout()
-        return fig
+        self.sincronizar_rotulos(self.rotulos_vertices, vertices_rotulados, self.criar_rotulo_vertice)
+        self.sincronizar_rotulos(self.rotulos_pesos, arestas_rotuladas, self.criar_rotulo_peso)
+    
+    def atualizar_rotulos(self, eixo=None):
+        """
+        Modo rápido: desenha os nomes dos vértices visíveis (e os pesos das
+        arestas visíveis) só quando eles cabem no eixo; com o grafo inteiro
+        à vista e muitos vértices, nenhum rótulo é desenhado.
+        """
+        if not self.modo_rapido:
+            return
+        ax = self.ax
+        x0, x1 = sorted(ax.get_xlim())
+        y0, y1 = sorted(ax.get_ylim())
+        capacidade = max(1, int(ax.bbox.width * ax.bbox.height / self.AREA_ROTULO_PX))
+        
+        def visivel(x, y):
+            return x0 <= x <= x1 and y0 <= y <= y1
+        
+        vertices = [v for v, (x, y) in self.posicoes.items() if visivel(x, y)]
+        if len(vertices) > capacidade:
+            vertices = []
+        
+        arestas = []
+        if self.mostrar_pesos and vertices:
+            for i, (v1, v2, _) in enumerate(self.arestas_desenhadas):
+                (xa, ya), (xb, yb) = self.posicoes[v1], self.posicoes[v2]
+                if visivel((xa + xb) / 2, (ya + yb) / 2):
+                    arestas.append(i)
+            if len(vertices) + len(arestas) > capacidade:
+                arestas = []
+        
+        self.sincronizar_rotulos(self.rotulos_vertices, vertices, self.criar_rotulo_vertice)
+        self.sincronizar_rotulos(self.rotulos_pesos, arestas, self.criar_rotulo_peso)
+    
+    def sincronizar_rotulos(self, rotulos, chaves, criar):
+        """Remove os rótulos que saíram de vista e cria os que entraram"""
+        desejados = set(chaves)
+        for chave in [c for c in rotulos if c not in desejados]:
+            rotulos.pop(chave).remove()
+        for chave in chaves:
+            if chave not in rotulos:
+                rotulos[chave] = criar(chave)
+    
+    def criar_rotulo_vertice(self, id_vertice):
+        x, y = self.posicoes[id_vertice]
+        return self.ax.text(x, y - 0.15, self.grafo.obter_nome_vertice(id_vertice), ha='center', va='top',
+                            fontsize=9, fontweight='bold', zorder=4,
+                            bbox=dict(boxstyle='round,pad=0.3', facecolor='white',
+                                      edgecolor='none', alpha=0.7))
+    
+    def criar_rotulo_peso(self, indice):
+        v1, v2, peso = self.arestas_desenhadas[indice]
+        (x1, y1), (x2, y2) = self.posicoes[v1], self.posicoes[v2]
+        return self.ax.text((x1 + x2) / 2, (y1 + y2) / 2, str(peso),
+                            bbox=dict(boxstyle='round,pad=0.3', facecolor='white', edgecolor='gray', alpha=0.8),
+                            ha='center', va='center', fontsize=8, zorder=2)
     
     def ao_pressionar(self, evento):
         """Callback quando o mouse é pressionado"""
         if evento.inaxes != self.ax:
             return
         
-        # Encontrar vértice mais próximo
-        dist_minima = float('inf')
-        vertice_mais_proximo = None
-        
-        for id_vertice, pos in self.posicoes.items():
-            x, y = pos
-            dist = ((evento.xdata - x)**2 + (evento.ydata - y)**2)**0.5
-            if dist < 0.1 and dist < dist_minima:  # Raio de seleção
-                dist_minima = dist
-                vertice_mais_proximo = id_vertice
-        
-        self.vertice_selecionado = vertice_mais_proximo
+        # Vértice mais próximo dentro do raio de seleção (busca no índice em grade)
+        self.vertice_selecionado = self.indice_espacial.mais_proximo(
+            evento.xdata, evento.ydata, self.RAIO_SELECAO, self.posicoes
+        )
+        if self.vertice_selecionado is not None:
+            self.iniciar_arraste(self.vertice_selecionado)
     
     def ao_soltar(self, evento):
         """Callback quando o mouse é solto"""
+        if self.vertice_selecionado is not None:
+            self.finalizar_arraste()
         self.vertice_selecionado = None
     
+    def iniciar_arraste(self, id_vertice):
+        """
+        Marca como animados o vértice, seu nome e as arestas incidentes e
+        guarda o resto da figura como fundo, que é reaproveitado em cada
+        quadro do arraste.
+        """
+        if self.modo_rapido:
+            self.destacar_da_colecao(id_vertice)
+        
+        artista = self.artistas_vertices[id_vertice]
+        self.artistas_arrastados = [artista['circulo'], artista['texto']]
+        for linha, texto, _, _ in self.incidentes.get(id_vertice, ()):
+            self.artistas_arrastados.append(linha)
+            if texto is not None:
+                self.artistas_arrastados.append(texto)
+        
+        canvas = self.fig.canvas
+        if not getattr(canvas, 'supports_blit', False):
+            self.fundo_arraste = None
+            return
+        
+        for a in self.artistas_arrastados:
+            a.set_animated(True)
+        canvas.draw()
+        self.fundo_arraste = canvas.copy_from_bbox(self.fig.bbox)
+        self.desenhar_arrastados()
+    
+    def desenhar_arrastados(self):
+        """Repõe o fundo e desenha só os artistas em movimento"""
+        canvas = self.fig.canvas
+        canvas.restore_region(self.fundo_arraste)
+        for a in self.artistas_arrastados:
+            self.ax.draw_artist(a)
+        canvas.blit(self.fig.bbox)
+    
+    def finalizar_arraste(self):
+        """Devolve os artistas ao desenho normal e redesenha a figura uma vez"""
+        for a in self.artistas_arrastados:
+            a.set_animated(False)
+        self.artistas_arrastados = []
+        self.fundo_arraste = None
+        if self.modo_rapido:
+            self.devolver_a_colecao(self.vertice_selecionado)
+        self.fig.canvas.draw_idle()
+    
+    def destacar_da_colecao(self, id_vertice):
+        """
+        Modo rápido: esconde o vértice e suas arestas nas coleções e cria
+        artistas individuais temporários para eles, que o arraste move.
+        """
+        i = self.indice_vertice[id_vertice]
+        offsets = self.colecao_vertices.get_offsets()
+        offsets[i] = (float('nan'), float('nan'))
+        self.colecao_vertices.set_offsets(offsets)
+        
+        circulo = plt.Circle(tuple(self.posicoes[id_vertice]), 0.08, color=self.cores_colecao[i],
+                             ec='black', linewidth=2, zorder=3)
+        self.ax.add_patch(circulo)
+        if id_vertice not in self.rotulos_vertices:
+            self.rotulos_vertices[id_vertice] = self.criar_rotulo_vertice(id_vertice)
+        self.artistas_vertices[id_vertice] = {'circulo': circulo, 'texto': self.rotulos_vertices[id_vertice],
+                                              'cor': self.cores_colecao[i]}
+        
+        cores = self.colecao_arestas.get_colors()
+        larguras = self.colecao_arestas.get_linewidths()
+        incidentes = []
+        for indice in self.arestas_por_vertice.get(id_vertice, ()):
+            v1, v2, _ = self.arestas_desenhadas[indice]
+            (x1, y1), (x2, y2) = self.posicoes[v1], self.posicoes[v2]
+            linha, = self.ax.plot([x1, x2], [y1, y2], color=cores[indice % len(cores)],
+                                  linewidth=larguras[indice % len(larguras)], zorder=1)
+            incidentes.append((linha, self.rotulos_pesos.get(indice), v1, v2))
+            self.segmentos[indice] = [(float('nan'), float('nan'))] * 2
+        self.colecao_arestas.set_segments(self.segmentos)
+        self.incidentes[id_vertice] = incidentes
+    
+    def devolver_a_colecao(self, id_vertice):
+        """Modo rápido: grava a nova posição nas coleções e remove os temporários"""
+        i = self.indice_vertice[id_vertice]
+        offsets = self.colecao_vertices.get_offsets()
+        offsets[i] = self.posicoes[id_vertice]
+        self.colecao_vertices.set_offsets(offsets)
+        
+        for indice in self.arestas_por_vertice.get(id_vertice, ()):
+            v1, v2, _ = self.arestas_desenhadas[indice]
+            self.segmentos[indice] = [tuple(self.posicoes[v1]), tuple(self.posicoes[v2])]
+        self.colecao_arestas.set_segments(self.segmentos)
+        
+        self.artistas_vertices.pop(id_vertice)['circulo'].remove()
+        for linha, _, _, _ in self.incidentes.pop(id_vertice):
+            linha.remove()
+        self.atualizar_rotulos()
+    
     def ao_mover(self, evento):
         """Callback quando o mouse é movido"""
         if self.vertice_selecionado is None or evento.inaxes != self.ax:
             return
         
         # Atualizar posição do vértice
-        self.posicoes[self.vertice_selecionado] = [evento.xdata, evento.ydata]
+        id_vertice = self.vertice_selecionado
+        self.indice_espacial.mover(id_vertice, self.posicoes[id_vertice], (evento.xdata, evento.ydata))
+        self.posicoes[id_vertice] = [evento.xdata, evento.ydata]
         
         # Atualizar círculo e texto do vértice
-        id_vertice = self.vertice_selecionado
         artista = self.artistas_vertices[id_vertice]
         
         artista['circulo'].center = (evento.xdata, evento.ydata)
         artista['texto'].set_position((evento.xdata, evento.ydata - 0.15))
         
-        # Atualizar arestas conectadas
-        for linha, v1, v2 in self.linhas_arestas:
-            if v1 == id_vertice or v2 == id_vertice:
-                x1, y1 = self.posicoes[v1]
-                x2, y2 = self.posicoes[v2]
-                linha.set_data([x1, x2], [y1, y2])
+        # Atualizar só as arestas incidentes (e seus pesos)
+        for linha, texto, v1, v2 in self.incidentes.get(id_vertice, ()):
+            x1, y1 = self.posicoes[v1]
+            x2, y2 = self.posicoes[v2]
+            linha.set_data([x1, x2], [y1, y2])
+            if texto is not None:
+                texto.set_position(((x1 + x2) / 2, (y1 + y2) / 2))
         
-        # Atualizar textos dos pesos
-        for texto, v1, v2, peso in self.textos_arestas:
-            if v1 == id_vertice or v2 == id_vertice:
-                x1, y1 = self.posicoes[v1]
-                x2, y2 = self.posicoes[v2]
-                meio_x, meio_y = (x1 + x2) / 2, (y1 + y2) / 2
-                texto.set_position((meio_x, meio_y))
+        # Redesenhar no máximo QUADROS_POR_SEGUNDO_ARRASTE vezes por segundo
+        # (a posição final é desenhada ao soltar)
+        agora = time.perf_counter()
+        if agora - self.ultimo_quadro < 1.0 / self.QUADROS_POR_SEGUNDO_ARRASTE:
+            return
+        self.ultimo_quadro = agora
         
-        # Redesenhar
-        self.fig.canvas.draw_idle()
+        if self.fundo_arraste is not None:
+            self.desenhar_arrastados()
+        else:
+            self.fig.canvas.draw_idle()
     
     def desenhar_em_janela(self, janela, titulo="Grafo", arrastavel=True, **kwargs):
         """
@@ -221,3 +773,287 @@ class VisualizadorGrafo:
                     plt.close(self.fig)
             except:
                 pass
+
+
+class GraficoEvolucao:
+    """
+    Gráfico persistente da evolução do AG (melhor custo e custo médio).
+    
+    A figura e as linhas são criadas uma única vez; cada geração só
+    acrescenta um ponto aos dados das Line2D. O redesenho usa blitting
+    (fundo em cache + linhas animadas) e é limitado a quadros_por_segundo.
+    Um redesenho completo só acontece quando os eixos precisam crescer,
+    e o eixo x dobra de tamanho a cada vez, então isso é raro.
+    """
+    
+    QUADROS_POR_SEGUNDO = 20
+    
+    def __init__(self, master=None, tamanho_fig=(11, 4), quadros_por_segundo=None):
+        """
+        Args:
+            master: Widget Tk onde o gráfico é embutido (None = canvas Agg, sem janela)
+        """
+        carregar_backend()
+        # Figure direto (sem pyplot): a figura não fica registrada no gerenciador
+        from matplotlib.figure import Figure
+        
+        self.figura = Figure(figsize=tamanho_fig)
+        self.eixo = self.figura.add_subplot()
+        self.intervalo_quadro = 1.0 / (quadros_por_segundo or self.QUADROS_POR_SEGUNDO)
+        
+        self.geracoes = []
+        self.melhores = []
+        self.medios = []
+        self.menor = None  # Extremos dos dados, mantidos a cada ponto
+        self.maior = None
+        
+        self.linha_melhor, = self.eixo.plot([], [], 'b-', linewidth=2, label='Melhor Custo', animated=True)
+        self.linha_medio, = self.eixo.plot([], [], 'r--', linewidth=1.5, label='Custo Médio', animated=True)
+        
+        self.eixo.set_xlabel('Geração', fontsize=10)
+        self.eixo.set_ylabel('Custo', fontsize=10)
+        self.eixo.set_title('Evolução do Algoritmo Genético', fontsize=12, fontweight='bold')
+        self.eixo.legend(loc='upper right')
+        self.eixo.grid(True, alpha=0.3)
+        self.eixo.set_xlim(0, 10)
+        
+        if master is not None and FigureCanvasTkAgg is not None:
+            self.canvas = FigureCanvasTkAgg(self.figura, master=master)
+        else:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            self.canvas = FigureCanvasAgg(self.figura)
+        
+        self.fundo = None  # Região do eixo sem as linhas (para o blit)
+        self.pendente = False  # Há pontos ainda não desenhados
+        self.ultimo_quadro = 0.0
+        self.redesenhos_completos = 0
+        self.canvas.mpl_connect('draw_event', self.ao_desenhar)
+    
+    def obter_widget(self):
+        """Widget Tk do gráfico (só quando criado com master)"""
+        return self.canvas.get_tk_widget()
+    
+    def adicionar(self, melhor_custo, custo_medio):
+        """Acrescenta o ponto de uma geração (não redesenha)"""
+        self.geracoes.append(len(self.geracoes))
+        self.melhores.append(melhor_custo)
+        self.medios.append(custo_medio)
+        menor, maior = min(melhor_custo, custo_medio), max(melhor_custo, custo_medio)
+        self.menor = menor if self.menor is None else min(self.menor, menor)
+        self.maior = maior if self.maior is None else max(self.maior, maior)
+        self.pendente = True
+    
+    def limpar(self):
+        self.geracoes.clear()
+        self.melhores.clear()
+        self.medios.clear()
+        self.menor = self.maior = None
+        self.eixo.set_xlim(0, 10)
+        self.pendente = True
+    
+    def ao_desenhar(self, evento):
+        """Após um redesenho completo (ou redimensionamento), guarda o fundo e repõe as linhas"""
+        self.fundo = self.canvas.copy_from_bbox(self.eixo.bbox)
+        self.desenhar_linhas()
+    
+    def desenhar_linhas(self):
+        self.eixo.draw_artist(self.linha_melhor)
+        self.eixo.draw_artist(self.linha_medio)
+        self.canvas.blit(self.eixo.bbox)
+    
+    def ajustar_limites(self) -> bool:
+        """Expande os eixos para caber os dados; retorna True se mudaram"""
+        if not self.geracoes:
+            return False
+        
+        mudou = False
+        x_max = self.eixo.get_xlim()[1]
+        if self.geracoes[-1] > x_max:
+            while self.geracoes[-1] > x_max:
+                x_max *= 2
+            self.eixo.set_xlim(0, x_max)
+            mudou = True
+        
+        y_min, y_max = self.eixo.get_ylim()
+        if self.fundo is None or self.menor < y_min or self.maior > y_max:
+            margem = max((self.maior - self.menor) * 0.1, 1)
+            self.eixo.set_ylim(self.menor - margem, self.maior + margem)
+            mudou = True
+        
+        return mudou
+    
+    def atualizar(self, forcar=False) -> bool:
+        """
+        Desenha os pontos pendentes, respeitando a taxa de quadros.
+        
+        Args:
+            forcar: Ignorar o limite de quadros (ex.: no fim da execução)
+        
+        Returns:
+            True se o gráfico foi redesenhado
+        """
+        if not self.pendente:
+            return False
+        agora = time.perf_counter()
+        if not forcar and agora - self.ultimo_quadro < self.intervalo_quadro:
+            return False
+        
+        self.ultimo_quadro = agora
+        self.pendente = False
+        self.linha_melhor.set_data(self.geracoes, self.melhores)
+        self.linha_medio.set_data(self.geracoes, self.medios)
+        
+        if self.ajustar_limites() or self.fundo is None:
+            # Eixos mudaram: redesenho completo (ao_desenhar refaz o fundo e as linhas)
+            self.redesenhos_completos += 1
+            self.canvas.draw()
+        else:
+            self.canvas.restore_region(self.fundo)
+            self.desenhar_linhas()
+        return True
+
+
+class AnimacaoBusca:
+    """
+    Reprodução de uma busca A* gravada (a_estrela.RegistroBusca) sobre um
+    grafo já desenhado por um VisualizadorGrafo.
+    
+    Vértices expandidos, fronteira (na fila e ainda não expandidos), arestas
+    relaxadas no último quadro e vértice atual são quatro Line2D animadas.
+    Cada quadro aplica os eventos desde o anterior com operações NumPy sobre
+    os arrays do registro e redesenha só essas linhas por blitting. Como os
+    expandidos nunca saem do conjunto, os novos de cada quadro são pintados
+    sobre o fundo em cache (que é copiado de novo), então o custo do quadro
+    não cresce com a busca. A figura inteira só é redesenhada quando o
+    canvas pede (zoom, redimensionamento) ou ao voltar no tempo.
+    """
+    
+    # Arestas relaxadas desenhadas por quadro (as últimas do intervalo)
+    MAX_ARESTAS_QUADRO = 5_000
+    
+    def __init__(self, visualizador, registro):
+        import numpy as np
+        from a_estrela import EXPANDIR
+        
+        self.fig = visualizador.fig
+        self.eixo = visualizador.ax
+        self.canvas = self.fig.canvas
+        
+        posicoes = visualizador.posicoes
+        self.xs = np.array([posicoes[v][0] for v in registro.vertices], dtype=np.float64)
+        self.ys = np.array([posicoes[v][1] for v in registro.vertices], dtype=np.float64)
+        
+        # Visões sobre os arrays do registro (sem cópia)
+        self.tipos = np.frombuffer(registro.tipos, dtype=np.int8)
+        self.indices = np.frombuffer(registro.indices, dtype=np.int64)
+        self.origens = np.frombuffer(registro.origens, dtype=np.int64)
+        self.total = len(registro)
+        
+        # Expandidos nunca saem do conjunto: cada quadro mostra um prefixo desta ordem
+        self.eventos_expansao = np.flatnonzero(self.tipos == EXPANDIR)
+        ordem = self.indices[self.eventos_expansao]
+        self.expandidos_x = self.xs[ordem]
+        self.expandidos_y = self.ys[ordem]
+        
+        self.na_fronteira = np.zeros(len(self.xs), dtype=bool)
+        self.evento = 0  # Eventos já aplicados
+        self.expandidos = 0
+        
+        estilo = dict(linestyle='none', animated=True, zorder=5)
+        self.linha_expandidos, = self.eixo.plot([], [], marker='o', markersize=7, color='#f39c12',
+                                                alpha=0.7, **estilo)
+        self.linha_fronteira, = self.eixo.plot([], [], marker='o', markersize=7, color='#2ecc71',
+                                               alpha=0.8, **estilo)
+        self.linha_relaxadas, = self.eixo.plot([], [], color='#8e44ad', linewidth=2, alpha=0.8,
+                                               animated=True, zorder=5)
+        self.linha_atual, = self.eixo.plot([], [], marker='o', markersize=14, markerfacecolor='none',
+                                           markeredgecolor='black', markeredgewidth=2.5, **estilo)
+        self.artistas = [self.linha_relaxadas, self.linha_expandidos, self.linha_fronteira, self.linha_atual]
+        
+        self.fundo = None  # Região do eixo com os expandidos já pintados (para o blit)
+        self.expandidos_no_fundo = 0
+        self.conexao = self.canvas.mpl_connect('draw_event', self.ao_desenhar)
+    
+    @property
+    def concluida(self) -> bool:
+        return self.evento >= self.total
+    
+    def ao_desenhar(self, evento):
+        """Após um redesenho completo, refaz o fundo e repõe as linhas animadas"""
+        self.fundo = self.canvas.copy_from_bbox(self.eixo.bbox)
+        self.expandidos_no_fundo = 0
+        self.desenhar()
+    
+    def pintar_expandidos(self):
+        """Pinta no fundo os expandidos que ainda não estão nele"""
+        inicio, fim = self.expandidos_no_fundo, self.expandidos
+        if fim == inicio:
+            return
+        self.linha_expandidos.set_data(self.expandidos_x[inicio:fim], self.expandidos_y[inicio:fim])
+        self.eixo.draw_artist(self.linha_expandidos)
+        self.fundo = self.canvas.copy_from_bbox(self.eixo.bbox)
+        self.expandidos_no_fundo = fim
+    
+    def ir_para(self, evento: int):
+        """
+        Mostra o estado da busca após os primeiros `evento` eventos.
+        
+        Avançar só aplica os eventos novos; voltar recomeça do início.
+        """
+        import numpy as np
+        from a_estrela import INSERIR, EXPANDIR, RELAXAR
+        from nivel_detalhe import polilinha
+        
+        evento = max(0, min(evento, self.total))
+        if evento < self.evento:
+            self.na_fronteira[:] = False
+            self.evento = 0
+            self.fundo = None  # Os expandidos pintados no fundo não valem mais
+        
+        inicio = self.evento
+        tipos = self.tipos[inicio:evento]
+        indices = self.indices[inicio:evento]
+        # Um vértice expandido não volta à fila: inserir antes de remover vale para o intervalo todo
+        self.na_fronteira[indices[tipos == INSERIR]] = True
+        self.na_fronteira[indices[tipos == EXPANDIR]] = False
+        
+        relaxadas = np.flatnonzero(tipos == RELAXAR)[-self.MAX_ARESTAS_QUADRO:]
+        arestas_x, arestas_y = polilinha(self.xs, self.ys, self.origens[inicio:evento][relaxadas],
+                                         indices[relaxadas])
+        self.linha_relaxadas.set_data(arestas_x, arestas_y)
+        
+        self.evento = evento
+        self.expandidos = int(np.searchsorted(self.eventos_expansao, evento))
+        k = self.expandidos
+        self.linha_fronteira.set_data(self.xs[self.na_fronteira], self.ys[self.na_fronteira])
+        self.linha_atual.set_data(self.expandidos_x[k - 1:k], self.expandidos_y[k - 1:k])
+        self.desenhar()
+    
+    def avancar(self, eventos: int):
+        """Aplica os próximos eventos (um quadro da animação)"""
+        self.ir_para(self.evento + eventos)
+    
+    def desenhar(self):
+        if self.fundo is None:
+            # Redesenho completo: ao_desenhar refaz o fundo e chama desenhar de novo
+            self.canvas.draw()
+            return
+        self.canvas.restore_region(self.fundo)
+        self.pintar_expandidos()
+        for artista in (self.linha_relaxadas, self.linha_fronteira, self.linha_atual):
+            self.eixo.draw_artist(artista)
+        self.canvas.blit(self.eixo.bbox)
+    
+    def estatisticas(self) -> dict:
+        return {
+            'evento': self.evento,
+            'total': self.total,
+            'expandidos': self.expandidos,
+            'fronteira': int(self.na_fronteira.sum())
+        }
+    
+    def desconectar(self):
+        """Remove as linhas animadas e o callback do canvas"""
+        self.canvas.mpl_disconnect(self.conexao)
+        for artista in self.artistas:
+            artista.remove()
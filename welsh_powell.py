@@ -1,17 +1,59 @@
 from grafo import Grafo
+from artefatos import obter_ou_calcular
+import instrumentacao
 
 class WelshPowell:
     """Implementação do algoritmo Welsh-Powell para coloração de grafos"""
     
-    def __init__(self, grafo):
+    def __init__(self, grafo, usar_cache=True, progresso=None):
         self.grafo = grafo
+        self.usar_cache = usar_cache  # Consultar o cache de artefatos em disco
+        # Chamada com (coloridos, total) a cada cor; uma exceção nela interrompe a coloração
+        self.progresso = progresso
         self.cores = {}  # {vertice: cor}
         self.passos = []  # Lista de passos para visualização
         
+        # Registro compacto dos passos: deltas (vértice, cor) na ordem em que
+        # foram coloridos e, para cada passo, o tamanho do log ao seu final
+        self.deltas_vertices = []
+        self.deltas_cores = []
+        self.checkpoints = []  # checkpoints[i] = len(deltas) ao final do passo i
+        
     def color_graph(self, registrar_passos=False):
         """
         Aplica o algoritmo Welsh-Powell para colorir o grafo
         
+        Com o cache ativo, a coloração (e o registro de passos) de um grafo
+        já colorido é lida do cache de artefatos em vez de recalculada.
+        """
+        if not self.usar_cache:
+            return self.calcular_coloracao(registrar_passos)
+        
+        def calcular():
+            self.calcular_coloracao(registrar_passos)
+            return {
+                'cores': self.cores,
+                'passos': self.passos if registrar_passos else [],
+                'deltas_vertices': self.deltas_vertices,
+                'deltas_cores': self.deltas_cores,
+                'checkpoints': self.checkpoints
+            }
+        
+        resultado = obter_ou_calcular(self.grafo, 'welsh_powell.coloracao',
+                                      {'registrar_passos': registrar_passos}, calcular)
+        self.cores = resultado['cores']
+        if registrar_passos:
+            self.passos = resultado['passos']
+        self.deltas_vertices = resultado['deltas_vertices']
+        self.deltas_cores = resultado['deltas_cores']
+        self.checkpoints = resultado['checkpoints']
+        return self.cores
+    
+    @instrumentacao.medir_fase('welsh_powell.calcular_coloracao')
+    def calcular_coloracao(self, registrar_passos=False):
+        """
+        Executa o Welsh-Powell propriamente dito
+        
         1. Ordenar vértices em ordem decrescente de grau
         2. Usar cor 1 para o primeiro vértice e todos os não-adjacentes a ele
         3. Usar cor 2 para o próximo sem cor e todos os não-adjacentes com cor 2
@@ -26,6 +68,10 @@ class WelshPowell:
             reverse=True
         )
         
+        self.deltas_vertices = []
+        self.deltas_cores = []
+        self.checkpoints = []
+        
         if registrar_passos:
             self.passos = []
             graus = {v: self.grafo.obter_grau(v) for v in vertices_ordenados}
@@ -33,16 +79,21 @@ class WelshPowell:
                 'tipo': 'ordenacao',
                 'descricao': 'Passo 1: Ordenar vértices por grau (decrescente)',
                 'vertices_ordenados': vertices_ordenados,
-                'graus': graus,
-                'cores_atuais': {}
+                'graus': graus
             })
+            self.checkpoints.append(0)
         
         self.cores = {}
         cor_atual = 0
         passo_contador = 2
+        verificacoes = 0  # Testes de adjacência (instrumentação)
+        instrumentar = instrumentacao.ativa
         
         # Continuar até todos os vértices terem cor
         while len(self.cores) < len(vertices_ordenados):
+            if self.progresso is not None:
+                self.progresso(len(self.cores), len(vertices_ordenados))
+            
             # Encontrar primeiro vértice sem cor
             vertice_base = None
             for v in vertices_ordenados:
@@ -77,30 +128,43 @@ class WelshPowell:
                     vizinhos_v.add(viz)
                 
                 # Verificar se v é adjacente a algum vértice com cor_atual
-                for vertice_colorido in vertices_coloridos_neste_passo:
+                testes = len(vertices_coloridos_neste_passo)
+                for posicao, vertice_colorido in enumerate(vertices_coloridos_neste_passo):
                     if vertice_colorido in vizinhos_v:
                         pode_colorir = False
+                        testes = posicao + 1
                         break
                 
+                # Testes de adjacência contados por vértice, fora do laço acima
+                if instrumentar:
+                    verificacoes += testes
                 if pode_colorir:
                     self.cores[v] = cor_atual
                     vertices_coloridos_neste_passo.append(v)
             
             if registrar_passos:
+                # Registrar apenas o delta do passo (sem cópia do dicionário de cores)
+                self.deltas_vertices.extend(vertices_coloridos_neste_passo)
+                self.deltas_cores.extend([cor_atual] * len(vertices_coloridos_neste_passo))
+                self.checkpoints.append(len(self.deltas_vertices))
+                
                 nomes_coloridos = [self.grafo.obter_nome_vertice(v) for v in vertices_coloridos_neste_passo]
                 self.passos.append({
                     'tipo': 'coloracao_grupo',
                     'descricao': f'Passo {passo_contador}: Associar cor {cor_atual} aos vértices não-adjacentes',
                     'cor_atual': cor_atual,
                     'vertices_coloridos': vertices_coloridos_neste_passo,
-                    'nomes_vertices': nomes_coloridos,
-                    'cores_atuais': self.cores.copy()
+                    'nomes_vertices': nomes_coloridos
                 })
                 passo_contador += 1
             
             # Próxima cor
             cor_atual += 1
         
+        if instrumentar:
+            instrumentacao.contar('welsh_powell.coloracoes')
+            instrumentacao.contar('welsh_powell.verificacoes_adjacencia', verificacoes)
+        
         return self.cores
     
     def obter_passos(self):
@@ -109,6 +173,31 @@ class WelshPowell:
         """
         return self.passos
     
+    def obter_cores_no_passo(self, indice_passo):
+        """
+        Reconstrói as cores atribuídas até o final do passo indicado.
+        
+        O checkpoint do passo indica quantos deltas (vértice, cor) do log
+        já tinham sido aplicados, então o acesso a qualquer passo é direto,
+        sem depender dos passos anteriores.
+        """
+        if not self.checkpoints:
+            return {}
+        
+        fim = self.checkpoints[indice_passo]
+        return dict(zip(self.deltas_vertices[:fim], self.deltas_cores[:fim]))
+    
+    def obter_delta_passo(self, indice_passo):
+        """
+        Retorna a lista de (vértice, cor) aplicada no passo indicado
+        """
+        if not self.checkpoints:
+            return []
+        
+        inicio = self.checkpoints[indice_passo - 1] if indice_passo > 0 else 0
+        fim = self.checkpoints[indice_passo]
+        return list(zip(self.deltas_vertices[inicio:fim], self.deltas_cores[inicio:fim]))
+    
     def get_chromatic_number(self):
         """
         Retorna o número cromático (número de cores usadas)